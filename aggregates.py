@@ -0,0 +1,409 @@
+"""
+Agregados parciales combinables para análisis por bloques (streaming)
+Proyecto: Bank Marketing EDA
+"""
+
+import functools
+import os
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, List, Tuple
+import data_loader
+from contingency import normalize_table
+from correlation import GramStatistics
+from partitions import PARTITION_MIN_ROWS, map_partitions, partition_ranges
+from sketches import HyperLogLog, KLLSketch, DEFAULT_QUANTILE_ERROR, DEFAULT_DISTINCT_ERROR
+
+
+class PartialAggregates:
+    """
+    Acumula estadísticas de un dataset bloque a bloque sin mantener las filas
+
+    Cada bloque aporta conteos, momentos (media y suma de cuadrados centrada),
+    mínimos/máximos, nulos, conteos de valores, tablas cruzadas, sketches
+    de cuantiles y valores distintos y productos cruzados para la
+    correlación. Dos objetos se pueden combinar con merge(), por lo que el
+    resultado no depende de cómo se partió el archivo.
+    """
+
+    def __init__(self, target: str = 'y', crosstab_pairs: List[Tuple[str, str]] = None,
+                 preview_rows: int = 20, sketches: bool = True,
+                 quantile_error: float = DEFAULT_QUANTILE_ERROR,
+                 distinct_error: float = DEFAULT_DISTINCT_ERROR):
+        """
+        Inicializa los agregados vacíos
+
+        Args:
+            target: Variable objetivo para tasas y medias por grupo
+            crosstab_pairs: Pares de columnas categóricas a tabular
+                (None = cada variable categórica contra la variable objetivo)
+            preview_rows: Número de filas a conservar como vista previa
+            sketches: Si True, acumula sketches de cuartiles y valores distintos
+            quantile_error: Error de rango de los sketches de cuantiles
+            distinct_error: Error relativo de los sketches de valores distintos
+        """
+        self.target = target
+        self.crosstab_pairs = crosstab_pairs
+        self.preview_rows = preview_rows
+        self.sketches = sketches
+        self.quantile_error = quantile_error
+        self.distinct_error = distinct_error
+
+        self.n_rows = 0
+        self.columns = []
+        self.dtypes = {}
+        self.numeric_cols = []
+        self.categorical_cols = []
+        self.null_counts = {}
+        # Momentos por columna numérica: (conteo, media, suma de cuadrados centrada)
+        self.moments = {}
+        self.minimum = {}
+        self.maximum = {}
+        self.value_counts = {}
+        self.crosstabs = {}
+        # Sumas y conteos de cada variable numérica por valor de la variable objetivo
+        self.target_sums = {}
+        self.target_counts = {}
+        self.quantile_sketches = {}
+        self.distinct_sketches = {}
+        # Conteos, sumas y productos cruzados de las columnas numéricas (correlación)
+        self.gram = None
+        self.preview = None
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, n_workers: int = 1, **kwargs) -> 'PartialAggregates':
+        """
+        Construye los agregados a partir de un DataFrame completo
+
+        Con n_workers > 1 las filas se reparten en rangos que se resumen en
+        procesos separados y luego se combinan con merge().
+
+        Args:
+            df: DataFrame a resumir
+            n_workers: Procesos para resumir rangos de filas
+            **kwargs: Parámetros de inicialización
+
+        Returns:
+            Agregados del DataFrame
+        """
+        n_parts = min(n_workers, len(df) // PARTITION_MIN_ROWS)
+        if n_parts <= 1:
+            aggregates = cls(**kwargs)
+            aggregates.update(df)
+            return aggregates
+        partitions = (df.iloc[start:stop] for start, stop in partition_ranges(len(df), n_parts))
+        return cls._merge_all(map_partitions(functools.partial(_aggregate_frame, kwargs=kwargs),
+                                             partitions, n_workers), kwargs)
+
+    @classmethod
+    def from_csv(cls, source, chunksize: int = data_loader.DEFAULT_CHUNKSIZE, n_workers: int = 1,
+                 **kwargs) -> 'PartialAggregates':
+        """
+        Construye los agregados de un CSV leído por bloques
+
+        Si source es una ruta y n_workers > 1, el archivo se divide en rangos
+        de bytes y cada proceso lee y resume su rango; los parciales se
+        combinan en orden. En otro caso se lee de forma secuencial.
+
+        Args:
+            source: Ruta u objeto tipo archivo
+            chunksize: Filas por bloque
+            n_workers: Procesos que leen y resumen rangos del archivo
+            **kwargs: Parámetros de inicialización
+
+        Returns:
+            Agregados de todo el archivo
+        """
+        if n_workers <= 1 or not isinstance(source, (str, os.PathLike)):
+            return cls.from_chunks(data_loader.iter_csv_chunks(source, chunksize=chunksize), **kwargs)
+        header, ranges = data_loader.csv_byte_ranges(source, n_workers)
+        worker = functools.partial(_aggregate_csv_range, path=source, header=header,
+                                   chunksize=chunksize, kwargs=kwargs)
+        return cls._merge_all(map_partitions(worker, ranges, n_workers), kwargs)
+
+    @classmethod
+    def _merge_all(cls, parts: Iterable['PartialAggregates'], kwargs: Dict) -> 'PartialAggregates':
+        """
+        Combina en orden los agregados de varias particiones
+        """
+        aggregates = cls(**kwargs)
+        for part in parts:
+            aggregates.merge(part)
+        return aggregates
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[pd.DataFrame], **kwargs) -> 'PartialAggregates':
+        """
+        Construye los agregados consumiendo bloques de forma secuencial
+
+        Args:
+            chunks: Iterable de DataFrames (por ejemplo, pd.read_csv con chunksize)
+            **kwargs: Parámetros de inicialización
+
+        Returns:
+            Agregados de todos los bloques
+        """
+        aggregates = cls(**kwargs)
+        for chunk in chunks:
+            aggregates.update(chunk)
+        return aggregates
+
+    def _init_schema(self, chunk: pd.DataFrame):
+        """
+        Registra columnas, tipos y clasificación a partir del primer bloque
+        """
+        self.columns = chunk.columns.tolist()
+        self.dtypes = chunk.dtypes.to_dict()
+        self.numeric_cols = chunk.select_dtypes(include=[np.number]).columns.tolist()
+        self.categorical_cols = chunk.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
+        self.null_counts = {column: 0 for column in self.columns}
+        if self.crosstab_pairs is None:
+            self.crosstab_pairs = [(column, self.target) for column in self.categorical_cols
+                                   if column != self.target]
+            if self.target not in self.categorical_cols:
+                self.crosstab_pairs = []
+
+    def update(self, chunk: pd.DataFrame):
+        """
+        Incorpora un bloque de filas a los agregados
+
+        Args:
+            chunk: DataFrame con las mismas columnas que los bloques anteriores
+        """
+        if not self.columns:
+            self._init_schema(chunk)
+        self.merge(self._summarize(chunk))
+
+    def _summarize(self, chunk: pd.DataFrame) -> 'PartialAggregates':
+        """
+        Calcula los agregados de un único bloque
+        """
+        part = PartialAggregates(self.target, self.crosstab_pairs, self.preview_rows,
+                                 self.sketches, self.quantile_error, self.distinct_error)
+        part.columns = self.columns
+        part.numeric_cols = self.numeric_cols
+        part.categorical_cols = self.categorical_cols
+        part.n_rows = len(chunk)
+        part.dtypes = chunk.dtypes.to_dict()
+        part.null_counts = chunk.isnull().sum().to_dict()
+        part.preview = chunk.head(self.preview_rows)
+
+        has_target = self.target in chunk.columns
+        for column in self.numeric_cols:
+            values = pd.to_numeric(chunk[column], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            valid = values[~np.isnan(values)]
+            count = len(valid)
+            if count == 0:
+                part.moments[column] = (0, 0.0, 0.0)
+                continue
+            mean = valid.mean()
+            part.moments[column] = (count, mean, float(((valid - mean) ** 2).sum()))
+            part.minimum[column] = valid.min()
+            part.maximum[column] = valid.max()
+
+            if self.sketches:
+                # Semilla derivada de la posición del bloque: resultados reproducibles
+                quantile_sketch = KLLSketch(self.quantile_error, seed=self.n_rows)
+                quantile_sketch.update(valid)
+                part.quantile_sketches[column] = quantile_sketch
+                distinct_sketch = HyperLogLog(self.distinct_error)
+                distinct_sketch.update(valid)
+                part.distinct_sketches[column] = distinct_sketch
+
+            if has_target:
+                grouped = pd.Series(values).groupby(chunk[self.target].to_numpy(), observed=True)
+                part.target_sums[column] = grouped.sum()
+                part.target_counts[column] = grouped.count()
+
+        part.gram = GramStatistics.from_frame(chunk, self.numeric_cols)
+
+        for column in self.categorical_cols:
+            part.value_counts[column] = chunk[column].value_counts()
+
+        for col1, col2 in self.crosstab_pairs:
+            part.crosstabs[(col1, col2)] = chunk.groupby([col1, col2], observed=True).size()
+
+        return part
+
+    def merge(self, other: 'PartialAggregates'):
+        """
+        Combina otros agregados (de otro bloque o partición) con los actuales
+
+        Args:
+            other: Agregados con el mismo esquema de columnas
+        """
+        if not self.columns:
+            self.columns = list(other.columns)
+            self.numeric_cols = list(other.numeric_cols)
+            self.categorical_cols = list(other.categorical_cols)
+            self.crosstab_pairs = other.crosstab_pairs
+            self.sketches = other.sketches
+            self.null_counts = {column: 0 for column in self.columns}
+            self.dtypes = dict(other.dtypes)
+
+        self.n_rows += other.n_rows
+
+        for column, dtype in other.dtypes.items():
+            current = self.dtypes.get(column, dtype)
+            # Un bloque con nulos puede leerse como float: se conserva el tipo más amplio
+            if column in self.numeric_cols and pd.api.types.is_numeric_dtype(dtype) \
+                    and pd.api.types.is_numeric_dtype(current):
+                self.dtypes[column] = np.result_type(current, dtype)
+
+        for column, nulls in other.null_counts.items():
+            self.null_counts[column] = self.null_counts.get(column, 0) + int(nulls)
+
+        for column, (count_b, mean_b, m2_b) in other.moments.items():
+            count_a, mean_a, m2_a = self.moments.get(column, (0, 0.0, 0.0))
+            count = count_a + count_b
+            if count == 0:
+                self.moments[column] = (0, 0.0, 0.0)
+                continue
+            # Combinación de momentos de Chan et al. (estable numéricamente)
+            delta = mean_b - mean_a
+            mean = mean_a + delta * count_b / count
+            m2 = m2_a + m2_b + delta ** 2 * count_a * count_b / count
+            self.moments[column] = (count, mean, m2)
+
+        for column, value in other.minimum.items():
+            self.minimum[column] = min(self.minimum.get(column, value), value)
+        for column, value in other.maximum.items():
+            self.maximum[column] = max(self.maximum.get(column, value), value)
+
+        for column, sketch in other.quantile_sketches.items():
+            if column in self.quantile_sketches:
+                self.quantile_sketches[column].merge(sketch)
+            else:
+                self.quantile_sketches[column] = sketch
+        for column, sketch in other.distinct_sketches.items():
+            if column in self.distinct_sketches:
+                self.distinct_sketches[column].merge(sketch)
+            else:
+                self.distinct_sketches[column] = sketch
+
+        if other.gram is not None:
+            if self.gram is None:
+                self.gram = other.gram
+            else:
+                self.gram.merge(other.gram)
+
+        self.value_counts = _merge_counts(self.value_counts, other.value_counts)
+        self.crosstabs = _merge_counts(self.crosstabs, other.crosstabs)
+        self.target_sums = _merge_counts(self.target_sums, other.target_sums, dtype=np.float64)
+        self.target_counts = _merge_counts(self.target_counts, other.target_counts)
+
+        if self.preview is None or len(self.preview) < self.preview_rows:
+            if other.preview is not None:
+                frames = [frame for frame in (self.preview, other.preview) if frame is not None]
+                self.preview = pd.concat(frames).head(self.preview_rows)
+
+    def get_count(self, column: str) -> int:
+        """
+        Número de valores no nulos de una columna numérica
+        """
+        return self.moments.get(column, (0, 0.0, 0.0))[0]
+
+    def get_mean(self, column: str) -> float:
+        """
+        Media de una columna numérica
+        """
+        count, mean, _ = self.moments.get(column, (0, 0.0, 0.0))
+        return mean if count > 0 else np.nan
+
+    def get_std(self, column: str) -> float:
+        """
+        Desviación estándar muestral (ddof=1) de una columna numérica
+        """
+        count, _, m2 = self.moments.get(column, (0, 0.0, 0.0))
+        return np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+
+    def get_value_counts(self, column: str, normalize: bool = False) -> pd.Series:
+        """
+        Conteo de valores de una columna categórica, ordenado de mayor a menor
+
+        Args:
+            column: Nombre de la columna
+            normalize: Si True, retorna proporciones
+
+        Returns:
+            Serie con conteos o proporciones
+        """
+        counts = self.value_counts[column].sort_values(ascending=False, kind='stable')
+        counts.index.name = column
+        if normalize:
+            counts = counts / counts.sum()
+            counts.name = 'proportion'
+        else:
+            counts.name = 'count'
+        return counts
+
+    def get_crosstab(self, col1: str, col2: str, normalize=False) -> pd.DataFrame:
+        """
+        Tabla cruzada entre dos columnas categóricas tabuladas
+
+        Args:
+            col1: Variable de las filas
+            col2: Variable de las columnas
+            normalize: False, 'index', 'columns' o 'all' (igual que pd.crosstab)
+
+        Returns:
+            DataFrame con frecuencias o proporciones
+        """
+        if (col1, col2) in self.crosstabs:
+            table = self.crosstabs[(col1, col2)].unstack(fill_value=0)
+        elif (col2, col1) in self.crosstabs:
+            table = self.crosstabs[(col2, col1)].unstack(fill_value=0).T
+        else:
+            raise KeyError(f"La tabla cruzada {col1} vs {col2} no fue acumulada")
+        table = table.sort_index().sort_index(axis=1)
+        table.index.name = col1
+        table.columns.name = col2
+        return normalize_table(table, normalize)
+
+    def get_target_group_mean(self, column: str, value) -> float:
+        """
+        Media de una columna numérica para un valor de la variable objetivo
+
+        Args:
+            column: Variable numérica
+            value: Valor de la variable objetivo (por ejemplo 'yes')
+
+        Returns:
+            Media del grupo (NaN si no hay filas)
+        """
+        sums = self.target_sums.get(column)
+        counts = self.target_counts.get(column)
+        if sums is None or value not in counts.index or counts[value] == 0:
+            return np.nan
+        return sums[value] / counts[value]
+
+
+def _aggregate_frame(df: pd.DataFrame, kwargs: Dict) -> PartialAggregates:
+    """
+    Agregados de un rango de filas (se ejecuta en un proceso del pool)
+    """
+    return PartialAggregates.from_frame(df, **kwargs)
+
+
+def _aggregate_csv_range(byte_range: Tuple[int, int], path: str, header: bytes,
+                         chunksize: int, kwargs: Dict) -> PartialAggregates:
+    """
+    Agregados de un rango de bytes de un CSV (se ejecuta en un proceso del pool)
+    """
+    start, stop = byte_range
+    return PartialAggregates.from_chunks(
+        data_loader.iter_csv_range_chunks(path, start, stop, header, chunksize), **kwargs)
+
+
+def _merge_counts(current: Dict, other: Dict, dtype=np.int64) -> Dict:
+    """
+    Suma diccionarios de Series de conteos alineando sus índices
+    """
+    merged = dict(current)
+    for key, counts in other.items():
+        if key in merged:
+            merged[key] = merged[key].add(counts, fill_value=0).astype(dtype)
+        else:
+            merged[key] = counts.astype(dtype)
+    return merged
+
@@ -7,12 +7,20 @@ Curso: Especialización en Python for Analytics
 
 """
 
+import time
+import uuid
 import streamlit as st
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from data_analyzer import DataAnalyzer
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from dataset_registry import DatasetRegistry
+import instrumentation
+from lazy_imports import LazyModule, plt, sns, warm_up
+
+# Módulos pesados (pandas, PyArrow y el analizador): se importan en su primer uso,
+# así Home y la página de carga se muestran sin esperarlos
+pd = LazyModule('pandas')
+data_loader = LazyModule('data_loader')
+data_analyzer = LazyModule('data_analyzer')
+eda_engine = LazyModule('eda_engine')
 
 # Configuración de la página
 st.set_page_config(
@@ -51,17 +59,65 @@ st.markdown("""
 # FUNCIONES AUXILIARES
 # =======================
 
-def load_data(uploaded_file):
+@st.cache_resource(show_spinner=False)
+def get_dataset_registry():
+    """
+    Registro de datasets del proceso (uno para todas las sesiones)
+    """
+    return DatasetRegistry()
+
+def get_session_id():
+    """
+    Identificador de la sesión actual del navegador
+    """
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        return ctx.session_id
+    # Fuera del servidor (por ejemplo, en pruebas) se usa un identificador propio
+    return st.session_state.setdefault('session_id', uuid.uuid4().hex)
+
+def show_figure(fig):
     """
-    Carga el dataset desde un archivo CSV
+    Muestra una figura de matplotlib (con EDA_PROFILE=1 su rasterizado queda en la traza)
+    """
+    with instrumentation.span('st.pyplot', 'plot'):
+        st.pyplot(fig)
+
+def load_data(uploaded_file, content_hash):
+    """
+    Carga el dataset desde un archivo CSV en el registro compartido
+    
+    Si otra sesión ya cargó el mismo contenido, se reutiliza su DataFrame
+    (y su analizador) sin volver a leer el archivo.
     """
     try:
-        df = pd.read_csv(uploaded_file, sep=';')
-        return df
+        return get_dataset_registry().acquire(content_hash, get_session_id(),
+                                              lambda: data_loader.load_csv(uploaded_file))
     except Exception as e:
         st.error(f"Error al cargar el archivo: {e}")
         return None
 
+# A partir de este número de filas, cuartiles y valores únicos se estiman con sketches
+APPROXIMATE_MIN_ROWS = 5_000_000
+
+def create_analyzer(df):
+    """
+    Analizador de un dataset del registro (se crea una vez y lo comparten las sesiones)
+    """
+    analyzer = data_analyzer.DataAnalyzer(df, fingerprint=st.session_state['dataset_hash'],
+                            approximate=len(df) >= APPROXIMATE_MIN_ROWS)
+    # Las tablas cruzadas de todos los pares categóricos se preparan en segundo plano
+    analyzer.contingency(background=True)
+    return analyzer
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def get_streaming_analyzer(dataset_hash, _source, _chunksize):
+    """
+    Analizador en modo streaming compartido para un mismo archivo
+    """
+    # Con una ruta y EDA_N_WORKERS > 1, el archivo se reparte por rangos entre procesos
+    return data_analyzer.DataAnalyzer.from_csv(_source, chunksize=_chunksize, fingerprint=dataset_hash)
+
 # =======================
 # MÓDULO 1: HOME
 # =======================
@@ -169,6 +225,14 @@ def show_data_loading():
     st.markdown("### 📤 Sube tu archivo CSV")
     st.write("Por favor, carga el archivo **BankMarketing.csv** para comenzar el análisis.")
     
+    load_mode = st.radio(
+        "Modo de carga:",
+        ["Completo (en memoria)", "Streaming por bloques (archivos grandes)"],
+        horizontal=True,
+        help="El modo streaming lee el archivo por bloques y solo conserva agregados, "
+             "por lo que la memoria depende del tamaño de bloque y no del archivo"
+    )
+    
     # File uploader
     uploaded_file = st.file_uploader(
         "Selecciona el archivo CSV",
@@ -176,17 +240,42 @@ def show_data_loading():
         help="El archivo debe estar en formato CSV con separador ';'"
     )
     
+    if load_mode.startswith("Streaming"):
+        show_streaming_loading(uploaded_file)
+        return
+    
     if uploaded_file is not None:
-        # Cargar datos
-        with st.spinner('Cargando datos...'):
-            df = load_data(uploaded_file)
-        
-        if df is not None:
-            # Guardar en session_state
-            st.session_state['df'] = df
+        # Cargar datos (el mismo archivo conserva los lotes ya agregados)
+        content_hash = data_loader.compute_file_hash(uploaded_file)
+        if st.session_state.get('source_hash') != content_hash or \
+                st.session_state.get('streaming_mode', True):
+            with st.spinner('Cargando datos...'):
+                entry = load_data(uploaded_file, content_hash)
+            if entry is None:
+                return
+            # En session_state solo se guarda el hash: el DataFrame vive en el registro
+            st.session_state['dataset_hash'] = content_hash
+            st.session_state['source_hash'] = content_hash
+            st.session_state['streaming_mode'] = False
             st.session_state['data_loaded'] = True
+            st.session_state['appended_batches'] = set()
+            st.session_state.pop('analyzer', None)
+        
+        entry = get_session_dataset()
+        if entry is not None:
+            df, load_info = entry.df, entry.load_info
             
             st.success("✅ ¡Archivo cargado exitosamente!")
+            origin = "caché" if load_info['from_cache'] else "CSV"
+            mapped = " · columnas mapeadas desde disco (compartidas entre sesiones)" if load_info['memory_mapped'] else ""
+            st.caption(f"⚡ Cargado desde {origin} en {load_info['load_seconds'] * 1000:.0f} ms{mapped}")
+            if not load_info['from_cache'] and load_info.get('parse_seconds'):
+                throughput = load_info['file_size'] / 1024**2 / load_info['parse_seconds']
+                schema = " con esquema fijo" if load_info['schema_pinned'] else " infiriendo tipos"
+                st.caption(f"🧵 CSV parseado con {load_info['backend']}{schema} a {throughput:,.1f} MB/s "
+                           f"({load_info['file_size'] / 1024**2:,.1f} MB en {load_info['parse_seconds'] * 1000:.0f} ms)")
+            if len(entry.holders) > 1:
+                st.caption(f"🤝 Dataset compartido en memoria con {len(entry.holders) - 1} sesión(es) más")
             
             # Mostrar información básica
             st.markdown("---")
@@ -206,8 +295,19 @@ def show_data_loading():
                 st.metric("📋 Total de Columnas", df.shape[1])
             
             with col3:
-                memory_usage = df.memory_usage(deep=True).sum() / 1024**2
-                st.metric("💾 Tamaño en Memoria", f"{memory_usage:.2f} MB")
+                memory_usage = load_info['memory_after'] / 1024**2
+                memory_before = load_info['memory_before'] / 1024**2
+                reduction = (1 - load_info['memory_after'] / load_info['memory_before']) * 100 if load_info['memory_before'] else 0
+                st.metric("💾 Tamaño en Memoria", f"{memory_usage:.2f} MB",
+                          delta=f"-{reduction:.1f}% (antes {memory_before:.2f} MB)", delta_color="inverse")
+            
+            # Conversiones de tipos aplicadas al compactar
+            if load_info['converted']:
+                with st.expander("🗜️ Compactación de tipos de datos"):
+                    st.dataframe(pd.DataFrame({
+                        'Columna': list(load_info['converted'].keys()),
+                        'Conversión': list(load_info['converted'].values())
+                    }), use_container_width=True)
             
             # Mostrar tipos de datos
             st.markdown("---")
@@ -232,7 +332,9 @@ def show_data_loading():
                 ax.set_xlabel('Tipo de Dato')
                 ax.set_ylabel('Cantidad')
                 ax.tick_params(axis='x', rotation=45)
-                st.pyplot(fig)
+                show_figure(fig)
+            
+            render_batch_append()
             
             st.markdown("---")
             st.info("✨ **Datos cargados correctamente.** Ahora puedes proceder con el análisis exploratorio desde el menú lateral.")
@@ -241,613 +343,765 @@ def show_data_loading():
         st.warning("⚠️ Por favor, carga un archivo CSV para continuar.")
         st.info("💡 **Tip:** Asegúrate de que el archivo tenga el formato correcto y use ';' como separador.")
 
+def show_streaming_loading(uploaded_file):
+    """
+    Carga por bloques: lee el CSV en streaming y conserva solo agregados
+    """
+    file_path = st.text_input(
+        "Ruta del archivo en el servidor (opcional):",
+        help="Para archivos de varios GB que exceden el límite de subida del navegador"
+    )
+    chunksize = st.number_input(
+        "Filas por bloque:", min_value=1_000, max_value=5_000_000,
+        value=data_loader.DEFAULT_CHUNKSIZE, step=50_000
+    )
+    
+    source = file_path.strip() or uploaded_file
+    if not source:
+        st.warning("⚠️ Por favor, carga un archivo CSV o indica una ruta para continuar.")
+        return
+    
+    # Evitar releer el archivo en cada interacción de la página
+    source_key = (file_path.strip() or f"{uploaded_file.name}:{uploaded_file.size}", chunksize)
+    if st.session_state.get('stream_source_key') != source_key:
+        try:
+            with st.spinner('Procesando el archivo por bloques...'):
+                dataset_hash = data_loader.compute_file_hash(source)
+                analyzer = get_streaming_analyzer(dataset_hash, source, chunksize)
+        except Exception as e:
+            st.error(f"Error al procesar el archivo: {e}")
+            return
+        # Los agregados no ocupan el registro: se suelta el dataset completo de la sesión
+        get_dataset_registry().release(get_session_id())
+        st.session_state['analyzer'] = analyzer
+        st.session_state['dataset_hash'] = dataset_hash
+        st.session_state['streaming_mode'] = True
+        st.session_state['stream_source_key'] = source_key
+        st.session_state['data_loaded'] = True
+        st.session_state['appended_batches'] = set()
+    
+    analyzer = st.session_state['analyzer']
+    n_rows, n_cols = analyzer.get_basic_info()['shape']
+    
+    st.success("✅ ¡Archivo procesado por bloques exitosamente!")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("📊 Total de Filas", f"{n_rows:,}")
+    with col2:
+        st.metric("📋 Total de Columnas", n_cols)
+    
+    st.markdown("### 📋 Vista Previa del Dataset")
+    st.dataframe(analyzer.get_preview(10), use_container_width=True)
+    render_batch_append()
+    st.info("✨ **Datos procesados.** Los análisis disponibles en modo streaming se muestran en el módulo EDA.")
+
+def get_session_dataset():
+    """
+    Entrada del registro con el dataset de la sesión
+    
+    Si el servidor lo liberó por memoria o inactividad, se reabre desde la
+    caché en disco. Retorna None (con un aviso) si ya no se puede recuperar.
+    """
+    dataset_hash = st.session_state['dataset_hash']
+    
+    def reopen():
+        cached = data_loader.load_cached_dataset(dataset_hash)
+        if cached is None:
+            raise LookupError(dataset_hash)
+        return cached
+    
+    try:
+        return get_dataset_registry().acquire(dataset_hash, get_session_id(), reopen)
+    except LookupError:
+        # Los datasets con lotes agregados solo existen en memoria
+        st.session_state['data_loaded'] = False
+        st.warning("⚠️ El dataset se liberó de la memoria del servidor. Vuelve a cargar el archivo.")
+        return None
+
+def get_session_analyzer():
+    """
+    Analizador del dataset de la sesión (incluye los lotes agregados)
+    """
+    if st.session_state.get('streaming_mode'):
+        return st.session_state['analyzer']
+    if get_session_dataset() is None:
+        return None
+    return get_dataset_registry().get_analyzer(st.session_state['dataset_hash'], create_analyzer)
+
+def render_batch_append():
+    """
+    Agrega un lote de filas nuevas al dataset cargado
+    
+    El analizador de la sesión se copia (el compartido entre sesiones no se
+    modifica) y los resultados se actualizan con el lote en lugar de recalcularse.
+    """
+    st.markdown("---")
+    st.markdown("### ➕ Agregar Nuevo Lote")
+    batch_file = st.file_uploader(
+        "Selecciona un CSV con filas nuevas",
+        type=['csv'],
+        key='batch_file',
+        help="Debe tener las mismas columnas que el dataset cargado"
+    )
+    if batch_file is None:
+        return
+    
+    # El lote sigue seleccionado entre reruns: se agrega una sola vez
+    batch_hash = data_loader.compute_content_hash(batch_file.getvalue())
+    appended = st.session_state.setdefault('appended_batches', set())
+    if batch_hash in appended:
+        st.caption(f"✔️ Lote agregado. Total actual: {get_session_analyzer().get_basic_info()['shape'][0]:,} filas")
+        return
+    
+    try:
+        with st.spinner('Agregando lote...'):
+            batch = pd.read_csv(batch_file, sep=data_loader.CSV_SEPARATOR)
+            analyzer = get_session_analyzer().copy()
+            start = time.perf_counter()
+            analyzer.append(batch)
+            elapsed = time.perf_counter() - start
+    except Exception as e:
+        st.error(f"Error al agregar el lote: {e}")
+        return
+    
+    if analyzer.is_streaming:
+        st.session_state['analyzer'] = analyzer
+    else:
+        # El dataset ampliado es propio de la sesión: se registra con su analizador
+        get_dataset_registry().register(analyzer.fingerprint, get_session_id(), analyzer.df,
+                                        get_session_dataset().load_info, analyzer)
+    st.session_state['dataset_hash'] = analyzer.fingerprint
+    appended.add(batch_hash)
+    st.success(f"✅ Lote de {len(batch):,} filas agregado en {elapsed * 1000:.0f} ms. "
+               f"Total actual: {analyzer.get_basic_info()['shape'][0]:,} filas")
+
 # =======================
-# MÓDULO 3: EDA COMPLETO
+# SECCIONES DEL EDA
 # =======================
-# Este código reemplaza la función show_eda() en app.py
 
-def show_eda():
+def render_general_info(analyzer):
     """
-    Módulo principal de Análisis Exploratorio de Datos con 10 ítems
+    Ítem 1: Información general del dataset
     """
-    st.markdown('<h1 class="main-header">📊 Análisis Exploratorio de Datos (EDA)</h1>', 
-                unsafe_allow_html=True)
+    info = eda_engine.general_info(analyzer)
+    memory_usage = info['memory_bytes']
     
-    # Verificar si hay datos cargados
-    if 'data_loaded' not in st.session_state or not st.session_state['data_loaded']:
-        st.warning("⚠️ No hay datos cargados. Por favor, carga el dataset primero desde el menú 'Carga del Dataset'.")
-        return
+    st.markdown("## 📋 Ítem 1: Información General del Dataset")
+    st.markdown("---")
     
-    df = st.session_state['df']
-    
-    # Crear instancia del analizador
-    analyzer = DataAnalyzer(df)
-    
-    # Crear tabs para organizar los análisis
-    tabs = st.tabs([
-        "📋 Info General",
-        "🔢 Variables",
-        "📊 Estadísticas",
-        "❌ Valores Faltantes",
-        "📈 Dist. Numéricas",
-        "📊 Dist. Categóricas",
-        "🔀 Bivariado Num-Cat",
-        "🔀 Bivariado Cat-Cat",
-        "⚙️ Análisis Dinámico",
-        "💡 Hallazgos Clave"
-    ])
-    
-    # ======================
-    # ÍTEM 1: INFORMACIÓN GENERAL
-    # ======================
-    with tabs[0]:
-        st.markdown("## 📋 Ítem 1: Información General del Dataset")
-        st.markdown("---")
-        
-        # Métricas principales
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("📊 Filas", f"{df.shape[0]:,}")
-        with col2:
-            st.metric("📋 Columnas", df.shape[1])
-        with col3:
-            st.metric("💾 Memoria", f"{df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
-        with col4:
-            st.metric("🔢 Valores Totales", f"{df.shape[0] * df.shape[1]:,}")
-        
-        st.markdown("---")
-        
-        # Información detallada
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("### 📝 Tipos de Datos")
-            info_dict = analyzer.get_basic_info()
-            dtypes_df = pd.DataFrame({
-                'Columna': list(info_dict['dtypes'].keys()),
-                'Tipo': [str(v) for v in info_dict['dtypes'].values()],
-                'Nulos': list(info_dict['null_counts'].values())
-            })
-            st.dataframe(dtypes_df, use_container_width=True, height=400)
-        
-        with col2:
-            st.markdown("### 📊 Resumen de Tipos")
-            type_summary = df.dtypes.value_counts()
-            fig, ax = plt.subplots(figsize=(8, 6))
-            type_summary.plot(kind='bar', ax=ax, color='steelblue')
-            ax.set_title('Distribución de Tipos de Datos', fontsize=14, fontweight='bold')
-            ax.set_xlabel('Tipo de Dato')
-            ax.set_ylabel('Cantidad')
-            ax.tick_params(axis='x', rotation=45)
-            for i, v in enumerate(type_summary.values):
-                ax.text(i, v + 0.5, str(v), ha='center', fontweight='bold')
-            plt.tight_layout()
-            st.pyplot(fig)
-            plt.close()
-        
-        st.markdown("---")
-        st.markdown("### 🔍 Vista Previa del Dataset")
-        st.dataframe(df.head(20), use_container_width=True)
-    
-    # ======================
-    # ÍTEM 2: CLASIFICACIÓN DE VARIABLES
-    # ======================
-    with tabs[1]:
-        st.markdown("## 🔢 Ítem 2: Clasificación de Variables")
-        st.markdown("---")
-        
-        var_class = analyzer.get_variable_classification()
-        
-        # Métricas
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("🔢 Variables Numéricas", var_class['n_numeric'])
-        with col2:
-            st.metric("📝 Variables Categóricas", var_class['n_categorical'])
-        with col3:
-            st.metric("📊 Total Variables", var_class['n_numeric'] + var_class['n_categorical'])
-        
-        st.markdown("---")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("### 🔢 Variables Numéricas")
-            st.info("Variables que contienen valores numéricos (int, float)")
-            for i, col in enumerate(var_class['numeric'], 1):
-                st.write(f"{i}. `{col}` - Tipo: {df[col].dtype}")
-        
-        with col2:
-            st.markdown("### 📝 Variables Categóricas")
-            st.info("Variables que contienen categorías o texto")
-            for i, col in enumerate(var_class['categorical'], 1):
-                unique_count = df[col].nunique()
-                st.write(f"{i}. `{col}` - Valores únicos: {unique_count}")
-        
-        st.markdown("---")
-        
-        # Gráfico de clasificación
-        fig, ax = plt.subplots(figsize=(10, 6))
-        counts = [var_class['n_numeric'], var_class['n_categorical']]
-        labels = ['Numéricas', 'Categóricas']
-        colors = ['#3498db', '#e74c3c']
-        
-        bars = ax.bar(labels, counts, color=colors, alpha=0.7, edgecolor='black', linewidth=2)
-        ax.set_title('Clasificación de Variables', fontsize=16, fontweight='bold')
-        ax.set_ylabel('Cantidad', fontsize=12)
-        
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{int(height)}',
-                   ha='center', va='bottom', fontsize=14, fontweight='bold')
-        
+    # Métricas principales
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("📊 Filas", f"{info['rows']:,}")
+    with col2:
+        st.metric("📋 Columnas", info['columns'])
+    with col3:
+        st.metric("💾 Memoria", f"{memory_usage / 1024**2:.2f} MB" if memory_usage is not None else "N/A (streaming)")
+    with col4:
+        st.metric("🔢 Valores Totales", f"{info['total_values']:,}")
+    
+    st.markdown("---")
+    
+    # Información detallada
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 📝 Tipos de Datos")
+        st.dataframe(info['dtypes'], use_container_width=True, height=400)
+    
+    with col2:
+        st.markdown("### 📊 Resumen de Tipos")
+        fig, ax = plt.subplots(figsize=(8, 6))
+        eda_engine.plot_type_summary(info['type_summary'], ax)
         plt.tight_layout()
-        st.pyplot(fig)
+        show_figure(fig)
         plt.close()
     
-    # ======================
-    # ÍTEM 3: ESTADÍSTICAS DESCRIPTIVAS
-    # ======================
-    with tabs[2]:
-        st.markdown("## 📊 Ítem 3: Estadísticas Descriptivas")
-        st.markdown("---")
-        
+    st.markdown("---")
+    st.markdown("### 🔍 Vista Previa del Dataset")
+    st.dataframe(info['preview'], use_container_width=True)
+
+def render_variable_classification(analyzer):
+    """
+    Ítem 2: clasificación de variables en numéricas y categóricas
+    """
+    st.markdown("## 🔢 Ítem 2: Clasificación de Variables")
+    st.markdown("---")
+    
+    var_class = eda_engine.variable_classification(analyzer)
+    
+    # Métricas
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("🔢 Variables Numéricas", var_class['n_numeric'])
+    with col2:
+        st.metric("📝 Variables Categóricas", var_class['n_categorical'])
+    with col3:
+        st.metric("📊 Total Variables", var_class['n_numeric'] + var_class['n_categorical'])
+    
+    st.markdown("---")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
         st.markdown("### 🔢 Variables Numéricas")
-        desc_stats = analyzer.get_descriptive_stats()
-        st.dataframe(desc_stats.style.background_gradient(cmap='Blues'), use_container_width=True)
-        
-        st.markdown("---")
-        st.markdown("### 💡 Interpretación de Estadísticas Clave")
+        st.info("Variables que contienen valores numéricos (int, float)")
+        for i, row in enumerate(var_class['numeric'].itertuples(index=False), 1):
+            st.write(f"{i}. `{row.Columna}` - Tipo: {row.Tipo}")
+    
+    with col2:
+        st.markdown("### 📝 Variables Categóricas")
+        st.info("Variables que contienen categorías o texto")
+        for i, (col, unique_count) in enumerate(var_class['categorical'].itertuples(index=False), 1):
+            st.write(f"{i}. `{col}` - Valores únicos: {unique_count}")
+    
+    st.markdown("---")
+    
+    # Gráfico de clasificación
+    fig, ax = plt.subplots(figsize=(10, 6))
+    eda_engine.plot_variable_classification(var_class, ax)
+    plt.tight_layout()
+    show_figure(fig)
+    plt.close()
+
+# Interpretación del sesgo según la relación entre media y mediana
+SKEW_INTERPRETATION = {
+    'derecha': 'La media es mayor que la mediana, sugiriendo una distribución sesgada a la derecha.',
+    'izquierda': 'La media es menor que la mediana, sugiriendo una distribución sesgada a la izquierda.',
+    'simétrica': 'Media y mediana son similares, sugiriendo una distribución simétrica.'
+}
+
+def render_descriptive_stats(analyzer):
+    """
+    Ítem 3: Estadísticas descriptivas
+    """
+    st.markdown("## 📊 Ítem 3: Estadísticas Descriptivas")
+    st.markdown("---")
+    
+    st.markdown("### 🔢 Variables Numéricas")
+    desc_stats = eda_engine.descriptive_stats(analyzer)
+    st.dataframe(desc_stats['table'].style.background_gradient(cmap='Blues'), use_container_width=True)
+    if desc_stats['approximate']:
+        st.caption(f"≈ Cuartiles estimados con sketches (error de rango ±{desc_stats['quantile_error']:.0%}).")
+    
+    st.markdown("---")
+    st.markdown("### 💡 Interpretación de Estadísticas Clave")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### 📈 Medidas de Tendencia Central")
+        selected_var = st.selectbox("Selecciona una variable:", analyzer.numeric_cols)
         
-        col1, col2 = st.columns(2)
+        stats = eda_engine.variable_summary(analyzer, selected_var)
         
-        with col1:
-            st.markdown("#### 📈 Medidas de Tendencia Central")
-            selected_var = st.selectbox("Selecciona una variable:", analyzer.numeric_cols)
-            
-            stats = analyzer.get_summary_statistics(selected_var)
-            
-            st.metric("Media (Promedio)", f"{stats['Media']:.2f}")
-            st.metric("Mediana (Valor Central)", f"{stats['Mediana']:.2f}")
-            st.metric("Moda (Más Frecuente)", f"{stats['Moda']:.2f}" if stats['Moda'] else "N/A")
-            
-            st.info(f"""
-            **Interpretación:**
-            - La **media** es {stats['Media']:.2f}
-            - La **mediana** es {stats['Mediana']:.2f}
-            - {'La media es mayor que la mediana, sugiriendo una distribución sesgada a la derecha.' if stats['Media'] > stats['Mediana'] else 'La media es menor que la mediana, sugiriendo una distribución sesgada a la izquierda.' if stats['Media'] < stats['Mediana'] else 'Media y mediana son similares, sugiriendo una distribución simétrica.'}
-            """)
+        st.metric("Media (Promedio)", f"{stats['Media']:.2f}")
+        st.metric("Mediana (Valor Central)", f"{stats['Mediana']:.2f}")
+        st.metric("Moda (Más Frecuente)", f"{stats['Moda']:.2f}" if stats['Moda'] else "N/A")
         
-        with col2:
-            st.markdown("#### 📊 Medidas de Dispersión")
-            st.metric("Desviación Estándar", f"{stats['Desviación Estándar']:.2f}")
-            st.metric("Rango (Max - Min)", f"{stats['Máximo'] - stats['Mínimo']:.2f}")
-            st.metric("Coeficiente de Variación", f"{(stats['Desviación Estándar'] / stats['Media'] * 100):.2f}%")
-            
-            st.info(f"""
-            **Interpretación:**
-            - **Desviación Estándar:** {stats['Desviación Estándar']:.2f}
-            - Los datos varían en promedio ±{stats['Desviación Estándar']:.2f} unidades respecto a la media
-            - **Rango IQR (Q3-Q1):** {stats['Q3'] - stats['Q1']:.2f}
-            """)
-    
-    # ======================
-    # ÍTEM 4: VALORES FALTANTES
-    # ======================
-    with tabs[3]:
-        st.markdown("## ❌ Ítem 4: Análisis de Valores Faltantes")
-        st.markdown("---")
+        st.info(f"""
+        **Interpretación:**
+        - La **media** es {stats['Media']:.2f}
+        - La **mediana** es {stats['Mediana']:.2f}
+        - {SKEW_INTERPRETATION[stats['Sesgo']]}
+        """)
+    
+    with col2:
+        st.markdown("#### 📊 Medidas de Dispersión")
+        st.metric("Desviación Estándar", f"{stats['Desviación Estándar']:.2f}")
+        st.metric("Rango (Max - Min)", f"{stats['Rango']:.2f}")
+        st.metric("Coeficiente de Variación", f"{stats['Coeficiente de Variación']:.2f}%")
         
-        missing_analysis = analyzer.get_missing_values_analysis()
+        st.info(f"""
+        **Interpretación:**
+        - **Desviación Estándar:** {stats['Desviación Estándar']:.2f}
+        - Los datos varían en promedio ±{stats['Desviación Estándar']:.2f} unidades respecto a la media
+        - **Rango IQR (Q3-Q1):** {stats['IQR']:.2f}
+        """)
+
+def render_missing_values(analyzer):
+    """
+    Ítem 4: Análisis de valores faltantes
+    """
+    st.markdown("## ❌ Ítem 4: Análisis de Valores Faltantes")
+    st.markdown("---")
+    
+    missing = eda_engine.missing_values(analyzer)
+    total_missing = missing['total_missing']
+    missing_pct = missing['missing_pct']
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("🔢 Total Valores Faltantes", f"{total_missing:,}")
+    with col2:
+        st.metric("📊 Porcentaje Total", f"{missing_pct:.2f}%")
+    with col3:
+        status = "✅ Excelente" if missing_pct == 0 else "⚠️ Requiere Atención"
+        st.metric("Estado", status)
+    
+    st.markdown("---")
+    
+    if total_missing == 0:
+        st.success("✅ **¡Excelente!** Este dataset no tiene valores faltantes.")
+        st.balloons()
+    else:
+        st.warning(f"⚠️ Se encontraron {total_missing:,} valores faltantes ({missing_pct:.2f}%)")
         
-        total_missing = missing_analysis['Valores_Nulos'].sum()
-        total_cells = df.shape[0] * df.shape[1]
-        missing_pct = (total_missing / total_cells) * 100
+        col1, col2 = st.columns(2)
         
-        col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("🔢 Total Valores Faltantes", f"{total_missing:,}")
-        with col2:
-            st.metric("📊 Porcentaje Total", f"{missing_pct:.2f}%")
-        with col3:
-            status = "✅ Excelente" if missing_pct == 0 else "⚠️ Requiere Atención"
-            st.metric("Estado", status)
-        
-        st.markdown("---")
+            st.markdown("### 📋 Tabla de Valores Faltantes")
+            st.dataframe(missing['table'], use_container_width=True)
         
-        if total_missing == 0:
-            st.success("✅ **¡Excelente!** Este dataset no tiene valores faltantes.")
-            st.balloons()
-        else:
-            st.warning(f"⚠️ Se encontraron {total_missing:,} valores faltantes ({missing_pct:.2f}%)")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("### 📋 Tabla de Valores Faltantes")
-                st.dataframe(missing_analysis, use_container_width=True)
-            
-            with col2:
-                st.markdown("### 📊 Visualización")
-                fig, ax = plt.subplots(figsize=(10, 6))
-                missing_cols = missing_analysis[missing_analysis['Valores_Nulos'] > 0]
-                if len(missing_cols) > 0:
-                    ax.barh(missing_cols['Columna'], missing_cols['Porcentaje'], color='salmon')
-                    ax.set_xlabel('Porcentaje de Valores Faltantes')
-                    ax.set_title('Distribución de Valores Faltantes', fontweight='bold')
-                    plt.tight_layout()
-                    st.pyplot(fig)
-                else:
-                    st.info("No hay valores faltantes para visualizar")
-                plt.close()
-    
-    # ======================
-    # ÍTEM 5: DISTRIBUCIÓN VARIABLES NUMÉRICAS
-    # ======================
-    with tabs[4]:
-        st.markdown("## 📈 Ítem 5: Distribución de Variables Numéricas")
-        st.markdown("---")
-        
-        st.markdown("### 🔍 Selecciona Variables a Analizar")
-        
-        selected_numeric = st.multiselect(
-            "Elige una o más variables numéricas:",
-            analyzer.numeric_cols,
-            default=analyzer.numeric_cols[:3]
-        )
-        
-        if selected_numeric:
-            # Mostrar distribuciones
-            for col in selected_numeric:
-                st.markdown(f"### 📊 Distribución de: **{col}**")
-                
-                col1, col2 = st.columns([2, 1])
-                
-                with col1:
-                    fig, ax = plt.subplots(figsize=(10, 6))
-                    analyzer.plot_numeric_distribution(col, ax=ax)
-                    st.pyplot(fig)
-                    plt.close()
-                
-                with col2:
-                    stats = analyzer.get_summary_statistics(col)
-                    st.markdown("#### 📊 Estadísticas")
-                    st.metric("Media", f"{stats['Media']:.2f}")
-                    st.metric("Mediana", f"{stats['Mediana']:.2f}")
-                    st.metric("Desv. Std", f"{stats['Desviación Estándar']:.2f}")
-                    st.metric("Mínimo", f"{stats['Mínimo']:.2f}")
-                    st.metric("Máximo", f"{stats['Máximo']:.2f}")
-                
-                st.markdown("---")
-        else:
-            st.info("Por favor, selecciona al menos una variable numérica.")
+        with col2:
+            st.markdown("### 📊 Visualización")
+            fig, ax = plt.subplots(figsize=(10, 6))
+            if len(missing['missing_columns']) > 0:
+                eda_engine.plot_missing_values(missing, ax)
+                plt.tight_layout()
+                show_figure(fig)
+            else:
+                st.info("No hay valores faltantes para visualizar")
+            plt.close()
+
+def render_sample_note(analyzer, strata=('y',)):
+    """
+    Aviso de que los gráficos se dibujan con una muestra estratificada
+    """
+    sample = analyzer.get_sample(tuple(strata))
+    if sample is not None:
+        st.caption(f"🎲 Gráficos dibujados con una muestra estratificada por {', '.join(sample.strata)} "
+                   f"({len(sample):,} de {sample.population:,} filas, semilla {sample.seed}). "
+                   "Medias, medianas y tablas de estadísticas usan todas las filas.")
+
+def render_numeric_distributions(analyzer):
+    """
+    Ítem 5: distribución de las variables numéricas seleccionadas
+    """
+    st.markdown("## 📈 Ítem 5: Distribución de Variables Numéricas")
+    st.markdown("---")
     
-    # ======================
-    # ÍTEM 6: VARIABLES CATEGÓRICAS
-    # ======================
-    with tabs[5]:
-        st.markdown("## 📊 Ítem 6: Análisis de Variables Categóricas")
-        st.markdown("---")
-        
-        selected_cat = st.selectbox(
-            "Selecciona una variable categórica:",
-            analyzer.categorical_cols
-        )
-        
-        if selected_cat:
-            st.markdown(f"### 📊 Análisis de: **{selected_cat}**")
+    st.markdown("### 🔍 Selecciona Variables a Analizar")
+    
+    selected_numeric = st.multiselect(
+        "Elige una o más variables numéricas:",
+        analyzer.numeric_cols,
+        default=analyzer.numeric_cols[:3]
+    )
+    
+    if selected_numeric:
+        # Los histogramas de las variables elegidas se preparan en paralelo
+        analyzer.prepare_histograms(selected_numeric)
+        render_sample_note(analyzer)
+        
+        # Mostrar distribuciones
+        for col in selected_numeric:
+            st.markdown(f"### 📊 Distribución de: **{col}**")
             
-            # Conteos y proporciones
-            col1, col2 = st.columns(2)
+            col1, col2 = st.columns([2, 1])
             
             with col1:
-                st.markdown("#### 🔢 Conteos Absolutos")
-                counts = analyzer.get_value_counts(selected_cat, normalize=False)
-                st.dataframe(counts.reset_index().rename(columns={'index': selected_cat, selected_cat: 'Frecuencia'}), 
-                           use_container_width=True)
+                image = analyzer.render_figure('plot_numeric_distribution', col, figsize=(10, 6))
+                st.image(image, use_container_width=True)
             
             with col2:
-                st.markdown("#### 📊 Proporciones (%)")
-                proportions = analyzer.get_value_counts(selected_cat, normalize=True) * 100
-                st.dataframe(proportions.reset_index().rename(columns={'index': selected_cat, selected_cat: 'Porcentaje'}), 
-                           use_container_width=True)
+                stats = eda_engine.variable_summary(analyzer, col)
+                st.markdown("#### 📊 Estadísticas")
+                st.metric("Media", f"{stats['Media']:.2f}")
+                st.metric("Mediana", f"{stats['Mediana']:.2f}")
+                st.metric("Desv. Std", f"{stats['Desviación Estándar']:.2f}")
+                st.metric("Mínimo", f"{stats['Mínimo']:.2f}")
+                st.metric("Máximo", f"{stats['Máximo']:.2f}")
             
             st.markdown("---")
-            
-            # Visualización
-            st.markdown("### 📈 Visualización")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("#### Gráfico de Barras")
-                fig, ax = plt.subplots(figsize=(10, 6))
-                analyzer.plot_categorical_distribution(selected_cat, ax=ax)
-                st.pyplot(fig)
-                plt.close()
-            
-            with col2:
-                st.markdown("#### Gráfico de Pastel")
-                fig, ax = plt.subplots(figsize=(10, 6))
-                counts = analyzer.get_value_counts(selected_cat, normalize=False)
-                ax.pie(counts.values, labels=counts.index, autopct='%1.1f%%', startangle=90)
-                ax.set_title(f'Distribución de {selected_cat}', fontweight='bold', fontsize=14)
-                st.pyplot(fig)
-                plt.close()
-    
-    # ======================
-    # ÍTEM 7: BIVARIADO NUMÉRICO VS CATEGÓRICO
-    # ======================
-    with tabs[6]:
-        st.markdown("## 🔀 Ítem 7: Análisis Bivariado (Numérico vs Categórico)")
-        st.markdown("---")
-        
-        st.markdown("### 🔍 Selecciona Variables a Comparar")
+    else:
+        st.info("Por favor, selecciona al menos una variable numérica.")
+
+def render_categorical_analysis(analyzer):
+    """
+    Ítem 6: Análisis de variables categóricas
+    """
+    st.markdown("## 📊 Ítem 6: Análisis de Variables Categóricas")
+    st.markdown("---")
+    
+    selected_cat = st.selectbox(
+        "Selecciona una variable categórica:",
+        analyzer.categorical_cols
+    )
+    
+    if selected_cat:
+        st.markdown(f"### 📊 Análisis de: **{selected_cat}**")
         
+        # Conteos y proporciones
+        distribution = eda_engine.categorical_distribution(analyzer, selected_cat)
+        counts = distribution['counts']
         col1, col2 = st.columns(2)
         
         with col1:
-            numeric_var = st.selectbox("Variable Numérica:", analyzer.numeric_cols, key='biv_num')
+            st.markdown("#### 🔢 Conteos Absolutos")
+            st.dataframe(counts.reset_index().rename(columns={'index': selected_cat, selected_cat: 'Frecuencia'}), 
+                       use_container_width=True)
         
         with col2:
-            categorical_var = st.selectbox("Variable Categórica:", analyzer.categorical_cols, key='biv_cat')
+            st.markdown("#### 📊 Proporciones (%)")
+            proportions = distribution['percentages']
+            st.dataframe(proportions.reset_index().rename(columns={'index': selected_cat, selected_cat: 'Porcentaje'}), 
+                       use_container_width=True)
         
-        if numeric_var and categorical_var:
-            st.markdown(f"### 📊 Análisis: **{numeric_var}** vs **{categorical_var}**")
-            
-            # Boxplot
-            st.markdown("#### 📦 Boxplot Comparativo")
-            fig, ax = plt.subplots(figsize=(14, 6))
-            analyzer.plot_bivariate_numeric_categorical(numeric_var, categorical_var, ax=ax)
-            st.pyplot(fig)
-            plt.close()
-            
-            st.markdown("---")
-            
-            # Estadísticas por grupo
-            st.markdown("#### 📊 Estadísticas por Grupo")
-            group_stats = df.groupby(categorical_var)[numeric_var].describe()
-            st.dataframe(group_stats.style.background_gradient(cmap='Greens'), use_container_width=True)
-            
-            # Interpretación
-            st.markdown("#### 💡 Interpretación")
-            max_mean_group = df.groupby(categorical_var)[numeric_var].mean().idxmax()
-            min_mean_group = df.groupby(categorical_var)[numeric_var].mean().idxmin()
-            
-            st.info(f"""
-            **Hallazgos:**
-            - El grupo con mayor promedio de **{numeric_var}** es: **{max_mean_group}**
-            - El grupo con menor promedio es: **{min_mean_group}**
-            - Esto sugiere que existe una relación entre {categorical_var} y {numeric_var}
-            """)
-    
-    # ======================
-    # ÍTEM 8: BIVARIADO CATEGÓRICO VS CATEGÓRICO
-    # ======================
-    with tabs[7]:
-        st.markdown("## 🔀 Ítem 8: Análisis Bivariado (Categórico vs Categórico)")
         st.markdown("---")
         
-        st.markdown("### 🔍 Selecciona Variables a Cruzar")
+        # Visualización
+        st.markdown("### 📈 Visualización")
         
         col1, col2 = st.columns(2)
         
         with col1:
-            cat_var1 = st.selectbox("Primera Variable:", analyzer.categorical_cols, key='cat1')
+            st.markdown("#### Gráfico de Barras")
+            image = analyzer.render_figure('plot_categorical_distribution', selected_cat, figsize=(10, 6))
+            st.image(image, use_container_width=True)
         
         with col2:
-            cat_var2 = st.selectbox("Segunda Variable:", analyzer.categorical_cols, key='cat2')
-        
-        if cat_var1 and cat_var2 and cat_var1 != cat_var2:
-            st.markdown(f"### 📊 Análisis: **{cat_var1}** vs **{cat_var2}**")
-            
-            # Tabla cruzada
-            st.markdown("#### 📋 Tabla Cruzada (Frecuencias)")
-            crosstab = pd.crosstab(df[cat_var1], df[cat_var2])
-            st.dataframe(crosstab, use_container_width=True)
-            
-            st.markdown("---")
-            
-            # Heatmap
-            st.markdown("#### 🔥 Heatmap de Relación")
-            fig, ax = plt.subplots(figsize=(12, 8))
-            analyzer.plot_categorical_crosstab(cat_var1, cat_var2, ax=ax)
-            st.pyplot(fig)
+            st.markdown("#### Gráfico de Pastel")
+            fig, ax = plt.subplots(figsize=(10, 6))
+            eda_engine.plot_category_pie(counts, selected_cat, ax)
+            show_figure(fig)
             plt.close()
-            
-            st.markdown("---")
-            
-            # Proporciones
-            st.markdown("#### 📊 Tabla de Proporciones (%)")
-            crosstab_pct = pd.crosstab(df[cat_var1], df[cat_var2], normalize='index') * 100
-            st.dataframe(crosstab_pct.style.background_gradient(cmap='YlOrRd'), use_container_width=True)
-        
-        elif cat_var1 == cat_var2:
-            st.warning("⚠️ Por favor, selecciona dos variables diferentes.")
-    
-    # ======================
-    # ÍTEM 9: ANÁLISIS DINÁMICO
-    # ======================
-    with tabs[8]:
-        st.markdown("## ⚙️ Ítem 9: Análisis Basado en Parámetros Seleccionados")
-        st.markdown("---")
-        
-        st.markdown("### 🎨 Crea Tu Propio Análisis Personalizado")
-        
-        analysis_type = st.radio(
-            "Tipo de análisis:",
-            ["Filtrado por Rango", "Comparación Múltiple", "Correlación Personalizada"]
-        )
+
+def render_bivariate_numeric_categorical(analyzer):
+    """
+    Ítem 7: análisis bivariado numérico vs categórico
+    """
+    st.markdown("## 🔀 Ítem 7: Análisis Bivariado (Numérico vs Categórico)")
+    st.markdown("---")
+    
+    st.markdown("### 🔍 Selecciona Variables a Comparar")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        numeric_var = st.selectbox("Variable Numérica:", analyzer.numeric_cols, key='biv_num')
+    
+    with col2:
+        categorical_var = st.selectbox("Variable Categórica:", analyzer.categorical_cols, key='biv_cat')
+    
+    if numeric_var and categorical_var:
+        st.markdown(f"### 📊 Análisis: **{numeric_var}** vs **{categorical_var}**")
         
-        if analysis_type == "Filtrado por Rango":
-            st.markdown("#### 📊 Filtrado Dinámico por Rango")
-            
-            numeric_col = st.selectbox("Variable numérica:", analyzer.numeric_cols, key='filter_col')
-            
-            min_val = float(df[numeric_col].min())
-            max_val = float(df[numeric_col].max())
-            
-            range_vals = st.slider(
-                f"Selecciona el rango de {numeric_col}:",
-                min_val, max_val, (min_val, max_val)
-            )
-            
-            filtered_df = df[(df[numeric_col] >= range_vals[0]) & (df[numeric_col] <= range_vals[1])]
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Registros Filtrados", f"{len(filtered_df):,}")
-            with col2:
-                st.metric("% del Total", f"{(len(filtered_df)/len(df)*100):.1f}%")
-            with col3:
-                st.metric("Registros Excluidos", f"{len(df)-len(filtered_df):,}")
-            
-            st.dataframe(filtered_df.head(20), use_container_width=True)
+        # Boxplot
+        st.markdown("#### 📦 Boxplot Comparativo")
+        render_sample_note(analyzer, ('y', categorical_var))
+        image = analyzer.render_figure('plot_bivariate_numeric_categorical', numeric_var, categorical_var, figsize=(14, 6))
+        st.image(image, use_container_width=True)
         
-        elif analysis_type == "Comparación Múltiple":
-            st.markdown("#### 📊 Comparación de Múltiples Variables")
-            
-            selected_vars = st.multiselect(
-                "Selecciona variables numéricas a comparar:",
-                analyzer.numeric_cols,
-                default=analyzer.numeric_cols[:3]
-            )
-            
-            if len(selected_vars) >= 2:
-                # Gráfico de dispersión
-                fig, ax = plt.subplots(figsize=(12, 8))
-                for var in selected_vars:
-                    ax.hist(df[var], alpha=0.5, label=var, bins=30)
-                ax.legend()
-                ax.set_xlabel('Valor')
-                ax.set_ylabel('Frecuencia')
-                ax.set_title('Comparación de Distribuciones', fontweight='bold', fontsize=14)
-                st.pyplot(fig)
-                plt.close()
-        
-        elif analysis_type == "Correlación Personalizada":
-            st.markdown("#### 📊 Matriz de Correlación Personalizada")
-            
-            selected_vars = st.multiselect(
-                "Selecciona variables para análisis de correlación:",
-                analyzer.numeric_cols,
-                default=analyzer.numeric_cols[:5]
-            )
-            
-            if len(selected_vars) >= 2:
-                fig, ax = plt.subplots(figsize=(10, 8))
-                analyzer.plot_correlation_heatmap(selected_vars, ax=ax)
-                st.pyplot(fig)
-                plt.close()
-                
-                st.markdown("---")
-                st.markdown("#### 📋 Tabla de Correlación")
-                corr_matrix = analyzer.get_correlation_matrix(selected_vars)
-                st.dataframe(corr_matrix.style.background_gradient(cmap='coolwarm', vmin=-1, vmax=1), 
-                           use_container_width=True)
-    
-    # ======================
-    # ÍTEM 10: HALLAZGOS CLAVE
-    # ======================
-    with tabs[9]:
-        st.markdown("## 💡 Ítem 10: Hallazgos Clave del Análisis")
         st.markdown("---")
         
-        st.markdown("### 🎯 Resumen Ejecutivo del Análisis")
-        
-        # Métricas principales
-        col1, col2, col3, col4 = st.columns(4)
+        # Estadísticas por grupo
+        st.markdown("#### 📊 Estadísticas por Grupo")
+        group_stats = eda_engine.numeric_by_category(analyzer, numeric_var, categorical_var)
+        st.dataframe(group_stats['table'].style.background_gradient(cmap='Greens'), use_container_width=True)
         
-        with col1:
-            acceptance_rate = (df['y'].value_counts()['yes'] / len(df)) * 100
-            st.metric("📈 Tasa de Aceptación", f"{acceptance_rate:.2f}%")
+        # Interpretación
+        st.markdown("#### 💡 Interpretación")
+        st.info(f"""
+        **Hallazgos:**
+        - El grupo con mayor promedio de **{numeric_var}** es: **{group_stats['max_mean_group']}**
+        - El grupo con menor promedio es: **{group_stats['min_mean_group']}**
+        - Esto sugiere que existe una relación entre {categorical_var} y {numeric_var}
+        """)
+
+def render_bivariate_categorical(analyzer):
+    """
+    Ítem 8: análisis bivariado categórico vs categórico
+    """
+    st.markdown("## 🔀 Ítem 8: Análisis Bivariado (Categórico vs Categórico)")
+    st.markdown("---")
+    
+    st.markdown("### 🔍 Selecciona Variables a Cruzar")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        cat_var1 = st.selectbox("Primera Variable:", analyzer.categorical_cols, key='cat1')
+    
+    with col2:
+        cat_var2 = st.selectbox("Segunda Variable:", analyzer.categorical_cols, key='cat2')
+    
+    if cat_var1 and cat_var2 and cat_var1 != cat_var2:
+        st.markdown(f"### 📊 Análisis: **{cat_var1}** vs **{cat_var2}**")
         
-        with col2:
-            avg_age = df['age'].mean()
-            st.metric("👥 Edad Promedio", f"{avg_age:.1f} años")
+        # Tabla cruzada
+        st.markdown("#### 📋 Tabla Cruzada (Frecuencias)")
+        crosstab = eda_engine.categorical_crosstab(analyzer, cat_var1, cat_var2)
+        st.dataframe(crosstab['counts'], use_container_width=True)
         
-        with col3:
-            avg_duration = df['duration'].mean()
-            st.metric("⏱️ Duración Promedio", f"{avg_duration:.0f} seg")
+        st.markdown("---")
         
-        with col4:
-            most_common_job = df['job'].mode()[0]
-            st.metric("💼 Ocupación Más Común", most_common_job)
+        # Heatmap
+        st.markdown("#### 🔥 Heatmap de Relación")
+        image = analyzer.render_figure('plot_categorical_crosstab', cat_var1, cat_var2, figsize=(12, 8))
+        st.image(image, use_container_width=True)
         
         st.markdown("---")
         
-        # Insights visuales
-        st.markdown("### 📊 Visualizaciones de Hallazgos Clave")
-        
-        col1, col2 = st.columns(2)
+        # Proporciones
+        st.markdown("#### 📊 Tabla de Proporciones (%)")
+        st.dataframe(crosstab['row_percentages'].style.background_gradient(cmap='YlOrRd'), use_container_width=True)
+    
+    elif cat_var1 == cat_var2:
+        st.warning("⚠️ Por favor, selecciona dos variables diferentes.")
+
+def render_dynamic_analysis(analyzer):
+    """
+    Ítem 9: análisis basado en parámetros seleccionados
+    """
+    st.markdown("## ⚙️ Ítem 9: Análisis Basado en Parámetros Seleccionados")
+    st.markdown("---")
+    
+    st.markdown("### 🎨 Crea Tu Propio Análisis Personalizado")
+    
+    analysis_type = st.radio(
+        "Tipo de análisis:",
+        ["Filtrado por Rango", "Comparación Múltiple", "Correlación Personalizada"]
+    )
+    
+    if analysis_type == "Filtrado por Rango":
+        st.markdown("#### 📊 Filtrado Dinámico por Rango")
         
-        with col1:
-            st.markdown("#### 🎯 Tasa de Aceptación por Educación")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            education_acceptance = pd.crosstab(df['education'], df['y'], normalize='index') * 100
-            education_acceptance['yes'].sort_values(ascending=False).plot(kind='barh', ax=ax, color='green', alpha=0.7)
-            ax.set_xlabel('Porcentaje de Aceptación (%)')
-            ax.set_title('Aceptación por Nivel Educativo', fontweight='bold')
-            st.pyplot(fig)
-            plt.close()
+        numeric_col = st.selectbox("Variable numérica:", analyzer.numeric_cols, key='filter_col')
         
-        with col2:
-            st.markdown("#### 📞 Tasa de Aceptación por Canal")
-            fig, ax = plt.subplots(figsize=(10, 6))
-            contact_acceptance = pd.crosstab(df['contact'], df['y'], normalize='index') * 100
-            contact_acceptance['yes'].plot(kind='bar', ax=ax, color='steelblue', alpha=0.7)
-            ax.set_xlabel('Canal de Contacto')
-            ax.set_ylabel('Porcentaje de Aceptación (%)')
-            ax.set_title('Aceptación por Canal de Comunicación', fontweight='bold')
-            ax.tick_params(axis='x', rotation=45)
-            st.pyplot(fig)
-            plt.close()
+        stats = eda_engine.variable_summary(analyzer, numeric_col)
+        min_val = float(stats['Mínimo'])
+        max_val = float(stats['Máximo'])
         
-        st.markdown("---")
+        range_vals = st.slider(
+            f"Selecciona el rango de {numeric_col}:",
+            min_val, max_val, (min_val, max_val)
+        )
         
-        # Conclusiones principales
-        st.markdown("### 📝 Conclusiones Principales")
+        # Búsqueda binaria sobre el índice ordenado (sin máscaras ni copias)
+        filtered = eda_engine.range_filter(analyzer, numeric_col, range_vals[0], range_vals[1], n_preview=20)
         
-        st.success(f"""
-        **1. Tasa de Conversión General**
-        - La campaña actual tiene una tasa de aceptación del **{acceptance_rate:.2f}%**
-        - Esto representa una caída respecto al objetivo del 12%
-        - Se necesita optimizar la estrategia de contacto
-        """)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Registros Filtrados", f"{filtered['count']:,}")
+        with col2:
+            st.metric("% del Total", f"{filtered['percentage']:.1f}%")
+        with col3:
+            st.metric("Registros Excluidos", f"{filtered['excluded']:,}")
         
-        st.info(f"""
-        **2. Perfil del Cliente Objetivo**
-        - Edad promedio: **{avg_age:.1f} años**
-        - Ocupación más frecuente: **{most_common_job}**
-        - Duración promedio de contacto: **{avg_duration:.0f} segundos**
-        """)
+        st.dataframe(filtered['preview'], use_container_width=True)
+    
+    elif analysis_type == "Comparación Múltiple":
+        st.markdown("#### 📊 Comparación de Múltiples Variables")
         
-        # Análisis de duration vs acceptance
-        duration_yes = df[df['y'] == 'yes']['duration'].mean()
-        duration_no = df[df['y'] == 'no']['duration'].mean()
+        selected_vars = st.multiselect(
+            "Selecciona variables numéricas a comparar:",
+            analyzer.numeric_cols,
+            default=analyzer.numeric_cols[:3]
+        )
         
-        st.warning(f"""
-        **3. Impacto de la Duración del Contacto**
-        - Duración promedio (aceptó): **{duration_yes:.0f} segundos**
-        - Duración promedio (rechazó): **{duration_no:.0f} segundos**
-        - Los contactos más largos tienen {((duration_yes/duration_no - 1) * 100):.1f}% más probabilidad de éxito
-        """)
+        if len(selected_vars) >= 2:
+            # Gráfico de dispersión
+            render_sample_note(analyzer)
+            image = analyzer.render_figure('plot_distribution_comparison', selected_vars, bins=30, figsize=(12, 8))
+            st.image(image, use_container_width=True)
+    
+    elif analysis_type == "Correlación Personalizada":
+        st.markdown("#### 📊 Matriz de Correlación Personalizada")
         
-        st.info(f"""
-        **4. Canal de Comunicación Óptimo**
-        - El canal **{df.groupby('contact')['y'].apply(lambda x: (x=='yes').sum()).idxmax()}** muestra mejor desempeño
-        - Se recomienda priorizar este canal en futuras campañas
-        """)
+        selected_vars = st.multiselect(
+            "Selecciona variables para análisis de correlación:",
+            analyzer.numeric_cols,
+            default=analyzer.numeric_cols[:5]
+        )
         
-        st.success(f"""
-        **5. Recomendaciones para Mejorar la Efectividad**
-        - Enfocarse en perfiles con mayor tasa de conversión
-        - Optimizar la duración de los contactos (target: >500 segundos)
-        - Priorizar canales de comunicación más efectivos
-        - Segmentar campañas según nivel educativo y ocupación
-        """)
+        if len(selected_vars) >= 2:
+            image = analyzer.render_figure('plot_correlation_heatmap', selected_vars, figsize=(10, 8))
+            st.image(image, use_container_width=True)
+            
+            st.markdown("---")
+            st.markdown("#### 📋 Tabla de Correlación")
+            corr_matrix = eda_engine.correlation(analyzer, selected_vars)
+            st.dataframe(corr_matrix.style.background_gradient(cmap='coolwarm', vmin=-1, vmax=1), 
+                       use_container_width=True)
+
+def render_key_findings(analyzer):
+    """
+    Ítem 10: Hallazgos clave del análisis
+    """
+    st.markdown("## 💡 Ítem 10: Hallazgos Clave del Análisis")
+    st.markdown("---")
+    
+    st.markdown("### 🎯 Resumen Ejecutivo del Análisis")
+    
+    findings = eda_engine.key_findings(analyzer)
+    acceptance_rate = findings['acceptance_rate']
+    avg_age = findings['avg_age']
+    avg_duration = findings['avg_duration']
+    most_common_job = findings['most_common_job']
+    
+    # Métricas principales
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("📈 Tasa de Aceptación", f"{acceptance_rate:.2f}%")
+    
+    with col2:
+        st.metric("👥 Edad Promedio", f"{avg_age:.1f} años")
+    
+    with col3:
+        st.metric("⏱️ Duración Promedio", f"{avg_duration:.0f} seg")
+    
+    with col4:
+        st.metric("💼 Ocupación Más Común", most_common_job)
+    
+    st.markdown("---")
+    
+    # Insights visuales
+    st.markdown("### 📊 Visualizaciones de Hallazgos Clave")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### 🎯 Tasa de Aceptación por Educación")
+        fig, ax = plt.subplots(figsize=(10, 6))
+        eda_engine.plot_acceptance_by_education(findings, ax)
+        show_figure(fig)
+        plt.close()
+    
+    with col2:
+        st.markdown("#### 📞 Tasa de Aceptación por Canal")
+        fig, ax = plt.subplots(figsize=(10, 6))
+        eda_engine.plot_acceptance_by_channel(findings, ax)
+        show_figure(fig)
+        plt.close()
+    
+    st.markdown("---")
+    
+    # Conclusiones principales
+    st.markdown("### 📝 Conclusiones Principales")
+    
+    st.success(f"""
+    **1. Tasa de Conversión General**
+    - La campaña actual tiene una tasa de aceptación del **{acceptance_rate:.2f}%**
+    - Esto representa una caída respecto al objetivo del 12%
+    - Se necesita optimizar la estrategia de contacto
+    """)
+    
+    st.info(f"""
+    **2. Perfil del Cliente Objetivo**
+    - Edad promedio: **{avg_age:.1f} años**
+    - Ocupación más frecuente: **{most_common_job}**
+    - Duración promedio de contacto: **{avg_duration:.0f} segundos**
+    """)
+    
+    # Análisis de duration vs acceptance
+    duration_yes = findings['duration_yes']
+    duration_no = findings['duration_no']
+    
+    st.warning(f"""
+    **3. Impacto de la Duración del Contacto**
+    - Duración promedio (aceptó): **{duration_yes:.0f} segundos**
+    - Duración promedio (rechazó): **{duration_no:.0f} segundos**
+    - Los contactos más largos tienen {findings['duration_lift_pct']:.1f}% más probabilidad de éxito
+    """)
+    
+    st.info(f"""
+    **4. Canal de Comunicación Óptimo**
+    - El canal **{findings['best_channel']}** muestra mejor desempeño
+    - Se recomienda priorizar este canal en futuras campañas
+    """)
+    
+    st.success(f"""
+    **5. Recomendaciones para Mejorar la Efectividad**
+    - Enfocarse en perfiles con mayor tasa de conversión
+    - Optimizar la duración de los contactos (target: >500 segundos)
+    - Priorizar canales de comunicación más efectivos
+    - Segmentar campañas según nivel educativo y ocupación
+    """)
+
+# Pestañas del EDA completo (una por ítem) y su función de renderizado
+EDA_SECTIONS = [
+    ("📋 Info General", render_general_info),
+    ("🔢 Variables", render_variable_classification),
+    ("📊 Estadísticas", render_descriptive_stats),
+    ("❌ Valores Faltantes", render_missing_values),
+    ("📈 Dist. Numéricas", render_numeric_distributions),
+    ("📊 Dist. Categóricas", render_categorical_analysis),
+    ("🔀 Bivariado Num-Cat", render_bivariate_numeric_categorical),
+    ("🔀 Bivariado Cat-Cat", render_bivariate_categorical),
+    ("⚙️ Análisis Dinámico", render_dynamic_analysis),
+    ("💡 Hallazgos Clave", render_key_findings)
+]
+
+# Pestañas disponibles en modo streaming (calculables desde agregados)
+STREAMING_EDA_SECTIONS = [
+    ("📋 Info General", render_general_info),
+    ("📊 Estadísticas", render_descriptive_stats),
+    ("❌ Valores Faltantes", render_missing_values),
+    ("📊 Dist. Categóricas", render_categorical_analysis),
+    ("💡 Hallazgos Clave", render_key_findings)
+]
+
+def render_sections(sections, analyzer, key):
+    """
+    Muestra las secciones en pestañas ejecutando solo la pestaña activa
+    
+    Con on_change='rerun' Streamlit registra la pestaña seleccionada; las
+    demás no se calculan hasta que el usuario las abre.
+    
+    Args:
+        sections: Lista de (etiqueta, función de renderizado)
+        analyzer: DataAnalyzer del dataset
+        key: Clave del widget de pestañas en session_state
+    """
+    tabs = st.tabs([label for label, _ in sections], key=key, on_change='rerun')
+    for tab, (label, render) in zip(tabs, sections):
+        if tab.open:
+            with tab, instrumentation.span(label, 'tab'):
+                render(analyzer)
+
+# =======================
+# MÓDULO 3: EDA COMPLETO
+# =======================
+# Este código reemplaza la función show_eda() en app.py
+
+def show_eda():
+    """
+    Módulo principal de Análisis Exploratorio de Datos con 10 ítems
+    """
+    st.markdown('<h1 class="main-header">📊 Análisis Exploratorio de Datos (EDA)</h1>', 
+                unsafe_allow_html=True)
+    
+    # Verificar si hay datos cargados
+    if 'data_loaded' not in st.session_state or not st.session_state['data_loaded']:
+        st.warning("⚠️ No hay datos cargados. Por favor, carga el dataset primero desde el menú 'Carga del Dataset'.")
+        return
+    
+    # Modo streaming: solo hay agregados, se muestran los análisis compatibles
+    if st.session_state.get('streaming_mode'):
+        show_streaming_eda(st.session_state['analyzer'])
+        return
+    
+    # Analizador persistente (compartido entre reruns y sesiones con el mismo dataset;
+    # propio de la sesión si se agregaron lotes)
+    analyzer = get_session_analyzer()
+    if analyzer is None:
+        return
+    
+    # Solo se ejecuta la pestaña activa
+    render_sections(EDA_SECTIONS, analyzer, key='eda_tab')
+
+def show_streaming_eda(analyzer):
+    """
+    EDA para datasets cargados por bloques (sin DataFrame en memoria)
+    """
+    st.info("🌊 **Modo streaming:** el dataset se analizó por bloques. Se muestran los análisis "
+            "que se calculan a partir de agregados (información general, estadísticas, "
+            "valores faltantes, variables categóricas y hallazgos clave).")
+    
+    render_sections(STREAMING_EDA_SECTIONS, analyzer, key='streaming_eda_tab')
 
 # =======================
 # MAIN - NAVEGACIÓN
@@ -862,6 +1116,30 @@ def main():
     if 'data_loaded' not in st.session_state:
         st.session_state['data_loaded'] = False
     
+    # Cada rerun mantiene viva la sesión; las inactivas liberan sus datasets
+    registry = get_dataset_registry()
+    registry.touch(get_session_id())
+    
+    # Traza del rerun (solo con EDA_PROFILE=1)
+    trace = instrumentation.start_trace('rerun', get_session_id())
+    try:
+        render_page(registry)
+    finally:
+        instrumentation.finish_trace(trace)
+    
+    # Al final, para incluir los datasets que la página acaba de cargar
+    render_registry_usage(registry)
+    if trace is not None:
+        render_performance_panel(trace)
+    
+    # Con la página ya enviada, lo que falta para el EDA se importa en segundo plano
+    warm_up(pd, data_loader, data_analyzer, eda_engine, plt, sns)
+
+def render_page(registry):
+    """
+    Barra lateral de navegación y módulo seleccionado
+    """
+    
     # Sidebar - Navegación
     st.sidebar.title("Navegación")
     st.sidebar.markdown("---")
@@ -872,15 +1150,19 @@ def main():
         "📊 Análisis Exploratorio (EDA)"
     ]
     
-    selection = st.sidebar.radio("Selecciona un módulo:", menu_options)
+    selection = st.sidebar.radio("Selecciona un módulo:", menu_options, key='selected_module')
     
     st.sidebar.markdown("---")
     st.sidebar.markdown("### Estado")
     
     if st.session_state['data_loaded']:
         st.sidebar.success("✅ Datos cargados")
-        if 'df' in st.session_state:
-            st.sidebar.info(f"📊 {st.session_state['df'].shape[0]:,} registros")
+        if st.session_state.get('streaming_mode'):
+            st.sidebar.info(f"📊 {st.session_state['analyzer'].get_basic_info()['shape'][0]:,} registros (streaming)")
+        else:
+            entry = registry.get(st.session_state['dataset_hash'])
+            if entry is not None:
+                st.sidebar.info(f"📊 {len(entry.df):,} registros")
     else:
         st.sidebar.warning("Sin datos cargados")
     
@@ -890,12 +1172,62 @@ def main():
     st.sidebar.write("Especialización Python for Analytics")
     
     # Renderizar módulo seleccionado
-    if selection == "🏠 Home":
-        show_home()
-    elif selection == "📂 Carga del Dataset":
-        show_data_loading()
-    elif selection == "📊 Análisis Exploratorio (EDA)":
-        show_eda()
+    with instrumentation.span(selection, 'page'):
+        if selection == "🏠 Home":
+            show_home()
+        elif selection == "📂 Carga del Dataset":
+            show_data_loading()
+        elif selection == "📊 Análisis Exploratorio (EDA)":
+            show_eda()
+
+def render_registry_usage(registry):
+    """
+    Memoria del servidor usada por los datasets de todas las sesiones
+    """
+    usage = registry.get_usage()
+    with st.sidebar.expander("🧠 Memoria del servidor"):
+        used_mb = usage['used_bytes'] / 1024**2
+        max_mb = usage['max_bytes'] / 1024**2
+        st.progress(min(usage['used_bytes'] / usage['max_bytes'], 1.0) if usage['max_bytes'] else 0.0,
+                    text=f"{used_mb:,.1f} de {max_mb:,.0f} MB")
+        st.caption(f"{len(usage['datasets'])} dataset(s) · {usage['sessions']} sesión(es) activa(s) · "
+                   f"{usage['evictions']} liberado(s) · {usage['analysis_evictions']} análisis descartado(s)")
+        if usage['datasets']:
+            st.dataframe(pd.DataFrame({
+                'Dataset': [item['content_hash'][:10] for item in usage['datasets']],
+                'Filas': [item['rows'] for item in usage['datasets']],
+                'Datos (MB)': [item['dataset_bytes'] / 1024**2 for item in usage['datasets']],
+                'Análisis (MB)': [item['analysis_bytes'] / 1024**2 for item in usage['datasets']],
+                'Sesiones': [item['sessions'] for item in usage['datasets']],
+                'Inactivo (s)': [round(item['idle_seconds']) for item in usage['datasets']]
+            }), use_container_width=True, hide_index=True)
+
+def render_performance_panel(trace):
+    """
+    Tiempos, memoria y cachés del último rerun con el historial de la sesión (EDA_PROFILE=1)
+    """
+    history = st.session_state.setdefault('perf_traces', [])
+    history.append(trace)
+    del history[:-instrumentation.TRACE_HISTORY]
+    
+    with st.sidebar.expander("⏱️ Rendimiento"):
+        st.caption(f"Último rerun: {trace.seconds * 1000:,.0f} ms · {len(trace.events)} tramos")
+        st.dataframe(trace.get_summary().head(15), use_container_width=True, hide_index=True)
+        
+        cache_summary = trace.get_cache_summary()
+        if len(cache_summary) > 0:
+            totals = cache_summary.groupby('Caché')[['Aciertos', 'Fallos']].sum()
+            st.caption(" · ".join(f"{cache}: {row['Aciertos']} aciertos, {row['Fallos']} fallos"
+                                  for cache, row in totals.iterrows()))
+            st.dataframe(cache_summary, use_container_width=True, hide_index=True)
+        
+        if len(history) > 1:
+            st.caption(f"Últimos {len(history)} reruns (ms)")
+            st.bar_chart(pd.Series([item.seconds * 1000 for item in history], name='ms'))
+        
+        st.download_button("📥 Exportar traza (Chrome/Perfetto)",
+                           data=instrumentation.export_chrome_trace(history),
+                           file_name="eda_trace.json", mime="application/json")
 
 # =======================
 # PUNTO DE ENTRADA
@@ -0,0 +1,84 @@
+"""
+Benchmark: parseo de CSV con pandas vs. PyArrow (con y sin esquema fijo)
+Proyecto: Bank Marketing EDA
+
+Uso:
+    python benchmarks/bench_csv.py --rows 1000000 --repeat 3
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_loader
+from data_loader import BANK_MARKETING_SCHEMA, CSV_SEPARATOR
+
+
+def make_csv(n_rows: int, seed: int = 0) -> bytes:
+    """
+    CSV sintético con las columnas, categorías y comillas de BankMarketing.csv
+
+    Como el archivo real, el encabezado y los textos van entre comillas.
+    """
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for column, spec in BANK_MARKETING_SCHEMA.items():
+        if isinstance(spec, list):
+            columns[column] = rng.choice(spec, n_rows)
+        elif spec.startswith('int'):
+            columns[column] = rng.integers(0, np.iinfo(spec).max, n_rows)
+        else:
+            columns[column] = np.round(rng.normal(0, 50, n_rows), 3)
+    return pd.DataFrame(columns).to_csv(sep=CSV_SEPARATOR, index=False,
+                                       quoting=csv.QUOTE_NONNUMERIC).encode()
+
+
+def run(data: bytes, backend: str, pinned: bool, repeat: int) -> dict:
+    """
+    Mide el parseo completo (incluida la compactación de tipos) con un backend
+    """
+    schema = BANK_MARKETING_SCHEMA if pinned else None
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _, report = data_loader.parse_csv(data, backend=backend, schema=schema)
+        timings.append(time.perf_counter() - start)
+    seconds = min(timings)
+    return {'backend': backend, 'schema_pinned': report['schema_pinned'], 'seconds': seconds,
+            'parse_seconds': report['parse_seconds'], 'mb_per_second': len(data) / 1024**2 / seconds}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3, help="Repeticiones (se reporta la mejor)")
+    parser.add_argument('--output', help="Archivo JSON de resultados (opcional)")
+    args = parser.parse_args()
+
+    data = make_csv(args.rows)
+    report = {'rows': args.rows, 'megabytes': len(data) / 1024**2, 'cpu_count': os.cpu_count(), 'results': []}
+    for backend, pinned in [('pandas', False), ('pyarrow', False), ('pyarrow', True)]:
+        result = run(data, backend, pinned, args.repeat)
+        if pinned and not result['schema_pinned']:
+            raise SystemExit("El esquema fijo no se aplicó al CSV con encabezado entre comillas")
+        report['results'].append(result)
+    baseline = report['results'][0]
+    print(f"{args.rows:,} filas, {report['megabytes']:.1f} MB ({os.cpu_count()} núcleos)")
+    for result in report['results']:
+        label = f"{result['backend']}{' + esquema' if result['schema_pinned'] else ''}"
+        print(f"{label:>18}: {result['seconds']:.3f}s | {result['mb_per_second']:.1f} MB/s | "
+              f"x{baseline['seconds'] / result['seconds']:.2f}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            json.dump(report, handle, indent=2)
+
+
+if __name__ == '__main__':
+    main()
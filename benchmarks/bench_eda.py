@@ -0,0 +1,332 @@
+"""
+Benchmark: DataAnalyzer, gráficos y pestañas del EDA sobre datos sintéticos
+Proyecto: Bank Marketing EDA
+
+Genera datasets con el esquema y las cardinalidades de BankMarketing.csv y
+mide la carga, cada método del analizador, cada gráfico plot_* y el
+renderizado sin navegador de cada pestaña de show_eda. Cada paso registra
+el tiempo en frío, el tiempo repetido (cachés calientes) y el pico de
+memoria residente, y el resultado se guarda en JSON para comparar corridas.
+
+Uso:
+    python benchmarks/bench_eda.py --rows 41188 1000000 10000000 50000000 --output eda.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+import warnings
+from typing import Callable, Dict, List
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_loader
+from data_analyzer import DataAnalyzer
+from data_loader import BANK_MARKETING_SCHEMA, CSV_SEPARATOR
+
+DEFAULT_ROWS = [41_188, 1_000_000, 10_000_000, 50_000_000]
+
+# Frecuencias aproximadas de las categorías en BankMarketing.csv (orden del esquema)
+CATEGORY_WEIGHTS = {
+    'job': [0.253, 0.225, 0.035, 0.026, 0.071, 0.042, 0.035, 0.096, 0.021, 0.164, 0.025, 0.008],
+    'marital': [0.112, 0.605, 0.281, 0.002],
+    'education': [0.101, 0.056, 0.147, 0.231, 0.0004, 0.127, 0.295, 0.042],
+    'default': [0.791, 0.209, 0.0001],
+    'housing': [0.452, 0.024, 0.524],
+    'loan': [0.824, 0.024, 0.152],
+    'contact': [0.635, 0.365],
+    'month': [0.064, 0.150, 0.004, 0.174, 0.129, 0.013, 0.334, 0.100, 0.017, 0.014],
+    'day_of_week': [0.190, 0.207, 0.209, 0.196, 0.198],
+    'poutcome': [0.103, 0.863, 0.033],
+    'y': [0.887, 0.113]
+}
+
+# Los indicadores macroeconómicos toman pocos valores distintos (uno por mes de campaña)
+INDICATOR_LEVELS = {
+    'emp.var.rate': [-3.4, -3.0, -2.9, -1.8, -1.7, -1.1, -0.2, -0.1, 1.1, 1.4],
+    'cons.price.idx': np.round(np.linspace(92.201, 94.767, 26), 3),
+    'cons.conf.idx': np.round(np.linspace(-50.8, -26.9, 26), 1),
+    'euribor3m': np.round(np.linspace(0.634, 5.045, 316), 3),
+    'nr.employed': [4963.6, 4991.6, 5008.7, 5017.5, 5023.5, 5076.2, 5099.1, 5176.3, 5191.0, 5195.8, 5228.1]
+}
+
+
+def make_frame(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    DataFrame sintético con las columnas, tipos y cardinalidades de BankMarketing.csv
+    """
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for column, spec in BANK_MARKETING_SCHEMA.items():
+        if isinstance(spec, list):
+            weights = np.asarray(CATEGORY_WEIGHTS[column])
+            codes = rng.choice(len(spec), n_rows, p=weights / weights.sum()).astype(np.int8)
+            columns[column] = pd.Categorical.from_codes(codes, categories=spec)
+        elif column in INDICATOR_LEVELS:
+            columns[column] = rng.choice(INDICATOR_LEVELS[column], n_rows)
+    columns['age'] = np.clip(rng.normal(40, 10.4, n_rows), 17, 98).astype(np.int8)
+    columns['duration'] = np.clip(rng.lognormal(5.2, 0.9, n_rows), 0, 4918).astype(np.int16)
+    columns['campaign'] = np.clip(rng.geometric(0.4, n_rows), 1, 56).astype(np.int8)
+    columns['pdays'] = np.where(rng.random(n_rows) < 0.963, 999, rng.integers(0, 28, n_rows)).astype(np.int16)
+    columns['previous'] = np.clip(rng.poisson(0.17, n_rows), 0, 7).astype(np.int8)
+    return pd.DataFrame({column: columns[column] for column in BANK_MARKETING_SCHEMA})
+
+
+def write_csv(df: pd.DataFrame, path: str):
+    """
+    Escribe el DataFrame como CSV separado por ';' (con el escritor multihilo de PyArrow)
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.cast(pa.schema([
+        pa.field(field.name, pa.string() if pa.types.is_dictionary(field.type) else field.type)
+        for field in table.schema
+    ]))
+    pa_csv.write_csv(table, path, pa_csv.WriteOptions(delimiter=CSV_SEPARATOR, quoting_style='needed'))
+
+
+def reset_peak_memory():
+    """
+    Reinicia el pico de memoria residente del proceso (Linux)
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as handle:
+            handle.write('5')
+    except OSError:
+        pass
+
+
+def _proc_status(field: str):
+    """
+    Campo de memoria de /proc/self/status en bytes (None si no está disponible)
+    """
+    try:
+        with open('/proc/self/status') as handle:
+            for line in handle:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def peak_memory() -> int:
+    """
+    Pico de memoria residente desde el último reinicio, en bytes
+    """
+    peak = _proc_status('VmHWM')
+    if peak is None:
+        # Sin /proc el pico es el de toda la vida del proceso (ru_maxrss está en KB en Linux)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return peak
+
+
+def measure(group: str, name: str, function: Callable, repeat: bool = True) -> Dict:
+    """
+    Mide una llamada en frío y, opcionalmente, una segunda con las cachés calientes
+
+    Returns:
+        Diccionario con el grupo, el nombre, los tiempos, la memoria residente
+        antes de la llamada, su pico durante la llamada en frío y el error (si hubo)
+    """
+    gc.collect()
+    reset_peak_memory()
+    result = {'group': group, 'name': name, 'seconds': None, 'warm_seconds': None,
+              'rss_before_bytes': _proc_status('VmRSS'), 'peak_rss_bytes': None, 'error': None}
+    try:
+        start = time.perf_counter()
+        function()
+        result['seconds'] = time.perf_counter() - start
+        result['peak_rss_bytes'] = peak_memory()
+        if repeat:
+            start = time.perf_counter()
+            function()
+            result['warm_seconds'] = time.perf_counter() - start
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def bench_load(path: str) -> List[Dict]:
+    """
+    Hash del archivo, load_data de la app (parseo + caché) y reapertura desde la caché en disco
+    """
+    import app
+
+    content_hash = data_loader.compute_file_hash(path)
+    results = [
+        measure('load', 'compute_file_hash', lambda: data_loader.compute_file_hash(path)),
+        # La segunda llamada la resuelve el registro compartido en memoria
+        measure('load', 'load_data', lambda: app.load_data(path, content_hash)),
+        measure('load', 'load_csv (caché en disco)', lambda: data_loader.load_csv(path))
+    ]
+    return results
+
+
+def bench_analyzer(analyzer: DataAnalyzer) -> List[Dict]:
+    """
+    Cada método de análisis en el orden en que los usa la app
+    """
+    numeric = 'duration'
+    categorical = 'job'
+    methods = [
+        ('profile', analyzer.profile),
+        ('get_basic_info', analyzer.get_basic_info),
+        ('get_memory_usage', analyzer.get_memory_usage),
+        ('get_preview', analyzer.get_preview),
+        ('get_variable_classification', analyzer.get_variable_classification),
+        ('get_descriptive_stats', analyzer.get_descriptive_stats),
+        ('get_summary_statistics', lambda: analyzer.get_summary_statistics(numeric)),
+        ('get_missing_values_analysis', analyzer.get_missing_values_analysis),
+        ('get_value_counts', lambda: analyzer.get_value_counts(categorical)),
+        ('get_crosstab', lambda: analyzer.get_crosstab(categorical, 'y')),
+        ('contingency', analyzer.contingency),
+        ('get_histogram', lambda: analyzer.get_histogram(numeric)),
+        ('prepare_histograms', analyzer.prepare_histograms),
+        ('get_sample', analyzer.get_sample),
+        ('get_plot_histogram', lambda: analyzer.get_plot_histogram(numeric)),
+        ('get_group_stats', lambda: analyzer.get_group_stats(numeric, categorical)),
+        ('get_sorted_index', lambda: analyzer.get_sorted_index(numeric)),
+        ('filter_range', lambda: analyzer.filter_range(numeric, 100, 500)),
+        ('gram', analyzer.gram),
+        ('get_correlation_matrix', analyzer.get_correlation_matrix),
+        ('get_target_group_mean', lambda: analyzer.get_target_group_mean(numeric, 'yes')),
+        ('get_key_findings', analyzer.get_key_findings)
+    ]
+    return [measure('analyzer', name, method) for name, method in methods]
+
+
+def bench_plots(analyzer: DataAnalyzer) -> List[Dict]:
+    """
+    Cada gráfico plot_* renderizado a PNG (la repetición sale de la caché de figuras)
+    """
+    plots = [
+        ('plot_numeric_distribution', ('duration',), {}),
+        ('plot_distribution_comparison', (['age', 'duration', 'campaign'],), {'bins': 30}),
+        ('plot_categorical_distribution', ('job',), {}),
+        ('plot_bivariate_numeric_categorical', ('duration', 'job'), {'figsize': (14, 6)}),
+        ('plot_categorical_crosstab', ('job', 'y'), {'figsize': (12, 8)}),
+        ('plot_correlation_heatmap', (), {'figsize': (10, 8)})
+    ]
+    return [measure('plot', plot, lambda plot=plot, args=args, kwargs=kwargs:
+                    analyzer.render_figure(plot, *args, **kwargs))
+            for plot, args, kwargs in plots]
+
+
+def bench_app(content_hash: str) -> List[Dict]:
+    """
+    Renderizado sin navegador (AppTest) de cada pestaña de show_eda
+    """
+    from streamlit.testing.v1 import AppTest
+    import app
+
+    app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app.py')
+    at = AppTest.from_file(app_path, default_timeout=3600)
+    at.session_state['dataset_hash'] = content_hash
+    at.session_state['streaming_mode'] = False
+    at.session_state['data_loaded'] = True
+    at.run()
+    at.sidebar.radio[0].set_value("📊 Análisis Exploratorio (EDA)")
+
+    def render(label: str = None):
+        if label is not None:
+            at.session_state['eda_tab'] = label
+        at.run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].value)
+
+    results = [measure('app', 'show_eda (primera visita)', render, repeat=False)]
+    for label, _ in app.EDA_SECTIONS:
+        results.append(measure('app', label, lambda label=label: render(label)))
+    return results
+
+
+def run(n_rows: int, csv_max_rows: int, include_app: bool, workdir: str) -> Dict:
+    """
+    Todas las mediciones para un tamaño de dataset
+    """
+    df = make_frame(n_rows)
+    report = {'rows': n_rows, 'dataset_bytes': int(df.memory_usage(deep=True).sum()), 'results': []}
+    if n_rows <= csv_max_rows:
+        path = os.path.join(workdir, f'bank_{n_rows}.csv')
+        write_csv(df, path)
+        report['csv_bytes'] = os.path.getsize(path)
+        del df
+        report['results'].extend(bench_load(path))
+        df, load_info = data_loader.load_csv(path)
+        content_hash = load_info['content_hash']
+        os.remove(path)
+    else:
+        # Sin CSV (ocuparía varios GB): el dataset se escribe directo en la caché columnar
+        content_hash = f'synthetic-{n_rows}'
+        data_loader.write_cached_dataset(content_hash, df)
+        del df
+        df, _ = data_loader.load_cached_dataset(content_hash)
+
+    import app
+    analyzer = DataAnalyzer(df, fingerprint=content_hash, approximate=n_rows >= app.APPROXIMATE_MIN_ROWS)
+    report['results'].extend(bench_analyzer(analyzer))
+    report['results'].extend(bench_plots(analyzer))
+    del analyzer
+    if include_app:
+        report['results'].extend(bench_app(content_hash))
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS)
+    parser.add_argument('--csv-max-rows', type=int, default=10_000_000,
+                        help="Tamaño máximo con el que se mide la carga desde CSV")
+    parser.add_argument('--no-app', action='store_true', help="No renderizar las pestañas de la app")
+    parser.add_argument('--output', help="Archivo JSON de resultados (opcional)")
+    args = parser.parse_args()
+
+    # Sin avisos de Streamlit fuera del servidor ni de deprecaciones en la salida
+    warnings.filterwarnings('ignore')
+    import streamlit as st
+    import streamlit.logger
+    st.config.set_option('logger.level', 'error')
+    streamlit.logger.set_log_level('error')
+
+    report = {
+        'benchmark': 'eda',
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'versions': {'pandas': pd.__version__, 'numpy': np.__version__, 'pyarrow': pa.__version__},
+        'cpu_count': os.cpu_count(),
+        'sizes': []
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        # Caché propia y sin límite: los datasets grandes no desplazan la caché de la app
+        data_loader.CACHE_DIR = os.path.join(workdir, 'cache')
+        data_loader.CACHE_MAX_BYTES = sys.maxsize
+        for n_rows in args.rows:
+            size = run(n_rows, args.csv_max_rows, not args.no_app, workdir)
+            report['sizes'].append(size)
+            print(f"\n{n_rows:,} filas ({size['dataset_bytes'] / 1024**2:.1f} MB en memoria)")
+            for result in size['results']:
+                if result['error'] is not None:
+                    print(f"  {result['group']:>8} | {result['name']:<34} | ERROR {result['error']}")
+                    continue
+                warm = f"{result['warm_seconds']:.3f}s" if result['warm_seconds'] is not None else '-'
+                growth = (result['peak_rss_bytes'] - (result['rss_before_bytes'] or result['peak_rss_bytes'])) / 1024**2
+                print(f"  {result['group']:>8} | {result['name']:<34} | {result['seconds']:8.3f}s | "
+                      f"repetido {warm:>8} | pico {result['peak_rss_bytes'] / 1024**2:8.1f} MB (+{growth:.1f})")
+            gc.collect()
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            json.dump(report, handle, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: perfilado de columnas secuencial vs. en paralelo
+Proyecto: Bank Marketing EDA
+
+Uso:
+    python benchmarks/bench_profiling.py --rows 1000000 --columns 200 --jobs 1 2 4 8
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_analyzer import DataAnalyzer
+
+
+def make_frame(n_rows: int, n_columns: int, seed: int = 0) -> pd.DataFrame:
+    """
+    DataFrame sintético ancho: indicadores numéricos y algunas categóricas
+    """
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for i in range(n_columns):
+        # Mezcla de columnas continuas y de pocos valores distintos
+        if i % 4 == 0:
+            columns[f'indicator_{i}'] = rng.integers(0, 100, n_rows).astype(np.int16)
+        else:
+            columns[f'indicator_{i}'] = np.round(rng.normal(i, 1 + i % 7, n_rows), 3)
+    columns['segment'] = pd.Categorical(rng.choice(['a', 'b', 'c', 'd'], n_rows))
+    columns['y'] = pd.Categorical(rng.choice(['no', 'yes'], n_rows, p=[0.89, 0.11]))
+    return pd.DataFrame(columns)
+
+
+def run(df: pd.DataFrame, n_jobs: int) -> dict:
+    """
+    Mide el perfilado y la preparación de histogramas con n_jobs hilos
+    """
+    analyzer = DataAnalyzer(df, fingerprint='benchmark', n_jobs=n_jobs)
+    start = time.perf_counter()
+    analyzer.profile()
+    profile_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    analyzer.prepare_histograms()
+    histogram_seconds = time.perf_counter() - start
+    return {'n_jobs': n_jobs, 'profile_seconds': profile_seconds, 'histogram_seconds': histogram_seconds}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--columns', type=int, default=100, help="Columnas numéricas")
+    parser.add_argument('--jobs', type=int, nargs='+', default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument('--output', help="Archivo JSON de resultados (opcional)")
+    args = parser.parse_args()
+
+    df = make_frame(args.rows, args.columns)
+    report = {'rows': args.rows, 'columns': df.shape[1], 'cpu_count': os.cpu_count(), 'results': []}
+    for n_jobs in sorted(set(args.jobs)):
+        report['results'].append(run(df, n_jobs))
+    baseline = report['results'][0]
+    print(f"{args.rows:,} filas x {df.shape[1]} columnas ({os.cpu_count()} núcleos)")
+    for result in report['results']:
+        total = result['profile_seconds'] + result['histogram_seconds']
+        speedup = (baseline['profile_seconds'] + baseline['histogram_seconds']) / total if total > 0 else 0
+        print(f"{result['n_jobs']:>4} hilo(s): perfil {result['profile_seconds']:.3f}s | "
+              f"histogramas {result['histogram_seconds']:.3f}s | x{speedup:.2f}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            json.dump(report, handle, indent=2)
+
+
+if __name__ == '__main__':
+    main()
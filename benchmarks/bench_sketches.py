@@ -0,0 +1,122 @@
+"""
+Benchmark: estadísticas exactas vs. sketches aproximados
+Proyecto: Bank Marketing EDA
+
+Uso:
+    python benchmarks/bench_sketches.py --rows 10000000 --output sketches.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sketches import HyperLogLog, KLLSketch, DEFAULT_QUANTILE_ERROR, DEFAULT_DISTINCT_ERROR
+
+QUANTILES = (0.25, 0.5, 0.75)
+
+
+def make_column(n_rows: int, seed: int = 0) -> pd.Series:
+    """
+    Columna sintética con cola larga y muchos valores distintos
+    """
+    rng = np.random.default_rng(seed)
+    return pd.Series(np.round(rng.lognormal(5, 1, n_rows), 2), name='duration')
+
+
+def timed(function, *args):
+    """
+    Ejecuta una función y retorna (resultado, segundos)
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def exact_stats(series: pd.Series):
+    return series.quantile(list(QUANTILES)).to_dict(), series.nunique()
+
+
+def approximate_stats(series: pd.Series, quantile_error: float, distinct_error: float, n_chunks: int = 1):
+    """
+    Construye los sketches por bloques y los combina (n_chunks=1 = un solo bloque)
+    """
+    quantile_sketch = KLLSketch(quantile_error, seed=0)
+    distinct_sketch = HyperLogLog(distinct_error)
+    for chunk in np.array_split(series.to_numpy(), n_chunks):
+        chunk_quantiles = KLLSketch(quantile_error, seed=0)
+        chunk_quantiles.update(chunk)
+        quantile_sketch.merge(chunk_quantiles)
+        chunk_distinct = HyperLogLog(distinct_error)
+        chunk_distinct.update(chunk)
+        distinct_sketch.merge(chunk_distinct)
+    return quantile_sketch.quantiles(QUANTILES), distinct_sketch.estimate()
+
+
+def rank_error(ordered: np.ndarray, q: float, value: float) -> float:
+    """
+    Diferencia entre el rango real del valor estimado y el rango pedido
+    """
+    low = np.searchsorted(ordered, value, side='left') / len(ordered)
+    high = np.searchsorted(ordered, value, side='right') / len(ordered)
+    # Con valores repetidos, cualquier rango dentro de [low, high] es correcto
+    return float(max(0.0, low - q, q - high))
+
+
+def run(n_rows: int, quantile_error: float, distinct_error: float, n_chunks: int) -> dict:
+    """
+    Mide latencia y precisión de ambos métodos sobre una columna sintética
+    """
+    series = make_column(n_rows)
+    ordered = np.sort(series.to_numpy())
+    (exact_quantiles, exact_unique), exact_seconds = timed(exact_stats, series)
+    report = {
+        'rows': n_rows,
+        'quantile_error': quantile_error,
+        'distinct_error': distinct_error,
+        'exact_seconds': exact_seconds,
+        'exact_unique': int(exact_unique),
+        'approximate': []
+    }
+    for chunks in sorted({1, n_chunks}):
+        (quantiles, unique), seconds = timed(approximate_stats, series, quantile_error, distinct_error, chunks)
+        report['approximate'].append({
+            'chunks': chunks,
+            'seconds': seconds,
+            'speedup': exact_seconds / seconds if seconds > 0 else None,
+            'max_rank_error': max(rank_error(ordered, q, quantiles[q]) for q in QUANTILES),
+            'max_value_error': max(abs(quantiles[q] - exact_quantiles[q]) for q in QUANTILES),
+            'unique_estimate': unique,
+            'unique_relative_error': abs(unique - exact_unique) / exact_unique
+        })
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[41_188, 1_000_000])
+    parser.add_argument('--quantile-error', type=float, default=DEFAULT_QUANTILE_ERROR)
+    parser.add_argument('--distinct-error', type=float, default=DEFAULT_DISTINCT_ERROR)
+    parser.add_argument('--chunks', type=int, default=16, help="Bloques para medir sketches combinados")
+    parser.add_argument('--output', help="Archivo JSON de resultados (opcional)")
+    args = parser.parse_args()
+
+    reports = [run(n, args.quantile_error, args.distinct_error, args.chunks) for n in args.rows]
+    for report in reports:
+        print(f"{report['rows']:>12,} filas | exacto {report['exact_seconds']:.3f}s")
+        for result in report['approximate']:
+            print(f"{'':>12}   {result['chunks']:>3} bloque(s): {result['seconds']:.3f}s "
+                  f"(x{result['speedup']:.1f}) | error de rango {result['max_rank_error']:.4f} | "
+                  f"error únicos {result['unique_relative_error']:.2%}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            json.dump(reports, handle, indent=2)
+
+
+if __name__ == '__main__':
+    main()
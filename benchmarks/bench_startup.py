@@ -0,0 +1,93 @@
+"""
+Benchmark: arranque en frío (imports y primer render de las páginas sin gráficos)
+Proyecto: Bank Marketing EDA
+
+Cada medición corre en un proceso nuevo, como un worker recién iniciado:
+el tiempo de import de cada módulo pesado y el tiempo del primer rerun de
+las páginas Home y Carga del Dataset (sin el import de Streamlit, que el
+servidor ya tiene cargado).
+
+Uso:
+    python benchmarks/bench_startup.py --repeat 5 --output startup.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = ['pandas', 'pyarrow.csv', 'matplotlib.pyplot', 'seaborn',
+           'data_loader', 'data_analyzer', 'eda_engine']
+
+PAGES = ['🏠 Home', '📂 Carga del Dataset']
+
+IMPORT_SCRIPT = """
+import sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+RENDER_SCRIPT = """
+import sys, time, warnings
+warnings.filterwarnings('ignore')
+import streamlit as st
+import streamlit.logger
+st.config.set_option('logger.level', 'error')
+streamlit.logger.set_log_level('error')
+from streamlit.testing.v1 import AppTest
+sys.path.insert(0, {root!r})
+at = AppTest.from_file({app!r}, default_timeout=600)
+at.session_state['selected_module'] = {page!r}
+start = time.perf_counter()
+at.run()
+seconds = time.perf_counter() - start
+if at.exception:
+    raise SystemExit(at.exception[0].value)
+print(seconds)
+"""
+
+
+def run_script(script: str) -> float:
+    """
+    Ejecuta un script en un intérprete nuevo y retorna el tiempo que imprime
+    """
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+def measure(script: str, repeat: int) -> dict:
+    """
+    Mejor tiempo y mediana de varias ejecuciones en procesos nuevos
+    """
+    timings = sorted(run_script(script) for _ in range(repeat))
+    return {'seconds': timings[0], 'median_seconds': timings[len(timings) // 2]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help="Procesos por medición")
+    parser.add_argument('--output', help="Archivo JSON de resultados (opcional)")
+    args = parser.parse_args()
+
+    report = {'python': sys.version.split()[0], 'cpu_count': os.cpu_count(), 'imports': [], 'pages': []}
+    for module in MODULES:
+        result = measure(IMPORT_SCRIPT.format(root=ROOT, module=module), args.repeat)
+        report['imports'].append(dict(result, module=module))
+        print(f"import {module:<20} {result['seconds']:.3f}s (mediana {result['median_seconds']:.3f}s)")
+    for page in PAGES:
+        script = RENDER_SCRIPT.format(root=ROOT, app=os.path.join(ROOT, 'app.py'), page=page)
+        result = measure(script, args.repeat)
+        report['pages'].append(dict(result, page=page))
+        print(f"primer render {page:<22} {result['seconds']:.3f}s (mediana {result['median_seconds']:.3f}s)")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            json.dump(report, handle, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
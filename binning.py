@@ -0,0 +1,278 @@
+"""
+Histogramas y KDE precalculados por columna
+Proyecto: Bank Marketing EDA
+"""
+
+import functools
+import numpy as np
+import pandas as pd
+from partitions import map_row_partitions
+
+# Límite de barras del histograma automático (la regla de Freedman-Diaconis
+# produce demasiados bins en datasets muy grandes)
+MAX_HISTOGRAM_BINS = 200
+
+# Puntos de la malla donde se evalúa la KDE (mismo valor por defecto que seaborn)
+KDE_GRID_SIZE = 200
+
+# Resolución de la malla de binning lineal usada para la convolución por FFT
+KDE_BINNING_SIZE = 2048
+
+# Radio del kernel gaussiano en anchos de banda (el resto es despreciable)
+KDE_KERNEL_RADIUS = 4.0
+
+
+class ColumnHistogram:
+    """
+    Histograma y KDE de una columna, listos para graficar sin volver a los datos
+
+    Conserva los pesos del binning lineal de la KDE para poder sumar filas
+    nuevas (update_histogram) sin recorrer las anteriores.
+    """
+
+    __slots__ = ('name', 'count', 'counts', 'edges', 'kde_x', 'kde_density',
+                 'kde_weights', 'kde_low', 'kde_delta')
+
+    def __init__(self, name: str, count: int, counts: np.ndarray, edges: np.ndarray,
+                 kde_x: np.ndarray = None, kde_density: np.ndarray = None):
+        """
+        Args:
+            name: Nombre de la columna
+            count: Número de valores no nulos
+            counts: Frecuencia por bin
+            edges: Bordes de los bins (len(counts) + 1)
+            kde_x: Malla donde se evaluó la KDE
+            kde_density: Densidad estimada en cada punto de la malla
+        """
+        self.name = name
+        self.count = count
+        self.counts = counts
+        self.edges = edges
+        self.kde_x = kde_x
+        self.kde_density = kde_density
+        self.kde_weights = None
+        self.kde_low = None
+        self.kde_delta = None
+
+    @property
+    def widths(self) -> np.ndarray:
+        return np.diff(self.edges)
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (self.counts, self.edges, self.kde_x, self.kde_density, self.kde_weights)
+        return int(sum(array.nbytes for array in arrays if array is not None))
+
+    def scaled_kde(self) -> np.ndarray:
+        """
+        KDE escalada a frecuencias para superponerla al histograma
+
+        Returns:
+            Densidad multiplicada por el área total del histograma
+        """
+        return self.kde_density * (self.counts * self.widths).sum()
+
+
+def auto_bin_count(count: int, minimum: float, maximum: float, q1: float, q3: float,
+                   max_bins: int = MAX_HISTOGRAM_BINS) -> int:
+    """
+    Número de bins con el criterio 'auto' de numpy a partir de estadísticas del perfil
+
+    Usa el menor ancho entre Freedman-Diaconis y Sturges, sin recorrer los datos.
+
+    Args:
+        count: Número de valores no nulos
+        minimum: Valor mínimo
+        maximum: Valor máximo
+        q1: Primer cuartil
+        q3: Tercer cuartil
+        max_bins: Máximo de bins
+
+    Returns:
+        Número de bins
+    """
+    data_range = maximum - minimum
+    if count == 0 or data_range <= 0:
+        return 1
+    sturges = data_range / (np.log2(count) + 1.0)
+    freedman_diaconis = 2.0 * (q3 - q1) * count ** (-1.0 / 3.0)
+    width = min(freedman_diaconis, sturges) if freedman_diaconis > 0 else sturges
+    return int(np.clip(np.ceil(data_range / width), 1, max_bins))
+
+
+def compute_histogram(series: pd.Series, bins: int, minimum: float = None, maximum: float = None,
+                      kde: bool = True, grid_size: int = KDE_GRID_SIZE, n_workers: int = 1,
+                      weights: np.ndarray = None) -> ColumnHistogram:
+    """
+    Calcula histograma (bins uniformes) y KDE binned de una columna numérica
+
+    Los conteos y los pesos del binning lineal son sumas por fila, así que
+    con n_workers > 1 se calculan por rangos de filas en procesos separados.
+
+    Args:
+        series: Columna numérica
+        bins: Número de bins
+        minimum: Mínimo de la columna (None = se calcula)
+        maximum: Máximo de la columna (None = se calcula)
+        kde: Si True, calcula también la KDE
+        grid_size: Puntos de evaluación de la KDE
+        n_workers: Procesos para repartir las filas
+        weights: Peso de cada fila (por ejemplo, en una muestra); las
+            frecuencias y la KDE pasan a ser sumas de pesos
+
+    Returns:
+        Histograma de la columna
+    """
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = ~np.isnan(values)
+    values = values[valid]
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np.float64)[valid]
+    count = len(values)
+    if count == 0:
+        return ColumnHistogram(series.name, 0, np.zeros(0, dtype=np.int64), np.zeros(1))
+    if minimum is None or maximum is None:
+        minimum, maximum = values.min(), values.max()
+    if minimum == maximum:
+        # Columna constante: un bin centrado en el valor (como np.histogram)
+        minimum, maximum = minimum - 0.5, maximum + 0.5
+
+    edges = np.linspace(minimum, maximum, bins + 1)
+    histogram = ColumnHistogram(series.name, count, None, edges)
+    bandwidth = scott_bandwidth(values) if kde and count > 1 else 0.0
+    if bandwidth > 0:
+        # La malla se extiende más allá de los datos para que la convolución no se solape
+        padding = KDE_KERNEL_RADIUS * bandwidth
+        low, high = values.min() - padding, values.max() + padding
+        histogram.kde_low = low
+        histogram.kde_delta = (high - low) / (KDE_BINNING_SIZE - 1)
+    if weights is None:
+        partials = map_row_partitions(functools.partial(bin_partition, edges=edges, low=histogram.kde_low,
+                                                        delta=histogram.kde_delta), [values], n_workers)
+    else:
+        partials = [bin_partition(values, edges, histogram.kde_low, histogram.kde_delta, weights=weights)]
+    histogram.counts = functools.reduce(np.add, [counts for counts, _ in partials])
+    if bandwidth > 0:
+        histogram.kde_weights = functools.reduce(np.add, [weights for _, weights in partials])
+    if kde and count > 1:
+        histogram.kde_x = np.linspace(minimum, maximum, grid_size)
+        histogram.kde_density = _smooth(histogram, bandwidth)
+    return histogram
+
+
+def bin_partition(values: np.ndarray, edges: np.ndarray, low: float = None,
+                  delta: float = None, size: int = KDE_BINNING_SIZE, weights: np.ndarray = None):
+    """
+    Conteos del histograma y pesos del binning lineal de un rango de filas
+
+    Args:
+        values: Valores sin nulos
+        edges: Bordes de los bins
+        low: Primer punto de la malla de la KDE (None = sin KDE)
+        delta: Separación entre puntos de la malla
+        size: Número de puntos de la malla
+        weights: Peso de cada valor (None = todos 1)
+
+    Returns:
+        Tupla (conteos, pesos o None)
+    """
+    # bins + range usa el cálculo directo de numpy para bins uniformes (sin ordenar)
+    counts = np.histogram(values, bins=len(edges) - 1, range=(edges[0], edges[-1]), weights=weights)[0]
+    binned = linear_binning(values, low, delta, size, weights) if low is not None else None
+    return counts, binned
+
+
+def update_histogram(histogram: ColumnHistogram, series: pd.Series, std: float) -> ColumnHistogram:
+    """
+    Suma filas nuevas a un histograma sin recorrer las anteriores
+
+    Los bins y la malla de la KDE se mantienen; la KDE se vuelve a suavizar
+    con el ancho de banda del total de filas.
+
+    Args:
+        histogram: Histograma de las filas existentes
+        series: Filas nuevas de la columna
+        std: Desviación estándar de todas las filas (existentes y nuevas)
+
+    Returns:
+        Histograma combinado (objeto nuevo), o None si algún valor nuevo cae
+        fuera de los bins y hay que recalcularlo
+    """
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return histogram
+    if histogram.count == 0 or values.min() < histogram.edges[0] or values.max() > histogram.edges[-1]:
+        return None
+    count = histogram.count + len(values)
+    counts = histogram.counts + bin_partition(values, histogram.edges)[0]
+    updated = ColumnHistogram(histogram.name, count, counts, histogram.edges, histogram.kde_x)
+    if histogram.kde_x is None:
+        return updated
+    if histogram.kde_weights is None:
+        return None
+    high = histogram.kde_low + histogram.kde_delta * (len(histogram.kde_weights) - 1)
+    if values.min() < histogram.kde_low or values.max() > high:
+        return None
+    updated.kde_low = histogram.kde_low
+    updated.kde_delta = histogram.kde_delta
+    updated.kde_weights = histogram.kde_weights + linear_binning(
+        values, histogram.kde_low, histogram.kde_delta, len(histogram.kde_weights))
+    updated.kde_density = _smooth(updated, std * count ** (-1.0 / 5.0))
+    return updated
+
+
+def scott_bandwidth(values: np.ndarray) -> float:
+    """
+    Ancho de banda por la regla de Scott (el de scipy.stats.gaussian_kde)
+    """
+    return float(values.std(ddof=1) * len(values) ** (-1.0 / 5.0))
+
+
+def linear_binning(values: np.ndarray, low: float, delta: float, size: int,
+                   weights: np.ndarray = None) -> np.ndarray:
+    """
+    Reparte cada valor linealmente entre los dos puntos más cercanos de una malla
+
+    Args:
+        values: Valores sin nulos (dentro de la malla)
+        low: Primer punto de la malla
+        delta: Separación entre puntos
+        size: Número de puntos
+        weights: Peso de cada valor (None = todos 1)
+
+    Returns:
+        Peso acumulado en cada punto (la suma es el número de valores o de pesos)
+    """
+    position = (values - low) / delta
+    index = np.clip(np.floor(position).astype(np.int64), 0, size - 2)
+    fraction = position - index
+    lower = 1.0 - fraction
+    if weights is not None:
+        lower *= weights
+        fraction *= weights
+    return (np.bincount(index, weights=lower, minlength=size) +
+            np.bincount(index + 1, weights=fraction, minlength=size))
+
+
+def _smooth(histogram: ColumnHistogram, bandwidth: float) -> np.ndarray:
+    """
+    KDE gaussiana aproximada por convolución (FFT) de los pesos del binning lineal
+
+    El costo es O(n) para el binning y O(m log m) para la convolución, en
+    lugar de O(n · puntos) de la KDE exacta.
+    """
+    grid = histogram.kde_x
+    if histogram.kde_weights is None or not bandwidth > 0:
+        return np.zeros(len(grid))
+    weights = histogram.kde_weights
+    size = len(weights)
+    delta = histogram.kde_delta
+    radius = min(size - 1, int(np.ceil(KDE_KERNEL_RADIUS * bandwidth / delta)))
+    offsets = np.arange(-radius, radius + 1) * delta
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+    fft_size = 1 << int(np.ceil(np.log2(size + len(kernel))))
+    smoothed = np.fft.irfft(np.fft.rfft(weights, fft_size) * np.fft.rfft(kernel, fft_size), fft_size)
+    density = smoothed[radius:radius + size] / weights.sum()
+    binning_grid = histogram.kde_low + np.arange(size) * delta
+    return np.maximum(np.interp(grid, binning_grid, density), 0.0)
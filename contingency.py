@@ -0,0 +1,221 @@
+"""
+Tablas de contingencia precalculadas para pares de variables categóricas
+Proyecto: Bank Marketing EDA
+"""
+
+import functools
+import itertools
+import threading
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Tuple
+from grouping import factorize_groups, labels_index
+from partitions import map_row_partitions
+
+
+def normalize_table(table: pd.DataFrame, normalize) -> pd.DataFrame:
+    """
+    Normaliza una tabla de frecuencias igual que pd.crosstab
+
+    Args:
+        table: Tabla de frecuencias
+        normalize: False, True/'all', 'index' o 'columns'
+
+    Returns:
+        Tabla normalizada (la misma tabla si normalize es False)
+    """
+    if normalize is False or normalize is None:
+        return table
+    if normalize is True or normalize == 'all':
+        return table / table.values.sum()
+    if normalize == 'index':
+        return table.div(table.sum(axis=1), axis=0)
+    if normalize == 'columns':
+        return table.div(table.sum(axis=0), axis=1)
+    raise ValueError(f"Valor de normalize no válido: {normalize}")
+
+
+class ContingencyCube:
+    """
+    Conteos conjuntos de todos los pares de columnas categóricas
+
+    Cada columna se factoriza una sola vez; la tabla de un par es un
+    np.bincount sobre códigos combinados (fila * n_columnas + columna).
+    Se guarda una matriz por par no ordenado y el par inverso es su
+    transpuesta, así que cualquier tabla cruzada o normalización es una
+    vista de las matrices precalculadas. Con n_workers > 1, los conteos de
+    cada par se reparten por rangos de filas entre procesos y se suman.
+    """
+
+    def __init__(self, df: pd.DataFrame, columns: List[str], n_workers: int = 1):
+        """
+        Args:
+            df: DataFrame con las columnas categóricas
+            columns: Columnas categóricas a cruzar
+            n_workers: Procesos para contar los pares por rangos de filas
+        """
+        self.columns = list(columns)
+        self.n_workers = n_workers
+        self._codes = {}
+        self._labels = {}
+        self._dtypes = {}
+        for column in self.columns:
+            codes, labels = factorize_groups(df[column])
+            self._codes[column] = codes
+            self._labels[column] = labels
+            self._dtypes[column] = df[column].dtype
+        self._tables: Dict[Tuple[str, str], np.ndarray] = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def pairs(self) -> List[Tuple[str, str]]:
+        """
+        Pares no ordenados de columnas (en el orden de columns)
+        """
+        return list(itertools.combinations(self.columns, 2))
+
+    @property
+    def is_complete(self) -> bool:
+        return len(self._tables) == len(self.pairs)
+
+    @property
+    def nbytes(self) -> int:
+        return int(sum(table.nbytes for table in self._tables.values()) +
+                   sum(codes.nbytes for codes in self._codes.values()))
+
+    def build(self, background: bool = False):
+        """
+        Calcula las tablas de todos los pares
+
+        Args:
+            background: Si True, las calcula en un hilo y retorna de inmediato;
+                los pares pedidos antes de terminar se calculan al vuelo
+        """
+        if not background:
+            for col1, col2 in self.pairs:
+                self._pair_counts(col1, col2)
+            return
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self.build, name='contingency-cube', daemon=True)
+            self._thread.start()
+
+    def _pair_counts(self, col1: str, col2: str) -> np.ndarray:
+        """
+        Matriz de conteos del par (col1, col2) en el orden en que se guarda
+        """
+        key = (col1, col2)
+        table = self._tables.get(key)
+        if table is not None:
+            return table
+        with self._lock:
+            table = self._tables.get(key)
+            if table is None:
+                n1, n2 = len(self._labels[col1]), len(self._labels[col2])
+                partials = map_row_partitions(functools.partial(pair_counts, n1=n1, n2=n2),
+                                              [self._codes[col1], self._codes[col2]], self.n_workers)
+                table = functools.reduce(np.add, partials)
+                self._tables[key] = table
+        return table
+
+    def counts(self, col1: str, col2: str) -> np.ndarray:
+        """
+        Matriz de conteos (categorías de col1 x categorías de col2, incluidas las no observadas)
+
+        Args:
+            col1: Variable de las filas
+            col2: Variable de las columnas
+
+        Returns:
+            Matriz de enteros (vista; no modificar)
+        """
+        if col1 == col2:
+            raise ValueError("Se requieren dos variables diferentes")
+        if self.columns.index(col1) < self.columns.index(col2):
+            return self._pair_counts(col1, col2)
+        return self._pair_counts(col2, col1).T
+
+    def appended(self, batch: pd.DataFrame, df: pd.DataFrame) -> 'ContingencyCube':
+        """
+        Cubo con las filas de un lote nuevo sumadas, sin modificar el actual
+
+        Las tablas ya calculadas se reubican según las etiquetas nuevas y se
+        les suma el bincount del lote, por lo que el costo depende del lote
+        (y del número de categorías), no del historial.
+
+        Args:
+            batch: Filas nuevas
+            df: DataFrame completo (filas existentes y el lote, ya concatenado)
+
+        Returns:
+            Cubo actualizado
+        """
+        cube = ContingencyCube.__new__(ContingencyCube)
+        cube.columns = list(self.columns)
+        cube.n_workers = self.n_workers
+        cube._codes, cube._labels, cube._dtypes = {}, {}, {}
+        cube._tables = {}
+        cube._lock = threading.Lock()
+        cube._thread = None
+        positions = {}
+        batch_codes = {}
+        for column in self.columns:
+            old_labels = self._labels[column]
+            if isinstance(df[column].dtype, pd.CategoricalDtype):
+                labels = df[column].cat.categories
+            else:
+                labels = old_labels.union(pd.Index(batch[column].dropna().unique()))
+            positions[column] = labels.get_indexer(old_labels)
+            old_codes = self._codes[column]
+            remapped = old_codes
+            if not np.array_equal(positions[column], np.arange(len(old_labels))):
+                remapped = np.where(old_codes >= 0, positions[column][old_codes], -1)
+            batch_codes[column] = labels.get_indexer(batch[column])
+            cube._codes[column] = np.concatenate([remapped, batch_codes[column]])
+            cube._labels[column] = labels
+            cube._dtypes[column] = df[column].dtype
+        for (col1, col2), table in list(self._tables.items()):
+            merged = pair_counts(batch_codes[col1], batch_codes[col2],
+                                 len(cube._labels[col1]), len(cube._labels[col2]))
+            merged[np.ix_(positions[col1], positions[col2])] += table
+            cube._tables[(col1, col2)] = merged
+        return cube
+
+    def table(self, col1: str, col2: str, normalize=False) -> pd.DataFrame:
+        """
+        Tabla cruzada con el mismo resultado que pd.crosstab
+
+        Args:
+            col1: Variable de las filas
+            col2: Variable de las columnas
+            normalize: False, 'index', 'columns' o 'all' (igual que pd.crosstab)
+
+        Returns:
+            DataFrame con frecuencias o proporciones
+        """
+        counts = self.counts(col1, col2)
+        # pd.crosstab solo incluye las categorías observadas en el par
+        rows = np.flatnonzero(counts.sum(axis=1))
+        cols = np.flatnonzero(counts.sum(axis=0))
+        table = pd.DataFrame(counts[np.ix_(rows, cols)],
+                             index=labels_index(self._labels[col1], rows, self._dtypes[col1], col1),
+                             columns=labels_index(self._labels[col2], cols, self._dtypes[col2], col2))
+        return normalize_table(table, normalize)
+
+
+def pair_counts(codes1: np.ndarray, codes2: np.ndarray, n1: int, n2: int) -> np.ndarray:
+    """
+    Matriz de conteos conjuntos de dos arreglos de códigos (-1 = nulo)
+
+    Args:
+        codes1: Códigos de la primera columna
+        codes2: Códigos de la segunda columna
+        n1: Número de categorías de la primera columna
+        n2: Número de categorías de la segunda columna
+
+    Returns:
+        Matriz n1 x n2 de conteos
+    """
+    valid = (codes1 >= 0) & (codes2 >= 0)
+    combined = codes1[valid].astype(np.int64) * n2 + codes2[valid]
+    return np.bincount(combined, minlength=n1 * n2).reshape(n1, n2)
@@ -0,0 +1,145 @@
+"""
+Matriz de correlación incremental a partir de estadísticos suficientes
+Proyecto: Bank Marketing EDA
+"""
+
+import numpy as np
+import pandas as pd
+from typing import List
+
+# Filas procesadas por bloque al acumular productos cruzados (limita la memoria temporal)
+GRAM_BLOCK_ROWS = 500_000
+
+
+class GramStatistics:
+    """
+    Conteos, sumas y productos cruzados por pares de columnas numéricas
+
+    Con X los valores (desplazados por una constante por columna para
+    estabilidad numérica, nulos como 0) y M la máscara de valores válidos:
+
+        N = MᵀM      filas con ambos valores presentes
+        S = XᵀM      S[i, j] = suma de x_i en esas filas
+        Q = (X²)ᵀM   Q[i, j] = suma de x_i² en esas filas
+        P = XᵀX      P[i, j] = suma de x_i·x_j
+
+    De ellos sale la correlación de Pearson por pares completos (igual que
+    DataFrame.corr()) de cualquier subconjunto en O(k²), sin volver a las
+    filas. Los estadísticos se suman, así que agregar filas o combinar
+    bloques es una actualización.
+    """
+
+    def __init__(self, columns: List[str]):
+        """
+        Args:
+            columns: Columnas numéricas
+        """
+        self.columns = list(columns)
+        self._position = {column: i for i, column in enumerate(self.columns)}
+        p = len(self.columns)
+        self.shift = None
+        self.n = np.zeros((p, p))
+        self.s = np.zeros((p, p))
+        self.q = np.zeros((p, p))
+        self.p = np.zeros((p, p))
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, columns: List[str]) -> 'GramStatistics':
+        """
+        Construye los estadísticos de las columnas de un DataFrame
+
+        Args:
+            df: DataFrame
+            columns: Columnas numéricas
+
+        Returns:
+            Estadísticos acumulados
+        """
+        gram = cls(columns)
+        gram.update(df)
+        return gram
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.n.nbytes * 4)
+
+    def update(self, df: pd.DataFrame):
+        """
+        Agrega filas nuevas
+
+        Args:
+            df: DataFrame con (al menos) las columnas de los estadísticos
+        """
+        if len(df) == 0 or not self.columns:
+            return
+        for start in range(0, len(df), GRAM_BLOCK_ROWS):
+            block = df.iloc[start:start + GRAM_BLOCK_ROWS]
+            values = np.column_stack([block[column].to_numpy(dtype=np.float64, na_value=np.nan)
+                                      for column in self.columns])
+            mask = ~np.isnan(values)
+            if self.shift is None:
+                # Desplazar por una media aproximada evita la cancelación en n·Q - S²
+                counts = mask.sum(axis=0)
+                self.shift = np.where(counts > 0, np.nansum(values, axis=0) / np.maximum(counts, 1), 0.0)
+            centered = np.where(mask, values - self.shift, 0.0)
+            weights = mask.astype(np.float64)
+            self.n += weights.T @ weights
+            self.s += centered.T @ weights
+            self.q += (centered ** 2).T @ weights
+            self.p += centered.T @ centered
+
+    def merge(self, other: 'GramStatistics'):
+        """
+        Combina los estadísticos de otro bloque con las mismas columnas
+
+        Args:
+            other: Estadísticos a combinar
+        """
+        if other.columns != self.columns:
+            raise ValueError("Solo se pueden combinar estadísticos con las mismas columnas")
+        if other.shift is None:
+            return
+        if self.shift is None:
+            self.shift = other.shift.copy()
+        s, q, p = other._shifted(self.shift)
+        self.n += other.n
+        self.s += s
+        self.q += q
+        self.p += p
+
+    def _shifted(self, shift: np.ndarray):
+        """
+        S, Q y P expresados con otro desplazamiento (x - c' = (x - c) + (c - c'))
+        """
+        d = (self.shift - shift)[:, None]
+        s = self.s + d * self.n
+        q = self.q + 2 * d * self.s + d ** 2 * self.n
+        p = self.p + d * self.s.T + d.T * self.s + d * d.T * self.n
+        return s, q, p
+
+    def correlation(self, variables: List[str] = None) -> pd.DataFrame:
+        """
+        Matriz de correlación de Pearson por pares completos
+
+        Args:
+            variables: Subconjunto de columnas (None = todas)
+
+        Returns:
+            DataFrame con la matriz de correlación
+        """
+        if variables is None:
+            variables = self.columns
+        index = np.array([self._position[column] for column in variables], dtype=np.int64)
+        grid = np.ix_(index, index)
+        n, s, q, p = self.n[grid], self.s[grid], self.q[grid], self.p[grid]
+        covariance = n * p - s * s.T
+        variance_i = n * q - s ** 2
+        variance_j = variance_i.T
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = covariance / np.sqrt(variance_i * variance_j)
+        corr[(n < 2) | (variance_i <= 0) | (variance_j <= 0)] = np.nan
+        corr = np.clip(corr, -1.0, 1.0)
+        # Diagonal exacta: 1 salvo columnas constantes o sin datos
+        diagonal = np.diagonal(corr).copy()
+        np.fill_diagonal(corr, np.where(np.isnan(diagonal), np.nan, 1.0))
+        return pd.DataFrame(corr, index=list(variables), columns=list(variables))
@@ -3,35 +3,524 @@ Clase DataAnalyzer para análisis exploratorio de datos
 Proyecto: Bank Marketing EDA
 """
 
+import copy
+import functools
+import hashlib
+import inspect
+import io
+import os
+import uuid
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Iterable
+from aggregates import PartialAggregates
+from binning import ColumnHistogram, auto_bin_count, compute_histogram, update_histogram
+from contingency import ContingencyCube
+from correlation import GramStatistics
+from data_loader import DEFAULT_CHUNKSIZE, align_batch, compute_file_hash, read_mapped_dataset
+from grouping import GroupedStats, compute_group_stats, factorize_groups, group_sums
+from instrumentation import instrumented, record_cache, span
+from memory_cache import LRUCache
+from partitions import DEFAULT_N_WORKERS, map_row_partitions
+from lazy_imports import plt, sns
+from profiling import DatasetProfile, map_columns, profile_frame
+from sampling import RowSample, stratified_sample
+from sorted_index import SortedColumnIndex
+from sketches import DEFAULT_QUANTILE_ERROR, DEFAULT_DISTINCT_ERROR
 
+# Memoria máxima para resultados de análisis cacheados por instancia
+RESULT_CACHE_MAX_BYTES = int(os.environ.get('EDA_RESULT_CACHE_MB', '256')) * 1024**2
+
+# Memoria máxima para figuras renderizadas (PNG/SVG) por instancia
+FIGURE_CACHE_MAX_BYTES = int(os.environ.get('EDA_FIGURE_CACHE_MB', '64')) * 1024**2
+
+# Hilos para perfilar columnas e histogramas en paralelo (por defecto, uno por núcleo)
+PROFILE_N_JOBS = int(os.environ.get('EDA_N_JOBS', os.cpu_count() or 1))
+
+# Resolución de las figuras renderizadas (la misma que usa st.pyplot)
+FIGURE_DPI = 200
+
+# Filas máximas con las que se dibujan los gráficos interactivos (0 = siempre todas)
+SAMPLE_MAX_ROWS = int(os.environ.get('EDA_SAMPLE_ROWS', '200000'))
+
+# Semilla de la muestra: la misma muestra en cada rerun y en cada sesión
+SAMPLE_SEED = int(os.environ.get('EDA_SAMPLE_SEED', '42'))
+
+# Variable objetivo por la que se estratifican las muestras
+SAMPLE_TARGET = 'y'
+
+# Gráficos que se pueden dibujar solo con los agregados (modo streaming)
+STREAMING_PLOTS = ('plot_categorical_distribution', 'plot_categorical_crosstab', 'plot_correlation_heatmap')
+
+_NOT_CACHED = object()
+
+
+def _freeze(value):
+    """
+    Convierte argumentos a una forma hashable para usarlos como clave de caché
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(value))
+    return value
+
+
+def _theme_key() -> str:
+    """
+    Huella del estilo activo de matplotlib/seaborn (rcParams)
+    
+    Cambiar el tema (por ejemplo con sns.set_theme) produce otra clave y las
+    figuras se vuelven a renderizar.
+    """
+    return hashlib.md5(repr(sorted(plt.rcParams.items())).encode()).hexdigest()
+
+
+def memoized(method):
+    """
+    Decorador que cachea el resultado de un método de DataAnalyzer
+    
+    La clave combina el nombre del método, sus argumentos (con valores por
+    defecto aplicados) y la huella del dataset. Los resultados cacheados se
+    comparten entre llamadas y no deben modificarse.
+    """
+    signature = inspect.signature(method)
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = tuple((name, _freeze(value)) for name, value in bound.arguments.items()
+                          if name != 'self')
+        key = (method.__name__, arguments, self.fingerprint)
+        result = self._result_cache.get(key, _NOT_CACHED)
+        record_cache('results', method.__name__, result is not _NOT_CACHED)
+        if result is _NOT_CACHED:
+            result = method(self, *args, **kwargs)
+            self._result_cache.put(key, result)
+        return result
+    
+    return wrapper
+
+
+def _target_tally(df: pd.DataFrame, column: str, target: str,
+                  n_workers: int = 1) -> Tuple[pd.Series, pd.Series]:
+    """
+    Sumas y conteos de una variable numérica por valor de la variable objetivo
+    """
+    codes, labels = factorize_groups(df[target])
+    values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+    partials = map_row_partitions(functools.partial(group_sums, n_labels=len(labels)),
+                                  [values, codes], n_workers)
+    counts, sums = functools.reduce(np.add, partials)
+    observed = np.flatnonzero(counts)
+    index = pd.Index(np.asarray(labels)[observed])
+    return pd.Series(sums[observed], index=index), pd.Series(counts[observed].astype(np.int64), index=index)
+
+
+def _merge_tallies(current: Tuple[pd.Series, pd.Series],
+                   other: Tuple[pd.Series, pd.Series]) -> Tuple[pd.Series, pd.Series]:
+    """
+    Suma dos pares (sumas, conteos) por valor de la variable objetivo
+    """
+    sums = current[0].add(other[0], fill_value=0.0)
+    counts = current[1].add(other[1], fill_value=0).astype(np.int64)
+    return sums, counts
+
+
+@instrumented('analyzer')
 class DataAnalyzer:
     """
     Clase para encapsular funciones de análisis exploratorio de datos
     """
     
-    def __init__(self, dataframe: pd.DataFrame):
+    def __init__(self, dataframe: pd.DataFrame = None, aggregates: PartialAggregates = None,
+                 fingerprint: str = None, cache_max_bytes: int = RESULT_CACHE_MAX_BYTES,
+                 figure_cache_max_bytes: int = FIGURE_CACHE_MAX_BYTES, approximate: bool = False,
+                 quantile_error: float = DEFAULT_QUANTILE_ERROR,
+                 distinct_error: float = DEFAULT_DISTINCT_ERROR, n_jobs: int = PROFILE_N_JOBS,
+                 n_workers: int = DEFAULT_N_WORKERS, sample_rows: int = SAMPLE_MAX_ROWS,
+                 sample_seed: int = SAMPLE_SEED):
         """
-        Inicializa el analizador con un DataFrame
+        Inicializa el analizador con un DataFrame o con agregados parciales
         
         Args:
             dataframe: DataFrame de pandas a analizar
+            aggregates: Agregados acumulados por bloques (modo streaming, sin DataFrame)
+            fingerprint: Huella del dataset (por ejemplo, el hash del archivo);
+                si es None se calcula a partir del contenido
+            cache_max_bytes: Memoria máxima de la caché de resultados
+            figure_cache_max_bytes: Memoria máxima de la caché de figuras renderizadas
+            approximate: Si True, cuartiles y valores distintos de las variables
+                numéricas se estiman con sketches (para datasets muy grandes)
+            quantile_error: Error de rango de los cuartiles aproximados
+            distinct_error: Error relativo de los valores distintos aproximados
+            n_jobs: Hilos que reparten el perfilado de columnas (1 = secuencial)
+            n_workers: Procesos que reparten por rangos de filas los conteos de
+                categorías, tablas cruzadas, histogramas y medias por grupo
+            sample_rows: Filas máximas para dibujar los gráficos interactivos;
+                con más filas se usa una muestra estratificada (0 = sin muestreo)
+            sample_seed: Semilla de la muestra
         """
-        self.df = dataframe
+        if dataframe is None and aggregates is None:
+            raise ValueError("Se requiere un DataFrame o agregados parciales")
+        self.approximate = approximate or aggregates is not None
+        self.quantile_error = quantile_error
+        self.distinct_error = distinct_error
+        self.n_jobs = n_jobs
+        self.n_workers = n_workers
+        self.sample_rows = sample_rows
+        self.sample_seed = sample_seed
+        self._result_cache = LRUCache(cache_max_bytes)
+        self._figure_cache = LRUCache(figure_cache_max_bytes)
+        self._profile = None
+        self._contingency = None
+        self._gram = None
+        self._histograms = {}
+        self._target_tallies = {}
+        self.aggregates = aggregates
+        self._df = dataframe
+        self._fingerprint = fingerprint
         self.numeric_cols = None
         self.categorical_cols = None
         self._classify_variables()
     
+    @property
+    def df(self) -> pd.DataFrame:
+        """
+        DataFrame analizado (None en modo streaming)
+        """
+        return self._df
+    
+    @df.setter
+    def df(self, dataframe: pd.DataFrame):
+        # Reemplazar el DataFrame invalida la huella y los resultados cacheados
+        self._df = dataframe
+        self.invalidate_cache()
+        self._classify_variables()
+    
+    @property
+    def fingerprint(self) -> str:
+        """
+        Huella del dataset usada en las claves de caché
+        """
+        if self._fingerprint is None:
+            self._fingerprint = self._compute_fingerprint()
+        return self._fingerprint
+    
+    def _compute_fingerprint(self) -> str:
+        """
+        Calcula la huella del contenido del DataFrame
+        """
+        if self.is_streaming:
+            # Los agregados no conservan las filas: huella única por instancia
+            return uuid.uuid4().hex
+        digest = hashlib.sha256()
+        digest.update(repr((self._df.columns.tolist(), [str(t) for t in self._df.dtypes])).encode())
+        digest.update(pd.util.hash_pandas_object(self._df, index=True).to_numpy().tobytes())
+        return digest.hexdigest()
+    
+    def invalidate_cache(self):
+        """
+        Descarta los resultados cacheados (usar tras modificar el DataFrame en sitio)
+        """
+        if self._df is not None:
+            self._fingerprint = None
+        self.clear_results()
+    
+    def clear_results(self):
+        """
+        Libera los análisis cacheados sin invalidar la huella del dataset
+        
+        Todo lo descartado se recalcula al volver a pedirlo; se usa para
+        recuperar memoria cuando el servidor supera su presupuesto.
+        """
+        self._profile = None
+        self._contingency = None
+        self._gram = None
+        self._histograms = {}
+        self._target_tallies = {}
+        self._result_cache.clear()
+        self._figure_cache.clear()
+    
+    def get_analysis_memory(self) -> int:
+        """
+        Memoria ocupada por los análisis cacheados (sin contar el DataFrame)
+        
+        Returns:
+            Bytes de las cachés de resultados y figuras, el cubo de
+            contingencia y los histogramas preparados
+        """
+        total = self._result_cache.current_bytes + self._figure_cache.current_bytes
+        if self._contingency is not None:
+            total += self._contingency.nbytes
+        total += sum(histogram.nbytes for histogram in self._histograms.values())
+        return int(total)
+    
+    def get_cache_stats(self) -> Dict:
+        """
+        Retorna estadísticas de las cachés de resultados y de figuras
+        
+        Returns:
+            Diccionario {'results': ..., 'figures': ...} con entradas, bytes,
+            aciertos y fallos de cada caché
+        """
+        return {
+            'results': self._result_cache.get_stats(),
+            'figures': self._figure_cache.get_stats()
+        }
+    
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[pd.DataFrame], target: str = 'y',
+                    fingerprint: str = None, quantile_error: float = DEFAULT_QUANTILE_ERROR,
+                    distinct_error: float = DEFAULT_DISTINCT_ERROR) -> 'DataAnalyzer':
+        """
+        Crea un analizador en modo streaming a partir de bloques de filas
+        
+        Solo se conservan agregados parciales, por lo que la memoria depende
+        del tamaño de bloque y no del tamaño del archivo.
+        
+        Args:
+            chunks: Iterable de DataFrames (ver data_loader.iter_csv_chunks)
+            target: Variable objetivo para las tasas de aceptación
+            fingerprint: Huella del archivo (por ejemplo, su hash de contenido)
+            quantile_error: Error de rango de los cuartiles (sketches por bloque)
+            distinct_error: Error relativo de los valores distintos
+            
+        Returns:
+            DataAnalyzer sin DataFrame residente
+        """
+        aggregates = PartialAggregates.from_chunks(chunks, target=target, quantile_error=quantile_error,
+                                                   distinct_error=distinct_error)
+        return cls(aggregates=aggregates, fingerprint=fingerprint, quantile_error=quantile_error,
+                   distinct_error=distinct_error)
+    
+    @classmethod
+    def from_columnar(cls, path: str, fingerprint: str = None, **kwargs) -> 'DataAnalyzer':
+        """
+        Crea un analizador sobre un archivo Arrow IPC/Feather mapeado en memoria
+        
+        Las columnas no se copian al proceso: el sistema operativo carga sus
+        páginas cuando un análisis las toca y las comparte entre sesiones y
+        procesos que abren el mismo archivo.
+        
+        Args:
+            path: Ruta del archivo (por ejemplo, un dataset de la caché de data_loader)
+            fingerprint: Huella del dataset (None = hash del archivo)
+            **kwargs: Parámetros de inicialización del analizador
+            
+        Returns:
+            DataAnalyzer respaldado por el archivo
+        """
+        return cls(read_mapped_dataset(path), fingerprint=fingerprint or compute_file_hash(path), **kwargs)
+    
+    @classmethod
+    def from_csv(cls, source, chunksize: int = None, target: str = 'y', fingerprint: str = None,
+                 quantile_error: float = DEFAULT_QUANTILE_ERROR,
+                 distinct_error: float = DEFAULT_DISTINCT_ERROR,
+                 n_workers: int = DEFAULT_N_WORKERS) -> 'DataAnalyzer':
+        """
+        Crea un analizador en modo streaming leyendo un CSV por bloques
+        
+        Con una ruta y n_workers > 1, cada proceso lee y resume un rango de
+        bytes del archivo y los agregados parciales se combinan.
+        
+        Args:
+            source: Ruta u objeto tipo archivo
+            chunksize: Filas por bloque (None = valor por defecto de data_loader)
+            target: Variable objetivo para las tasas de aceptación
+            fingerprint: Huella del archivo (por ejemplo, su hash de contenido)
+            quantile_error: Error de rango de los cuartiles (sketches por bloque)
+            distinct_error: Error relativo de los valores distintos
+            n_workers: Procesos que leen el archivo en paralelo
+            
+        Returns:
+            DataAnalyzer sin DataFrame residente
+        """
+        aggregates = PartialAggregates.from_csv(source, chunksize=chunksize or DEFAULT_CHUNKSIZE,
+                                                n_workers=n_workers, target=target,
+                                                quantile_error=quantile_error,
+                                                distinct_error=distinct_error)
+        return cls(aggregates=aggregates, fingerprint=fingerprint, quantile_error=quantile_error,
+                   distinct_error=distinct_error, n_workers=n_workers)
+    
+    @property
+    def is_streaming(self) -> bool:
+        """
+        Indica si el analizador trabaja solo con agregados (sin DataFrame)
+        """
+        return self.df is None
+    
+    def _require_dataframe(self, analysis: str):
+        """
+        Falla con un mensaje claro si el análisis necesita el DataFrame (modo streaming)
+        """
+        if self.is_streaming:
+            raise ValueError(f"{analysis} requiere el DataFrame completo (no disponible en modo streaming)")
+    
     def _classify_variables(self):
         """
         Clasifica las variables en numéricas y categóricas
         """
+        if self.is_streaming:
+            self.numeric_cols = list(self.aggregates.numeric_cols)
+            self.categorical_cols = list(self.aggregates.categorical_cols)
+            return
         self.numeric_cols = self.df.select_dtypes(include=[np.number]).columns.tolist()
-        self.categorical_cols = self.df.select_dtypes(include=['object']).columns.tolist()
+        self.categorical_cols = self.df.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
+    
+    def profile(self) -> DatasetProfile:
+        """
+        Perfil de todas las columnas calculado en una sola pasada por columna
+        
+        Incluye nulos, media, desviación, mínimo/máximo, cuartiles, moda,
+        valores distintos y conteos. Se calcula una vez y lo reutilizan
+        todos los métodos get_*.
+        
+        Returns:
+            Perfil del dataset
+        """
+        if self._profile is None:
+            if self.is_streaming:
+                self._profile = DatasetProfile.from_aggregates(self.aggregates)
+            else:
+                self._profile = profile_frame(self.df, self.numeric_cols, self.categorical_cols,
+                                              approximate=self.approximate,
+                                              quantile_error=self.quantile_error,
+                                              distinct_error=self.distinct_error,
+                                              n_jobs=self.n_jobs, n_workers=self.n_workers)
+        return self._profile
+    
+    def gram(self) -> GramStatistics:
+        """
+        Conteos, sumas y productos cruzados por pares de variables numéricas
+        
+        Se calculan una vez sobre todas las columnas numéricas; cualquier
+        submatriz de correlación se deriva de ellos sin recorrer las filas.
+        
+        Returns:
+            Estadísticos suficientes de la correlación
+        """
+        if self._gram is None:
+            if self.is_streaming:
+                self._gram = self.aggregates.gram or GramStatistics(self.numeric_cols)
+            else:
+                self._gram = GramStatistics.from_frame(self.df, self.numeric_cols)
+        return self._gram
+    
+    def contingency(self, background: bool = False) -> ContingencyCube:
+        """
+        Tablas de contingencia de todos los pares de variables categóricas
+        
+        Las columnas se factorizan una vez al crear el cubo; las tablas de
+        cada par se calculan con bincount (en un hilo si background es True)
+        y las tablas cruzadas se sirven como vistas de ellas.
+        
+        Args:
+            background: Si True, calcula todos los pares en segundo plano
+            
+        Returns:
+            Cubo de contingencia del dataset
+        """
+        if self._contingency is None:
+            self._contingency = ContingencyCube(self.df, self.categorical_cols, n_workers=self.n_workers)
+        if background:
+            self._contingency.build(background=True)
+        return self._contingency
+    
+    def copy(self) -> 'DataAnalyzer':
+        """
+        Copia del analizador que comparte el DataFrame y las estructuras derivadas
+        
+        Las estructuras compartidas no se modifican en sitio (append() crea
+        objetos nuevos), así que la copia puede recibir lotes sin afectar al
+        original. Las cachés de resultados y figuras empiezan vacías.
+        
+        Returns:
+            Analizador independiente
+        """
+        clone = copy.copy(self)
+        clone._result_cache = LRUCache(self._result_cache.max_bytes)
+        clone._figure_cache = LRUCache(self._figure_cache.max_bytes)
+        clone._histograms = dict(self._histograms)
+        clone._target_tallies = dict(self._target_tallies)
+        if self.is_streaming:
+            clone.aggregates = copy.deepcopy(self.aggregates)
+            clone._profile = None
+            clone._gram = None
+        return clone
+    
+    def append(self, batch: pd.DataFrame):
+        """
+        Agrega un lote de filas nuevas actualizando los resultados en lugar de recalcularlos
+        
+        Nulos, momentos, conteos de valores y cuartiles (perfil), tablas de
+        contingencia, estadísticos de la correlación, histogramas y medias por
+        valor de la objetivo se combinan con los del lote, por lo que el costo
+        depende del tamaño del lote. Lo que no tiene actualización barata
+        (índices ordenados, estadísticas agrupadas, figuras) se recalcula al
+        pedirlo. En modo streaming el lote se suma a los agregados.
+        
+        Args:
+            batch: Filas nuevas con las mismas columnas que el dataset
+        """
+        if len(batch) == 0:
+            return
+        batch_hash = hashlib.sha256(pd.util.hash_pandas_object(batch, index=False).to_numpy().tobytes())
+        fingerprint = hashlib.sha256((self.fingerprint + batch_hash.hexdigest()).encode()).hexdigest()
+        
+        if self.is_streaming:
+            self.aggregates.update(batch)
+            self._profile = None
+            self._gram = None
+        else:
+            df, batch = align_batch(self.df, batch)
+            combined = pd.concat([df, batch], ignore_index=True)
+            if self._profile is not None:
+                batch_profile = profile_frame(batch, self.numeric_cols, self.categorical_cols,
+                                              approximate=self.approximate,
+                                              quantile_error=self.quantile_error,
+                                              distinct_error=self.distinct_error,
+                                              n_jobs=self.n_jobs, n_workers=self.n_workers)
+                self._profile = self._profile.merge(batch_profile, combined)
+            if self._gram is not None:
+                gram = copy.deepcopy(self._gram)
+                gram.update(batch)
+                self._gram = gram
+            if self._contingency is not None:
+                self._contingency = self._contingency.appended(batch, combined)
+            self._histograms = self._appended_histograms(batch)
+            self._target_tallies = {
+                (column, target): _merge_tallies(tally, _target_tally(batch, column, target))
+                for (column, target), tally in self._target_tallies.items()
+            }
+            self._df = combined
+        
+        self._fingerprint = fingerprint
+        self._result_cache.clear()
+        self._figure_cache.clear()
+    
+    def _appended_histograms(self, batch: pd.DataFrame) -> Dict:
+        """
+        Histogramas con las filas del lote sumadas (requiere el perfil ya combinado)
+        
+        Se conservan solo los que mantienen los mismos bins; el resto se
+        recalcula la próxima vez que se pidan.
+        """
+        histograms = {}
+        if self._profile is None:
+            return histograms
+        for (column, bins, kde), histogram in self._histograms.items():
+            profile = self._profile[column]
+            if len(histogram.counts) != self._bin_count(column, bins) or \
+                    histogram.edges[0] != profile.minimum or histogram.edges[-1] != profile.maximum:
+                continue
+            updated = update_histogram(histogram, batch[column], profile.std)
+            if updated is not None:
+                histograms[(column, bins, kde)] = updated
+        return histograms
     
     def get_basic_info(self) -> Dict:
         """
@@ -40,15 +529,79 @@ class DataAnalyzer:
         Returns:
             Diccionario con información del dataset
         """
+        profile = self.profile()
+        null_counts = profile.null_counts
         info = {
-            'shape': self.df.shape,
-            'columns': self.df.columns.tolist(),
-            'dtypes': self.df.dtypes.to_dict(),
-            'null_counts': self.df.isnull().sum().to_dict(),
-            'total_nulls': self.df.isnull().sum().sum()
+            'shape': (profile.n_rows, len(profile.columns)),
+            'columns': list(profile.columns),
+            'dtypes': {name: column.dtype for name, column in profile.columns.items()},
+            'null_counts': null_counts,
+            'total_nulls': sum(null_counts.values())
         }
         return info
     
+    def get_memory_usage(self):
+        """
+        Memoria ocupada por el DataFrame en bytes
+        
+        Returns:
+            Bytes en memoria (None en modo streaming, donde no hay DataFrame)
+        """
+        if self.is_streaming:
+            return None
+        return int(self.df.memory_usage(deep=True).sum())
+    
+    def get_preview(self, n_rows: int = 20) -> pd.DataFrame:
+        """
+        Retorna las primeras filas del dataset
+        
+        Args:
+            n_rows: Número de filas
+            
+        Returns:
+            DataFrame con las primeras filas
+        """
+        if self.is_streaming:
+            return self.aggregates.preview.head(n_rows)
+        return self.df.head(n_rows)
+    
+    @memoized
+    def get_sorted_index(self, column: str) -> SortedColumnIndex:
+        """
+        Índice ordenado de una columna numérica (se construye una vez por dataset)
+        
+        Args:
+            column: Nombre de la columna numérica
+            
+        Returns:
+            Índice con la permutación y los valores ordenados
+        """
+        self._require_dataframe(f"El filtro por rango de {column}")
+        return SortedColumnIndex(self.df[column])
+    
+    def filter_range(self, column: str, low: float, high: float, n_preview: int = 20) -> Dict:
+        """
+        Filtra las filas con low <= columna <= high usando el índice ordenado
+        
+        No construye máscaras ni copia el DataFrame: solo se materializan las
+        filas de la vista previa.
+        
+        Args:
+            column: Nombre de la columna numérica
+            low: Límite inferior (incluido)
+            high: Límite superior (incluido)
+            n_preview: Filas de la vista previa (las primeras del rango)
+            
+        Returns:
+            Diccionario con el número de filas en el rango, el total y la vista previa
+        """
+        index = self.get_sorted_index(column)
+        return {
+            'count': index.count(low, high),
+            'total': index.n_rows,
+            'preview': self.df.iloc[index.first_positions(low, high, n_preview)]
+        }
+    
     def get_variable_classification(self) -> Dict:
         """
         Retorna la clasificación de variables
@@ -63,6 +616,7 @@ class DataAnalyzer:
             'n_categorical': len(self.categorical_cols)
         }
     
+    @memoized
     def get_descriptive_stats(self, variables: List[str] = None) -> pd.DataFrame:
         """
         Calcula estadísticas descriptivas
@@ -76,7 +630,7 @@ class DataAnalyzer:
         if variables is None:
             variables = self.numeric_cols
         
-        return self.df[variables].describe()
+        return self.profile().describe(variables)
     
     def get_missing_values_analysis(self) -> pd.DataFrame:
         """
@@ -85,13 +639,16 @@ class DataAnalyzer:
         Returns:
             DataFrame con conteo y porcentaje de valores faltantes
         """
+        profile = self.profile()
+        null_values = np.array(list(profile.null_counts.values()))
         missing = pd.DataFrame({
-            'Columna': self.df.columns,
-            'Valores_Nulos': self.df.isnull().sum().values,
-            'Porcentaje': (self.df.isnull().sum().values / len(self.df) * 100).round(2)
+            'Columna': list(profile.columns),
+            'Valores_Nulos': null_values,
+            'Porcentaje': (null_values / profile.n_rows * 100).round(2)
         })
         return missing.sort_values('Valores_Nulos', ascending=False)
     
+    @memoized
     def get_value_counts(self, column: str, normalize: bool = False) -> pd.Series:
         """
         Obtiene conteo de valores para una columna categórica
@@ -103,12 +660,169 @@ class DataAnalyzer:
         Returns:
             Serie con conteos o proporciones
         """
-        return self.df[column].value_counts(normalize=normalize)
+        counts = self.profile()[column].value_counts
+        if counts is None and self.is_streaming:
+            # Sin DataFrame solo hay conteos de las columnas categóricas
+            if column not in self.aggregates.value_counts:
+                raise ValueError(f"En modo streaming solo se conservan los conteos de las "
+                                 f"columnas categóricas: {column}")
+            return self.aggregates.get_value_counts(column, normalize=normalize)
+        if counts is None:
+            # Columnas numéricas con demasiados valores distintos para el perfil
+            return self.df[column].value_counts(normalize=normalize)
+        if normalize:
+            return (counts / counts.sum()).rename('proportion')
+        return counts
+    
+    @memoized
+    def get_crosstab(self, col1: str, col2: str, normalize=False) -> pd.DataFrame:
+        """
+        Calcula la tabla cruzada entre dos variables categóricas
+        
+        Args:
+            col1: Variable de las filas
+            col2: Variable de las columnas
+            normalize: False, 'index', 'columns' o 'all' (igual que pd.crosstab)
+            
+        Returns:
+            DataFrame con frecuencias o proporciones
+        """
+        if self.is_streaming:
+            if (col1, col2) not in self.aggregates.crosstabs and (col2, col1) not in self.aggregates.crosstabs:
+                raise ValueError(f"En modo streaming solo se acumulan las tablas cruzadas contra la "
+                                 f"variable objetivo: {col1} vs {col2}")
+            return self.aggregates.get_crosstab(col1, col2, normalize=normalize)
+        return self.contingency().table(col1, col2, normalize=normalize)
+    
+    def get_histogram(self, column: str, bins: int = None, kde: bool = True) -> ColumnHistogram:
+        """
+        Histograma y KDE de una variable numérica, calculados una vez por columna
+        
+        Los histogramas se guardan aparte de la caché de resultados porque
+        append() les suma las filas nuevas en lugar de descartarlos.
+        
+        Args:
+            column: Nombre de la columna numérica
+            bins: Número de bins (None = criterio 'auto' de numpy, acotado)
+            kde: Si True, incluye la KDE binned
+        
+        Returns:
+            Histograma con frecuencias, bordes y KDE
+        """
+        key = (column, bins, kde)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            self._require_dataframe(f"El histograma de {column}")
+            profile = self.profile()[column]
+            histogram = compute_histogram(self.df[column], self._bin_count(column, bins),
+                                          profile.minimum, profile.maximum, kde=kde,
+                                          n_workers=self.n_workers)
+            self._histograms[key] = histogram
+        return histogram
+    
+    def prepare_histograms(self, columns: List[str] = None, bins: int = None, kde: bool = True):
+        """
+        Calcula en paralelo los histogramas que aún no están preparados
+        
+        Args:
+            columns: Columnas numéricas (None = todas)
+            bins: Número de bins (None = criterio 'auto' de numpy, acotado)
+            kde: Si True, incluye la KDE binned
+        """
+        if self.is_streaming or self.is_sampled:
+            # Con muestreo, los gráficos usan histogramas de la muestra (baratos)
+            return
+        profile = self.profile()
+        pending = [column for column in (columns or self.numeric_cols)
+                   if (column, bins, kde) not in self._histograms]
+        
+        def histogram(column: str) -> ColumnHistogram:
+            return compute_histogram(self.df[column], self._bin_count(column, bins),
+                                     profile[column].minimum, profile[column].maximum, kde=kde,
+                                     n_workers=self.n_workers)
+        
+        for column, result in zip(pending, map_columns(histogram, pending, self.n_jobs)):
+            self._histograms[(column, bins, kde)] = result
+    
+    def _bin_count(self, column: str, bins: int = None) -> int:
+        """
+        Número de bins del histograma de una columna (bins o el criterio 'auto')
+        """
+        if bins is not None:
+            return bins
+        profile = self.profile()[column]
+        return auto_bin_count(profile.count, profile.minimum, profile.maximum,
+                              profile.quantiles[0.25], profile.quantiles[0.75])
+    
+    @property
+    def is_sampled(self) -> bool:
+        """
+        Indica si los gráficos interactivos se dibujan con una muestra
+        """
+        return not self.is_streaming and 0 < self.sample_rows < len(self.df)
+    
+    @memoized
+    def get_sample(self, strata: Tuple[str, ...] = (SAMPLE_TARGET,)) -> RowSample:
+        """
+        Muestra estratificada y reproducible de las filas para graficar
+        
+        Args:
+            strata: Variables categóricas que definen los estratos (las que no
+                existen se ignoran)
+            
+        Returns:
+            Muestra con posiciones y pesos (None si no hace falta muestrear)
+        """
+        if not self.is_sampled:
+            return None
+        strata = [column for column in dict.fromkeys(strata) if column in self.categorical_cols]
+        return stratified_sample(self.df, strata, self.sample_rows, self.sample_seed)
+    
+    @memoized
+    def get_plot_histogram(self, column: str, bins: int = None, kde: bool = True,
+                           strata: Tuple[str, ...] = (SAMPLE_TARGET,)) -> ColumnHistogram:
+        """
+        Histograma para graficar: exacto o, con datos grandes, de la muestra
+        
+        Las frecuencias de la muestra se ponderan para estimar las del
+        dataset completo; los bins y el rango son los del dataset completo.
+        
+        Args:
+            column: Nombre de la columna numérica
+            bins: Número de bins (None = criterio 'auto' de numpy, acotado)
+            kde: Si True, incluye la KDE binned
+            strata: Variables de estratificación de la muestra
+            
+        Returns:
+            Histograma con frecuencias (estimadas si hay muestreo), bordes y KDE
+        """
+        sample = self.get_sample(strata)
+        if sample is None:
+            return self.get_histogram(column, bins=bins, kde=kde)
+        profile = self.profile()[column]
+        return compute_histogram(self.df[column].iloc[sample.positions], self._bin_count(column, bins),
+                                 profile.minimum, profile.maximum, kde=kde, weights=sample.weights)
+    
+    def _mark_sample(self, ax, sample: RowSample):
+        """
+        Indica en el gráfico que se dibujó con una muestra
+        """
+        if sample is None:
+            return
+        ax.text(0.01, 0.99, f"Muestra estratificada por {', '.join(sample.strata) or 'filas'}: "
+                f"{len(sample):,} de {sample.population:,} filas (semilla {sample.seed})",
+                transform=ax.transAxes, ha='left', va='top', fontsize=9, color='0.3',
+                bbox={'boxstyle': 'round', 'facecolor': 'white', 'edgecolor': '0.7', 'alpha': 0.9})
     
     def plot_numeric_distribution(self, column: str, ax=None):
         """
         Grafica la distribución de una variable numérica
         
+        El histograma y la KDE se dibujan desde arreglos precalculados, por lo
+        que el costo de graficar depende del número de bins y no de filas. Con
+        datos grandes se calculan sobre una muestra estratificada por la
+        variable objetivo; la media y la mediana son las exactas.
+        
         Args:
             column: Nombre de la columna numérica
             ax: Eje de matplotlib (opcional)
@@ -116,17 +830,47 @@ class DataAnalyzer:
         if ax is None:
             fig, ax = plt.subplots(figsize=(10, 6))
         
-        sns.histplot(data=self.df, x=column, kde=True, ax=ax)
+        histogram = self.get_plot_histogram(column)
+        ax.bar(histogram.edges[:-1], histogram.counts, histogram.widths, align='edge',
+               color='C0', alpha=0.75, edgecolor='white', linewidth=0.5)
+        if histogram.kde_x is not None:
+            ax.plot(histogram.kde_x, histogram.scaled_kde(), color='C0')
         ax.set_title(f'Distribución de {column}', fontsize=14, fontweight='bold')
         ax.set_xlabel(column, fontsize=12)
         ax.set_ylabel('Frecuencia', fontsize=12)
         
-        # Agregar líneas de media y mediana
-        mean_val = self.df[column].mean()
-        median_val = self.df[column].median()
+        # Agregar líneas de media y mediana (siempre de todas las filas)
+        stats = self.get_summary_statistics(column)
+        mean_val = stats['Media']
+        median_val = stats['Mediana']
         ax.axvline(mean_val, color='red', linestyle='--', label=f'Media: {mean_val:.2f}')
         ax.axvline(median_val, color='green', linestyle='--', label=f'Mediana: {median_val:.2f}')
-        ax.legend()
+        ax.legend(loc='upper right')
+        self._mark_sample(ax, self.get_sample())
+        
+        return ax
+    
+    def plot_distribution_comparison(self, variables: List[str], bins: int = 30, ax=None):
+        """
+        Superpone los histogramas de varias variables numéricas
+        
+        Args:
+            variables: Variables numéricas a comparar
+            bins: Número de bins por variable
+            ax: Eje de matplotlib (opcional)
+        """
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(12, 8))
+        
+        for var in variables:
+            histogram = self.get_plot_histogram(var, bins=bins, kde=False)
+            ax.bar(histogram.edges[:-1], histogram.counts, histogram.widths, align='edge',
+                   alpha=0.5, label=var)
+        ax.legend(loc='upper right')
+        ax.set_xlabel('Valor')
+        ax.set_ylabel('Frecuencia')
+        ax.set_title('Comparación de Distribuciones', fontweight='bold', fontsize=14)
+        self._mark_sample(ax, self.get_sample())
         
         return ax
     
@@ -141,8 +885,9 @@ class DataAnalyzer:
         if ax is None:
             fig, ax = plt.subplots(figsize=(12, 6))
         
-        value_counts = self.df[column].value_counts()
-        sns.barplot(x=value_counts.index, y=value_counts.values, ax=ax, palette='viridis')
+        value_counts = self.get_value_counts(column)
+        # Etiquetas como texto para respetar el orden de frecuencia (también en columnas 'category')
+        sns.barplot(x=value_counts.index.astype(str), y=value_counts.values, ax=ax, palette='viridis')
         ax.set_title(f'Distribución de {column}', fontsize=14, fontweight='bold')
         ax.set_xlabel(column, fontsize=12)
         ax.set_ylabel('Frecuencia', fontsize=12)
@@ -155,10 +900,33 @@ class DataAnalyzer:
         
         return ax
     
+    @memoized
+    def get_group_stats(self, numeric_col: str, categorical_col: str) -> GroupedStats:
+        """
+        Estadísticas de una variable numérica por grupo de una categórica
+        
+        Calcula en una pasada conteo, media, desviación, cuartiles, bigotes y
+        atípicos de cada grupo; la tabla y el boxplot se sirven de este resultado.
+        
+        Args:
+            numeric_col: Variable numérica
+            categorical_col: Variable categórica
+            
+        Returns:
+            Estadísticas agrupadas (table con formato describe() y box_stats)
+        """
+        self._require_dataframe(f"El resumen de {numeric_col} por {categorical_col}")
+        return compute_group_stats(self.df[numeric_col], self.df[categorical_col])
+    
     def plot_bivariate_numeric_categorical(self, numeric_col: str, categorical_col: str, ax=None):
         """
         Grafica relación entre variable numérica y categórica
         
+        El boxplot se dibuja desde las estadísticas agrupadas precalculadas.
+        Con datos grandes, las cajas se calculan sobre una muestra
+        estratificada por la variable objetivo y la categórica (la tabla de
+        get_group_stats sigue siendo exacta).
+        
         Args:
             numeric_col: Variable numérica
             categorical_col: Variable categórica
@@ -167,11 +935,22 @@ class DataAnalyzer:
         if ax is None:
             fig, ax = plt.subplots(figsize=(12, 6))
         
-        sns.boxplot(data=self.df, x=categorical_col, y=numeric_col, ax=ax, palette='Set2')
+        sample = self.get_sample((SAMPLE_TARGET, categorical_col))
+        if sample is None:
+            box_stats = self.get_group_stats(numeric_col, categorical_col).box_stats
+        else:
+            box_stats = compute_group_stats(self.df[numeric_col].iloc[sample.positions],
+                                            self.df[categorical_col].iloc[sample.positions]).box_stats
+        boxes = ax.bxp(box_stats, patch_artist=True, showfliers=True,
+                       medianprops={'color': '0.25'},
+                       flierprops={'marker': 'd', 'markerfacecolor': '0.25', 'markersize': 4})
+        for patch, color in zip(boxes['boxes'], sns.color_palette('Set2', len(box_stats))):
+            patch.set_facecolor(color)
         ax.set_title(f'{numeric_col} vs {categorical_col}', fontsize=14, fontweight='bold')
         ax.set_xlabel(categorical_col, fontsize=12)
         ax.set_ylabel(numeric_col, fontsize=12)
         ax.tick_params(axis='x', rotation=45)
+        self._mark_sample(ax, sample)
         
         return ax
     
@@ -187,12 +966,55 @@ class DataAnalyzer:
         if ax is None:
             fig, ax = plt.subplots(figsize=(12, 8))
         
-        crosstab = pd.crosstab(self.df[col1], self.df[col2])
+        crosstab = self.get_crosstab(col1, col2)
         sns.heatmap(crosstab, annot=True, fmt='d', cmap='YlOrRd', ax=ax)
         ax.set_title(f'Relación: {col1} vs {col2}', fontsize=14, fontweight='bold')
         
         return ax
     
+    def render_figure(self, plot: str, *args, figsize: Tuple[float, float] = (10, 6),
+                      fmt: str = 'png', dpi: int = FIGURE_DPI, **kwargs) -> bytes:
+        """
+        Renderiza un gráfico plot_* a bytes, sirviéndolo desde caché si no cambió
+        
+        La clave combina el tipo de gráfico, sus argumentos, el tamaño y formato,
+        la huella del dataset y el tema activo de matplotlib.
+        
+        Args:
+            plot: Nombre del método de graficado (por ejemplo 'plot_numeric_distribution')
+            *args: Argumentos posicionales del método
+            figsize: Tamaño de la figura en pulgadas
+            fmt: Formato de salida ('png' o 'svg')
+            dpi: Resolución de la imagen
+            **kwargs: Argumentos con nombre del método
+            
+        Returns:
+            Imagen renderizada
+        """
+        if not plot.startswith('plot_') or not hasattr(self, plot):
+            raise ValueError(f"Gráfico desconocido: {plot}")
+        if self.is_streaming and plot not in STREAMING_PLOTS:
+            raise ValueError(f"El gráfico {plot} requiere el DataFrame completo "
+                             f"(no disponible en modo streaming)")
+        key = (plot, _freeze(args), _freeze(kwargs), tuple(figsize), fmt, dpi,
+               self.fingerprint, _theme_key())
+        image = self._figure_cache.get(key)
+        record_cache('figures', plot, image is not None)
+        if image is None:
+            fig, ax = plt.subplots(figsize=figsize)
+            try:
+                getattr(self, plot)(*args, ax=ax, **kwargs)
+                buffer = io.BytesIO()
+                # Rasterizado aparte del dibujo: suele ser la mayor parte del tiempo
+                with span(f'savefig {plot}', 'plot', fmt=fmt, dpi=dpi):
+                    fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches='tight')
+                image = buffer.getvalue()
+            finally:
+                plt.close(fig)
+            self._figure_cache.put(key, image)
+        return image
+    
+    @memoized
     def get_correlation_matrix(self, variables: List[str] = None) -> pd.DataFrame:
         """
         Calcula matriz de correlación
@@ -206,7 +1028,7 @@ class DataAnalyzer:
         if variables is None:
             variables = self.numeric_cols
         
-        return self.df[variables].corr()
+        return self.gram().correlation(variables)
     
     def plot_correlation_heatmap(self, variables: List[str] = None, ax=None):
         """
@@ -226,6 +1048,7 @@ class DataAnalyzer:
         
         return ax
     
+    @memoized
     def get_summary_statistics(self, column: str) -> Dict:
         """
         Obtiene estadísticas de resumen para una columna
@@ -236,22 +1059,90 @@ class DataAnalyzer:
         Returns:
             Diccionario con estadísticas
         """
+        profile = self.profile()[column]
         if column in self.numeric_cols:
             stats = {
-                'Media': self.df[column].mean(),
-                'Mediana': self.df[column].median(),
-                'Moda': self.df[column].mode()[0] if len(self.df[column].mode()) > 0 else None,
-                'Desviación Estándar': self.df[column].std(),
-                'Mínimo': self.df[column].min(),
-                'Máximo': self.df[column].max(),
-                'Q1': self.df[column].quantile(0.25),
-                'Q3': self.df[column].quantile(0.75)
+                'Media': profile.mean,
+                'Mediana': profile.quantiles[0.5],
+                'Moda': profile.mode,
+                'Desviación Estándar': profile.std,
+                'Mínimo': profile.minimum,
+                'Máximo': profile.maximum,
+                'Q1': profile.quantiles[0.25],
+                'Q3': profile.quantiles[0.75]
             }
         else:
             stats = {
-                'Valores únicos': self.df[column].nunique(),
-                'Moda': self.df[column].mode()[0] if len(self.df[column].mode()) > 0 else None,
-                'Frecuencia moda': self.df[column].value_counts().iloc[0]
+                'Valores únicos': profile.n_unique,
+                'Moda': profile.mode,
+                'Frecuencia moda': profile.mode_frequency
             }
         
         return stats
+    
+    def get_target_group_mean(self, column: str, value, target: str = 'y') -> float:
+        """
+        Media de una variable numérica para un valor de la variable objetivo
+        
+        En modo completo se acumulan sumas y conteos por valor de la objetivo
+        (una pasada por columna) que append() actualiza con el lote nuevo.
+        
+        Args:
+            column: Variable numérica
+            value: Valor de la variable objetivo (por ejemplo 'yes')
+            target: Variable objetivo
+            
+        Returns:
+            Media del grupo (NaN si no hay filas)
+        """
+        if self.is_streaming:
+            return self.aggregates.get_target_group_mean(column, value)
+        key = (column, target)
+        if key not in self._target_tallies:
+            self._target_tallies[key] = _target_tally(self.df, column, target, self.n_workers)
+        sums, counts = self._target_tallies[key]
+        if value not in counts.index or counts[value] == 0:
+            return np.nan
+        return sums[value] / counts[value]
+    
+    @memoized
+    def get_key_findings(self, target: str = 'y', positive: str = 'yes') -> Dict:
+        """
+        Calcula las métricas de los hallazgos clave de la campaña
+        
+        Funciona tanto con el DataFrame completo como en modo streaming.
+        
+        Args:
+            target: Variable objetivo
+            positive: Valor de la variable objetivo que indica aceptación
+            
+        Returns:
+            Diccionario con tasa de aceptación, perfiles promedio, tasas por
+            segmento, duración según resultado y mejor canal
+        """
+        n_rows = self.get_basic_info()['shape'][0]
+        target_counts = self.get_value_counts(target)
+        education_table = self.get_crosstab('education', target)
+        contact_table = self.get_crosstab('contact', target)
+        negative = [value for value in target_counts.index if value != positive]
+        negative = negative[0] if negative else None
+        
+        profile = self.profile()
+        avg_age = profile['age'].mean
+        avg_duration = profile['duration'].mean
+        most_common_job = profile['job'].mode
+        
+        duration_yes = self.get_target_group_mean('duration', positive, target)
+        duration_no = self.get_target_group_mean('duration', negative, target)
+        
+        return {
+            'acceptance_rate': target_counts.get(positive, 0) / n_rows * 100,
+            'avg_age': avg_age,
+            'avg_duration': avg_duration,
+            'most_common_job': most_common_job,
+            'education_acceptance': (education_table.div(education_table.sum(axis=1), axis=0) * 100)[positive],
+            'contact_acceptance': (contact_table.div(contact_table.sum(axis=1), axis=0) * 100)[positive],
+            'duration_yes': duration_yes,
+            'duration_no': duration_no,
+            'best_channel': contact_table[positive].idxmax()
+        }
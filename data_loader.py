@@ -0,0 +1,827 @@
+"""
+Módulo de carga de datos con caché columnar en disco
+Proyecto: Bank Marketing EDA
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+import time
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+from typing import Dict, Iterator, List, Optional, Tuple
+from instrumentation import traced
+
+# Separador de los archivos de campaña (BankMarketing.csv)
+CSV_SEPARATOR = ';'
+
+# Directorio y tamaño máximo de la caché de datasets parseados
+CACHE_DIR = os.environ.get(
+    'EDA_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'datasets')
+)
+CACHE_MAX_BYTES = int(os.environ.get('EDA_CACHE_MAX_MB', '2048')) * 1024**2
+
+CACHE_EXTENSION = '.feather'
+METADATA_EXTENSION = '.json'
+
+# Versión del formato de los datasets cacheados: se incrementa cuando cambia
+# el DataFrame que produce el parseo (v2: campos vacíos como nulos en PyArrow)
+CACHE_FORMAT_VERSION = 2
+
+# Proporción máxima de valores únicos para convertir texto a 'category'
+MAX_CATEGORY_RATIO = 0.5
+
+# Filas por bloque en la lectura por streaming
+DEFAULT_CHUNKSIZE = 100_000
+
+# Textos que se leen como nulos (la lista por defecto de pd.read_csv)
+NA_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+             '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null']
+
+# Parser de CSV: 'pyarrow' (usa todos los núcleos) o 'pandas' (parser C, un hilo)
+CSV_BACKEND = os.environ.get('EDA_CSV_BACKEND', 'pyarrow')
+
+# Esquema fijo de BankMarketing.csv: una lista es el diccionario de una
+# columna categórica y un texto, el tipo de una numérica. Con el esquema,
+# el parser no infiere tipos ni construye columnas de texto intermedias.
+BANK_MARKETING_SCHEMA = {
+    'age': 'int8',
+    'job': ['admin.', 'blue-collar', 'entrepreneur', 'housemaid', 'management', 'retired',
+            'self-employed', 'services', 'student', 'technician', 'unemployed', 'unknown'],
+    'marital': ['divorced', 'married', 'single', 'unknown'],
+    'education': ['basic.4y', 'basic.6y', 'basic.9y', 'high.school', 'illiterate',
+                  'professional.course', 'university.degree', 'unknown'],
+    'default': ['no', 'unknown', 'yes'],
+    'housing': ['no', 'unknown', 'yes'],
+    'loan': ['no', 'unknown', 'yes'],
+    'contact': ['cellular', 'telephone'],
+    'month': ['apr', 'aug', 'dec', 'jul', 'jun', 'mar', 'may', 'nov', 'oct', 'sep'],
+    'day_of_week': ['fri', 'mon', 'thu', 'tue', 'wed'],
+    'duration': 'int16',
+    'campaign': 'int8',
+    'pdays': 'int16',
+    'previous': 'int8',
+    'poutcome': ['failure', 'nonexistent', 'success'],
+    'emp.var.rate': 'float64',
+    'cons.price.idx': 'float64',
+    'cons.conf.idx': 'float64',
+    'euribor3m': 'float64',
+    'nr.employed': 'float64',
+    'y': ['no', 'yes']
+}
+
+
+def compute_content_hash(data: bytes) -> str:
+    """
+    Calcula el hash del contenido de un archivo
+
+    Args:
+        data: Bytes del archivo
+
+    Returns:
+        Hash SHA-256 en hexadecimal
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+@traced('load')
+def compute_file_hash(source, block_size: int = 1024**2) -> str:
+    """
+    Calcula el hash del contenido leyendo el archivo por bloques
+
+    Produce el mismo valor que compute_content_hash sin cargar el archivo
+    completo en memoria.
+
+    Args:
+        source: Ruta u objeto tipo archivo
+        block_size: Bytes leídos por bloque
+
+    Returns:
+        Hash SHA-256 en hexadecimal
+    """
+    digest = hashlib.sha256()
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            for block in iter(lambda: f.read(block_size), b''):
+                digest.update(block)
+    else:
+        source.seek(0)
+        for block in iter(lambda: source.read(block_size), b''):
+            digest.update(block)
+        source.seek(0)
+    return digest.hexdigest()
+
+
+def _read_source_bytes(source) -> bytes:
+    """
+    Obtiene los bytes de un archivo subido, una ruta o un objeto tipo archivo
+    """
+    if hasattr(source, 'getvalue'):
+        return source.getvalue()
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            return f.read()
+    return source.read()
+
+
+def _cache_path(content_hash: str) -> str:
+    """
+    Ruta del archivo de caché para un hash de contenido
+    """
+    return os.path.join(CACHE_DIR, content_hash + CACHE_EXTENSION)
+
+
+def _metadata_path(content_hash: str) -> str:
+    """
+    Ruta del archivo de metadatos asociado a un dataset cacheado
+    """
+    return os.path.join(CACHE_DIR, content_hash + METADATA_EXTENSION)
+
+
+def get_memory_usage(df: pd.DataFrame) -> int:
+    """
+    Memoria ocupada por un DataFrame (incluyendo el contenido de strings)
+
+    Args:
+        df: DataFrame a medir
+
+    Returns:
+        Memoria en bytes
+    """
+    return int(df.memory_usage(deep=True).sum())
+
+
+def get_resident_memory_usage(df: pd.DataFrame) -> int:
+    """
+    Memoria propia del proceso ocupada por un DataFrame
+
+    Igual que get_memory_usage, pero sin contar las columnas que son vistas
+    de un archivo mapeado (ver read_mapped_dataset): sus páginas pertenecen
+    a la caché del sistema operativo y se comparten entre sesiones.
+
+    Args:
+        df: DataFrame a medir
+
+    Returns:
+        Memoria en bytes
+    """
+    usage = df.memory_usage(deep=True, index=False)
+    total = int(usage.sum())
+    for column in df.columns:
+        series = df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            values = np.asarray(series.array.codes)
+        elif isinstance(series.array, pd.arrays.NumpyExtensionArray):
+            values = series.array.to_numpy()
+        else:
+            continue
+        if _is_mapped(values):
+            total -= int(values.nbytes)
+    return total + int(df.index.memory_usage(deep=True))
+
+
+def _is_mapped(values: np.ndarray) -> bool:
+    """
+    Indica si un arreglo numpy es una vista sin copia de un buffer Arrow
+    """
+    base = values
+    while isinstance(base, np.ndarray):
+        base = base.base
+    return isinstance(base, pa.Array)
+
+
+@traced('load')
+def optimize_dtypes(df: pd.DataFrame,
+                    max_category_ratio: float = MAX_CATEGORY_RATIO) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Compacta los tipos de datos de un DataFrame
+
+    Convierte columnas de texto con baja cardinalidad a 'category' y reduce
+    las columnas numéricas al tipo más pequeño que conserve los valores.
+
+    Args:
+        df: DataFrame a compactar
+        max_category_ratio: Proporción máxima de valores únicos para usar 'category'
+
+    Returns:
+        Tupla (DataFrame compactado, reporte con memoria antes/después y conversiones)
+    """
+    memory_before = get_memory_usage(df)
+    converted = {}
+    columns = {}
+
+    for column in df.columns:
+        series = df[column]
+        new_series = series
+
+        if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+            n_unique = series.nunique(dropna=True)
+            if len(series) > 0 and n_unique / len(series) <= max_category_ratio:
+                new_series = series.astype('category')
+        elif pd.api.types.is_integer_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            new_series = pd.to_numeric(series, downcast='integer')
+        elif pd.api.types.is_float_dtype(series):
+            downcast = series.astype(np.float32)
+            # Solo se reduce a float32 si no se pierde precisión
+            if np.array_equal(downcast.to_numpy(dtype=np.float64), series.to_numpy(), equal_nan=True):
+                new_series = downcast
+
+        if new_series.dtype != series.dtype:
+            converted[column] = f"{series.dtype} → {new_series.dtype}"
+        columns[column] = new_series
+
+    optimized = pd.DataFrame(columns, index=df.index)
+    report = {
+        'memory_before': memory_before,
+        'memory_after': get_memory_usage(optimized),
+        'converted': converted
+    }
+    return optimized, report
+
+
+def align_batch(df: pd.DataFrame, batch: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Alinea un lote de filas nuevas con el esquema de un DataFrame existente
+
+    Las columnas del lote se reordenan como las del DataFrame; las columnas
+    'category' de ambos pasan a compartir categorías (las existentes primero,
+    las nuevas al final y ordenadas), el texto toma el tipo del DataFrame y
+    las numéricas un tipo común que conserve los valores de ambos.
+
+    Args:
+        df: DataFrame existente
+        batch: Filas nuevas con las mismas columnas
+
+    Returns:
+        Tupla (DataFrame con los tipos comunes, lote alineado)
+    """
+    missing = [column for column in df.columns if column not in batch.columns]
+    extra = [column for column in batch.columns if column not in df.columns]
+    if missing or extra:
+        raise ValueError(f"El lote no tiene las columnas del dataset "
+                         f"(faltan: {missing}, sobran: {extra})")
+    batch = batch[list(df.columns)]
+    df_columns = {}
+    batch_columns = {}
+    for column in df.columns:
+        current, new = df[column], batch[column]
+        if isinstance(current.dtype, pd.CategoricalDtype):
+            new_values = pd.Index(new.dropna().unique()).difference(current.cat.categories)
+            if len(new_values) > 0:
+                current = current.cat.add_categories(new_values.sort_values())
+            new = new.astype(current.dtype)
+        elif pd.api.types.is_numeric_dtype(current) and not pd.api.types.is_bool_dtype(current):
+            new = pd.to_numeric(new)
+            common = np.result_type(current.dtype, new.dtype)
+            # Un lote de enteros pequeños no debe ensanchar una columna compactada
+            if pd.api.types.is_integer_dtype(new) and pd.api.types.is_integer_dtype(current) \
+                    and len(new) > 0 and np.can_cast(np.min_scalar_type(new.min()), current.dtype) \
+                    and np.can_cast(np.min_scalar_type(new.max()), current.dtype):
+                common = current.dtype
+            current, new = current.astype(common, copy=False), new.astype(common)
+        else:
+            new = new.astype(current.dtype)
+        if current.dtype != df[column].dtype:
+            df_columns[column] = current
+        batch_columns[column] = new
+    if df_columns:
+        # Solo se reconstruyen las columnas cuyo tipo cambió
+        df = df.assign(**df_columns)
+    return df, pd.DataFrame(batch_columns, index=batch.index)
+
+
+@traced('load')
+def read_cached_dataset(content_hash: str) -> Optional[pd.DataFrame]:
+    """
+    Lee un dataset previamente parseado desde la caché
+
+    Las columnas quedan mapeadas en memoria desde el archivo (ver
+    read_mapped_dataset): las sesiones que abren el mismo dataset comparten
+    las páginas del sistema operativo.
+
+    Args:
+        content_hash: Hash del contenido del archivo original
+
+    Returns:
+        DataFrame cacheado o None si no existe
+    """
+    path = _cache_path(content_hash)
+    if not os.path.exists(path):
+        return None
+    try:
+        df = read_mapped_dataset(path)
+    except Exception:
+        # Archivo corrupto o incompleto: se descarta y se vuelve a parsear
+        _remove_quietly(path)
+        return None
+    # Marcar como usado recientemente para la política LRU
+    os.utime(path, None)
+    return df
+
+
+def read_mapped_dataset(path: str) -> pd.DataFrame:
+    """
+    Abre un archivo Arrow IPC/Feather sin copiar sus columnas a memoria
+
+    Las columnas numéricas sin nulos son vistas del archivo mapeado y las
+    categóricas usan los índices del diccionario como códigos, así que las
+    páginas solo se leen cuando un análisis toca la columna. Las columnas
+    con nulos o booleanas se convierten (copia) y el texto queda envuelto
+    en un arreglo Arrow.
+
+    Args:
+        path: Ruta del archivo (sin compresión y en un solo bloque para evitar copias)
+
+    Returns:
+        DataFrame respaldado por el archivo mapeado
+    """
+    table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+    columns = {name: _mapped_column(table.column(name)) for name in table.column_names}
+    return pd.DataFrame(columns, copy=False)
+
+
+def _mapped_column(column: pa.ChunkedArray) -> pd.Series:
+    """
+    Serie de pandas sobre los buffers de una columna Arrow (sin copia cuando es posible)
+    """
+    if column.num_chunks != 1:
+        return column.to_pandas()
+    array = column.chunk(0)
+    if pa.types.is_dictionary(array.type) and array.null_count == 0:
+        dtype = pd.CategoricalDtype(array.dictionary.to_pandas(), ordered=array.type.ordered)
+        values = pd.Categorical.from_codes(array.indices.to_numpy(zero_copy_only=True), dtype=dtype)
+    elif (pa.types.is_integer(array.type) or pa.types.is_floating(array.type)) and array.null_count == 0:
+        values = array.to_numpy(zero_copy_only=True)
+    else:
+        return column.to_pandas()
+    return pd.Series(values, copy=False)
+
+
+def read_cached_metadata(content_hash: str) -> Dict:
+    """
+    Lee los metadatos guardados junto a un dataset cacheado
+
+    Args:
+        content_hash: Hash del contenido del archivo original
+
+    Returns:
+        Diccionario de metadatos (vacío si no existe)
+    """
+    try:
+        with open(_metadata_path(content_hash), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+@traced('load')
+def write_cached_dataset(content_hash: str, df: pd.DataFrame, metadata: Dict = None,
+                         backend: str = None) -> bool:
+    """
+    Guarda un DataFrame parseado en la caché columnar
+
+    Los metadatos registran la versión del formato y el backend de parseo;
+    load_cached_dataset descarta los datasets que no coinciden.
+
+    Args:
+        content_hash: Hash del contenido del archivo original
+        df: DataFrame a guardar
+        metadata: Información adicional a guardar junto al dataset (opcional)
+        backend: Backend con el que se parseó (None = CSV_BACKEND)
+
+    Returns:
+        True si se guardó correctamente
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _cache_path(content_hash)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        # Sin compresión y en un solo bloque: el archivo se puede mapear sin copias
+        df.to_feather(tmp_path, compression='uncompressed', chunksize=max(len(df), 1))
+        # Reemplazo atómico para no dejar archivos a medio escribir
+        os.replace(tmp_path, path)
+    except Exception:
+        _remove_quietly(tmp_path)
+        return False
+    metadata = dict(metadata or {}, format_version=CACHE_FORMAT_VERSION, backend=backend or CSV_BACKEND)
+    with open(_metadata_path(content_hash), 'w', encoding='utf-8') as f:
+        json.dump(metadata, f)
+    evict_cache()
+    return True
+
+
+def evict_cache(max_bytes: int = None) -> int:
+    """
+    Elimina los datasets menos usados hasta respetar el tamaño máximo
+
+    Args:
+        max_bytes: Tamaño máximo de la caché (None = CACHE_MAX_BYTES)
+
+    Returns:
+        Número de archivos eliminados
+    """
+    if max_bytes is None:
+        max_bytes = CACHE_MAX_BYTES
+    if not os.path.isdir(CACHE_DIR):
+        return 0
+
+    entries = []
+    for name in os.listdir(CACHE_DIR):
+        if not name.endswith(CACHE_EXTENSION):
+            continue
+        path = os.path.join(CACHE_DIR, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    # Los más antiguos (menos usados) primero
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if _remove_quietly(path):
+            _remove_quietly(path[:-len(CACHE_EXTENSION)] + METADATA_EXTENSION)
+            total -= size
+            removed += 1
+    return removed
+
+
+def _remove_quietly(path: str) -> bool:
+    """
+    Elimina un archivo ignorando errores
+    """
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
+
+
+@traced('load')
+def load_cached_dataset(content_hash: str, backend: str = None) -> Optional[Tuple[pd.DataFrame, Dict]]:
+    """
+    Abre un dataset de la caché junto con la información de carga
+
+    Permite recuperar un dataset por su hash sin el archivo original (por
+    ejemplo, cuando el servidor lo liberó de memoria entre dos reruns).
+
+    Args:
+        content_hash: Clave del dataset en la caché
+        backend: Backend de parseo esperado (None = CSV_BACKEND)
+
+    Returns:
+        Tupla (DataFrame, información de la carga como en load_csv) o None si
+        no existe o fue escrito con otro formato o backend
+    """
+    start = time.perf_counter()
+    metadata = read_cached_metadata(content_hash)
+    if (metadata.get('format_version') != CACHE_FORMAT_VERSION
+            or metadata.get('backend') != (backend or CSV_BACKEND)):
+        return None
+    df = read_cached_dataset(content_hash)
+    if df is None:
+        return None
+    memory_after = get_memory_usage(df)
+    return df, {
+        'content_hash': content_hash,
+        'from_cache': True,
+        'memory_mapped': True,
+        'file_size': metadata.get('file_size'),
+        'load_seconds': time.perf_counter() - start,
+        'memory_before': metadata.get('memory_before', memory_after),
+        'memory_after': memory_after,
+        'converted': metadata.get('converted', {})
+    }
+
+
+@traced('load')
+def load_csv(source, optimize: bool = True) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Carga un CSV usando la caché por hash de contenido
+
+    Args:
+        source: Archivo subido (Streamlit), ruta o objeto tipo archivo
+        optimize: Si True, compacta los tipos de datos antes de cachear
+
+    Returns:
+        Tupla (DataFrame, diccionario con información de la carga)
+    """
+    start = time.perf_counter()
+    data = _read_source_bytes(source)
+    content_hash = compute_content_hash(data)
+    # La caché distingue entre datos compactados y sin compactar; la versión
+    # del formato y el backend se comprueban en los metadatos
+    cache_key = content_hash if optimize else content_hash + '-raw'
+
+    cached = load_cached_dataset(cache_key)
+    if cached is not None:
+        df, load_info = cached
+        load_info.update(content_hash=content_hash, file_size=len(data),
+                         load_seconds=time.perf_counter() - start)
+        return df, load_info
+
+    df, report = parse_csv(data, optimize=optimize)
+    written = write_cached_dataset(cache_key, df, metadata={
+        'memory_before': report['memory_before'],
+        'converted': report['converted'],
+        'file_size': len(data)
+    }, backend=report['backend'])
+    metadata = report
+    # Se trabaja sobre el archivo mapeado y se libera la copia recién parseada
+    mapped = read_cached_dataset(cache_key) if written else None
+    if mapped is not None:
+        df = mapped
+
+    memory_after = get_memory_usage(df)
+    load_info = {
+        'content_hash': content_hash,
+        'from_cache': False,
+        'memory_mapped': mapped is not None,
+        'file_size': len(data),
+        'load_seconds': time.perf_counter() - start,
+        'memory_before': metadata.get('memory_before', memory_after),
+        'memory_after': memory_after,
+        'converted': metadata.get('converted', {}),
+        'backend': report['backend'],
+        'schema_pinned': report['schema_pinned'],
+        'parse_seconds': report['parse_seconds']
+    }
+    return df, load_info
+
+
+@traced('load')
+def parse_csv(data: bytes, backend: str = None, schema: Dict = BANK_MARKETING_SCHEMA,
+              optimize: bool = True) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Parsea los bytes de un CSV con el backend indicado
+
+    Con optimize, el esquema fijo se aplica si el encabezado coincide con
+    sus columnas y todos los valores caben en él; si no, los tipos se
+    infieren. Ambos backends leen como nulos los campos vacíos y los textos
+    de NA_VALUES, y el resultado pasa por optimize_dtypes, así que el
+    DataFrame es el mismo con cualquier backend.
+
+    Args:
+        data: Bytes del archivo
+        backend: 'pyarrow' o 'pandas' (None = CSV_BACKEND)
+        schema: Esquema fijo (ver BANK_MARKETING_SCHEMA; None = inferir siempre)
+        optimize: Si True, compacta los tipos de datos
+
+    Returns:
+        Tupla (DataFrame, reporte con backend, uso del esquema, segundos de
+        parseo, memoria antes de compactar y conversiones)
+    """
+    backend = backend or CSV_BACKEND
+    if backend not in CSV_BACKENDS:
+        raise ValueError(f"Backend de CSV desconocido: {backend} (opciones: {', '.join(CSV_BACKENDS)})")
+    start = time.perf_counter()
+    df, memory_before = CSV_BACKENDS[backend](data, schema if optimize else None)
+    parse_seconds = time.perf_counter() - start
+    if optimize:
+        df, report = optimize_dtypes(df)
+    else:
+        report = {'memory_before': get_memory_usage(df), 'converted': {}}
+    if memory_before is not None:
+        # Con el esquema no existe el DataFrame sin compactar: se reporta contra los tipos por defecto
+        report['memory_before'] = memory_before
+        report['converted'] = {column: f"{_default_dtype(spec)} → {df[column].dtype}"
+                               for column, spec in schema.items()
+                               if _default_dtype(spec) != str(df[column].dtype)}
+    report.update(backend=backend, schema_pinned=memory_before is not None, parse_seconds=parse_seconds)
+    return df, report
+
+
+def _parse_pandas(data: bytes, schema: Dict = None) -> Tuple[pd.DataFrame, Optional[int]]:
+    """
+    Parser C de pandas (un hilo, infiere los tipos; no usa el esquema)
+    """
+    return pd.read_csv(io.BytesIO(data), sep=CSV_SEPARATOR), None
+
+
+def _parse_pyarrow(data: bytes, schema: Dict = None) -> Tuple[pd.DataFrame, Optional[int]]:
+    """
+    Parser multihilo de PyArrow, con el esquema fijo si el archivo lo cumple
+
+    Returns:
+        Tupla (DataFrame, memoria estimada con los tipos por defecto si se
+        usó el esquema o None si los tipos se infirieron)
+    """
+    parse_options = pa_csv.ParseOptions(delimiter=CSV_SEPARATOR)
+    read_options = pa_csv.ReadOptions(use_threads=True)
+    # Los campos vacíos y los textos de NA_VALUES son nulos, como en pd.read_csv
+    convert_options = pa_csv.ConvertOptions(strings_can_be_null=True, null_values=NA_VALUES)
+    if schema is not None and _csv_header(data) == list(schema):
+        try:
+            return _parse_pinned(data, schema, read_options, parse_options, convert_options)
+        except (pa.ArrowInvalid, ValueError):
+            # Valores que no caben en el esquema (texto en una numérica,
+            # desbordes o categorías nuevas): se infieren los tipos
+            pass
+    table = pa_csv.read_csv(io.BytesIO(data), read_options=read_options, parse_options=parse_options,
+                            convert_options=convert_options)
+    return table.to_pandas(), None
+
+
+def _parse_pinned(data: bytes, schema: Dict, read_options, parse_options,
+                  convert_options) -> Tuple[pd.DataFrame, int]:
+    """
+    Parsea con los tipos del esquema: numéricas con su ancho y categóricas como diccionario
+    """
+    convert_options.column_types = {column: pa.dictionary(pa.int32(), pa.string()) if isinstance(spec, list)
+                                    else pa.type_for_alias(spec) for column, spec in schema.items()}
+    table = pa_csv.read_csv(io.BytesIO(data), read_options=read_options, parse_options=parse_options,
+                            convert_options=convert_options)
+    columns = {}
+    # Memoria que ocuparía el DataFrame con los tipos por defecto (8 bytes por número,
+    # texto con offsets de 8 bytes), para reportar la reducción como el parser de pandas
+    memory_before = 0
+    for column, spec in schema.items():
+        values = table.column(column)
+        if isinstance(spec, list):
+            codes, categories, text_bytes = _pinned_codes(values, pd.Index(sorted(spec)))
+            columns[column] = pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(categories))
+            memory_before += text_bytes + 8 * len(values)
+        else:
+            if values.null_count:
+                raise ValueError(f"Valores nulos en la columna numérica {column}")
+            columns[column] = values.to_numpy()
+            memory_before += 8 * len(values)
+    df = pd.DataFrame(columns, copy=False)
+    return df, memory_before + int(df.index.memory_usage(deep=True))
+
+
+def _pinned_codes(values: pa.ChunkedArray, categories: pd.Index) -> Tuple[np.ndarray, pd.Index, int]:
+    """
+    Códigos de una columna diccionario respecto de las categorías del esquema
+
+    Cada bloque del CSV trae su propio diccionario; se traduce el
+    diccionario (pocos valores), no las filas. Como con astype('category'),
+    solo se conservan las categorías observadas; los nulos quedan con código -1.
+
+    Returns:
+        Tupla (códigos, categorías observadas, bytes del texto decodificado)
+    """
+    value_set = pa.array(categories.tolist(), type=pa.string())
+    code_dtype = np.min_scalar_type(-max(len(categories), 1))
+    counts = np.zeros(len(categories), dtype=np.int64)
+    parts = []
+    text_bytes = 0
+    for chunk in values.chunks:
+        positions = pc.index_in(chunk.dictionary, value_set=value_set)
+        if positions.null_count:
+            raise ValueError(f"Categorías fuera del esquema: {chunk.dictionary.filter(positions.is_null())}")
+        # Los nulos apuntan a una posición extra con código -1
+        positions = np.append(positions.to_numpy(), -1).astype(code_dtype)
+        indices = chunk.indices.fill_null(len(chunk.dictionary)).to_numpy()
+        chunk_counts = np.bincount(indices, minlength=len(positions))[:-1]
+        np.add.at(counts, positions[:-1], chunk_counts)
+        text_bytes += int(chunk_counts @ pc.binary_length(chunk.dictionary).to_numpy())
+        parts.append(positions[indices])
+    codes = np.concatenate(parts) if parts else np.zeros(0, dtype=code_dtype)
+    observed = np.flatnonzero(counts)
+    if len(observed) < len(categories):
+        remap = np.full(len(categories) + 1, -1, dtype=code_dtype)
+        remap[observed] = np.arange(len(observed))
+        # El código -1 toma la última posición de remap, que también vale -1
+        codes = remap[codes]
+    return codes, categories[observed], text_bytes
+
+
+def _csv_header(data: bytes) -> List[str]:
+    """
+    Nombres de las columnas según la primera línea del CSV
+
+    Respeta las comillas: el encabezado de BankMarketing.csv viene entre
+    comillas ("age";"job";...).
+    """
+    end = data.find(b'\n')
+    line = data[:end if end >= 0 else len(data)].decode('utf-8', errors='replace').rstrip('\r')
+    return next(csv.reader([line], delimiter=CSV_SEPARATOR), [])
+
+
+def _default_dtype(spec) -> str:
+    """
+    Tipo que el parser asignaría sin esquema a una columna del esquema
+    """
+    if isinstance(spec, list):
+        return 'str'
+    return 'int64' if spec.startswith('int') else 'float64'
+
+
+# Backends de parseo: reciben los bytes y el esquema (o None) y retornan
+# (DataFrame, memoria estimada sin compactar si se usó el esquema)
+CSV_BACKENDS = {
+    'pandas': _parse_pandas,
+    'pyarrow': _parse_pyarrow
+}
+
+
+def iter_csv_chunks(source, chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """
+    Lee un CSV en bloques de tamaño fijo sin materializar el archivo completo
+
+    Args:
+        source: Ruta o objeto tipo archivo (incluye archivos subidos en Streamlit)
+        chunksize: Número de filas por bloque
+
+    Returns:
+        Iterador de DataFrames con a lo sumo chunksize filas
+    """
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    with pd.read_csv(source, sep=CSV_SEPARATOR, chunksize=chunksize) as reader:
+        for chunk in reader:
+            yield chunk
+
+
+def csv_byte_ranges(path: str, n_parts: int) -> Tuple[bytes, List[Tuple[int, int]]]:
+    """
+    Divide un CSV en rangos de bytes que empiezan y terminan en saltos de línea
+
+    Cada rango se puede leer de forma independiente (por ejemplo, en otro
+    proceso) anteponiéndole la cabecera. Supone que los campos no contienen
+    saltos de línea entre comillas.
+
+    Args:
+        path: Ruta del archivo
+        n_parts: Número de rangos deseado
+
+    Returns:
+        Tupla (bytes de la cabecera, lista de rangos (inicio, fin))
+    """
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        header = f.readline()
+        data_start = f.tell()
+        bounds = [data_start]
+        for i in range(1, max(n_parts, 1)):
+            f.seek(data_start + (size - data_start) * i // n_parts)
+            # Avanzar hasta el inicio de la siguiente línea
+            f.readline()
+            bounds.append(max(f.tell(), bounds[-1]))
+        bounds.append(size)
+    ranges = [(start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+    return header, ranges
+
+
+def iter_csv_range_chunks(path: str, start: int, stop: int, header: bytes,
+                          chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """
+    Lee en bloques las filas de un rango de bytes de un CSV
+
+    Args:
+        path: Ruta del archivo
+        start: Byte inicial (inicio de línea)
+        stop: Byte final (excluido, fin de línea)
+        header: Cabecera del archivo (ver csv_byte_ranges)
+        chunksize: Número de filas por bloque
+
+    Returns:
+        Iterador de DataFrames
+    """
+    with io.BufferedReader(_ByteRange(path, start, stop, header)) as source:
+        with pd.read_csv(source, sep=CSV_SEPARATOR, chunksize=chunksize) as reader:
+            for chunk in reader:
+                yield chunk
+
+
+class _ByteRange(io.RawIOBase):
+    """
+    Archivo de solo lectura con la cabecera seguida de un rango de bytes de otro archivo
+    """
+
+    def __init__(self, path: str, start: int, stop: int, header: bytes):
+        super().__init__()
+        self._file = open(path, 'rb')
+        self._file.seek(start)
+        self._remaining = stop - start
+        self._header = memoryview(header)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if len(self._header):
+            n = min(len(buffer), len(self._header))
+            buffer[:n] = self._header[:n]
+            self._header = self._header[n:]
+            return n
+        n = min(len(buffer), self._remaining)
+        if n <= 0:
+            return 0
+        n = self._file.readinto(memoryview(buffer)[:n])
+        self._remaining -= n
+        return n
+
+    def close(self):
+        self._file.close()
+        super().close()
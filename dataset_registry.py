@@ -0,0 +1,276 @@
+"""
+Registro de datasets compartido por todas las sesiones del proceso
+Proyecto: Bank Marketing EDA
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+from lazy_imports import LazyModule
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# El registro se crea en el primer rerun; pandas y PyArrow se cargan con el primer dataset
+data_loader = LazyModule('data_loader')
+
+# Memoria máxima para datasets y análisis cacheados de todas las sesiones
+REGISTRY_MAX_BYTES = int(os.environ.get('EDA_REGISTRY_MAX_MB', '4096')) * 1024**2
+
+# Una sesión sin actividad durante este tiempo libera sus datasets
+SESSION_IDLE_SECONDS = int(os.environ.get('EDA_SESSION_IDLE_MINUTES', '30')) * 60
+
+
+class DatasetEntry:
+    """
+    Dataset registrado: DataFrame, información de carga, analizador y sesiones que lo usan
+    """
+
+    __slots__ = ('content_hash', 'df', 'load_info', 'analyzer', 'holders', 'last_used', 'dataset_bytes')
+
+    def __init__(self, content_hash: str, df: 'pd.DataFrame', load_info: Dict = None, analyzer=None):
+        """
+        Args:
+            content_hash: Hash del contenido (clave del registro)
+            df: DataFrame del dataset
+            load_info: Información de la carga (ver data_loader.load_csv)
+            analyzer: Analizador del dataset (None = se crea al pedirlo)
+        """
+        self.content_hash = content_hash
+        self.df = df
+        self.load_info = load_info or {}
+        self.analyzer = analyzer
+        self.holders = set()
+        self.last_used = time.monotonic()
+        # Las columnas mapeadas desde disco no cuentan: sus páginas son del sistema operativo
+        self.dataset_bytes = data_loader.get_resident_memory_usage(df)
+
+    @property
+    def analysis_bytes(self) -> int:
+        """
+        Memoria de los análisis cacheados del dataset
+        """
+        return self.analyzer.get_analysis_memory() if self.analyzer is not None else 0
+
+    @property
+    def nbytes(self) -> int:
+        return self.dataset_bytes + self.analysis_bytes
+
+
+class DatasetRegistry:
+    """
+    Datasets en memoria del proceso, deduplicados por hash de contenido
+
+    Cada sesión mantiene una referencia a su dataset actual; las cargas
+    idénticas comparten la misma entrada (y el mismo analizador). Las
+    sesiones inactivas liberan sus referencias y, si se supera el
+    presupuesto de memoria, se eliminan primero los datasets sin
+    referencias menos usados y después los análisis cacheados de los que
+    siguen en uso.
+    """
+
+    def __init__(self, max_bytes: int = REGISTRY_MAX_BYTES, idle_seconds: float = SESSION_IDLE_SECONDS):
+        """
+        Args:
+            max_bytes: Presupuesto de memoria de datasets y análisis
+            idle_seconds: Inactividad tras la que una sesión libera sus datasets
+        """
+        self.max_bytes = max_bytes
+        self.idle_seconds = idle_seconds
+        self._entries: 'OrderedDict[str, DatasetEntry]' = OrderedDict()
+        self._sessions: Dict[str, Tuple[float, Optional[str]]] = {}
+        self._lock = threading.RLock()
+        self.evictions = 0
+        self.analysis_evictions = 0
+
+    def acquire(self, content_hash: str, session_id: str,
+                load: Callable[[], Tuple['pd.DataFrame', Dict]]) -> DatasetEntry:
+        """
+        Obtiene un dataset para una sesión, cargándolo solo si no está registrado
+
+        La sesión pasa a referenciar este dataset y suelta el que usaba antes.
+
+        Args:
+            content_hash: Hash del contenido
+            session_id: Identificador de la sesión
+            load: Función que retorna (DataFrame, información de carga); solo se
+                llama si el dataset no está en el registro
+
+        Returns:
+            Entrada del dataset
+        """
+        with self._lock:
+            entry = self._entries.get(content_hash)
+        if entry is None:
+            # La carga se hace fuera del lock para no bloquear a otras sesiones
+            df, load_info = load()
+            with self._lock:
+                entry = self._entries.get(content_hash)
+                if entry is None:
+                    entry = DatasetEntry(content_hash, df, load_info)
+                    self._entries[content_hash] = entry
+        with self._lock:
+            self._hold(entry, session_id)
+            self._evict()
+        return entry
+
+    def register(self, content_hash: str, session_id: str, df: 'pd.DataFrame',
+                 load_info: Dict = None, analyzer=None) -> DatasetEntry:
+        """
+        Registra un dataset ya construido (por ejemplo, tras agregar un lote)
+
+        Args:
+            content_hash: Huella del dataset
+            session_id: Sesión que lo usa
+            df: DataFrame del dataset
+            load_info: Información de la carga
+            analyzer: Analizador ya creado para el dataset
+
+        Returns:
+            Entrada del dataset
+        """
+        with self._lock:
+            entry = self._entries.get(content_hash)
+            if entry is None:
+                entry = DatasetEntry(content_hash, df, load_info, analyzer)
+                self._entries[content_hash] = entry
+            self._hold(entry, session_id)
+            self._evict()
+        return entry
+
+    def get(self, content_hash: str) -> Optional[DatasetEntry]:
+        """
+        Entrada de un dataset registrado (None si no está o fue eliminado)
+        """
+        with self._lock:
+            entry = self._entries.get(content_hash)
+            if entry is not None:
+                self._entries.move_to_end(content_hash)
+                entry.last_used = time.monotonic()
+            return entry
+
+    def get_analyzer(self, content_hash: str, create: Callable):
+        """
+        Analizador de un dataset registrado, creado una sola vez
+
+        Args:
+            content_hash: Hash del contenido
+            create: Función que recibe el DataFrame y retorna el analizador
+
+        Returns:
+            Analizador compartido (None si el dataset no está registrado)
+        """
+        entry = self.get(content_hash)
+        if entry is None:
+            return None
+        with self._lock:
+            analyzer = entry.analyzer
+        if analyzer is None:
+            # El analizador se construye fuera del lock para no bloquear a otras sesiones
+            analyzer = create(entry.df)
+            with self._lock:
+                if entry.analyzer is None:
+                    entry.analyzer = analyzer
+                analyzer = entry.analyzer
+        return analyzer
+
+    def touch(self, session_id: str):
+        """
+        Marca actividad de una sesión y libera las sesiones inactivas
+
+        Args:
+            session_id: Sesión activa
+        """
+        now = time.monotonic()
+        with self._lock:
+            _, content_hash = self._sessions.get(session_id, (now, None))
+            self._sessions[session_id] = (now, content_hash)
+            for other, (last_seen, _) in list(self._sessions.items()):
+                if now - last_seen > self.idle_seconds:
+                    self._release(other)
+                    del self._sessions[other]
+            self._evict()
+
+    def release(self, session_id: str):
+        """
+        Suelta el dataset que usa una sesión
+
+        Args:
+            session_id: Identificador de la sesión
+        """
+        with self._lock:
+            self._release(session_id)
+            self._evict()
+
+    def _hold(self, entry: DatasetEntry, session_id: str):
+        """
+        Hace que la sesión referencie la entrada (y suelte la anterior)
+        """
+        _, previous = self._sessions.get(session_id, (None, None))
+        if previous is not None and previous != entry.content_hash:
+            self._release(session_id)
+        entry.holders.add(session_id)
+        entry.last_used = time.monotonic()
+        self._entries.move_to_end(entry.content_hash)
+        self._sessions[session_id] = (time.monotonic(), entry.content_hash)
+
+    def _release(self, session_id: str):
+        """
+        Quita la referencia de la sesión a su dataset actual
+        """
+        last_seen, content_hash = self._sessions.get(session_id, (None, None))
+        entry = self._entries.get(content_hash) if content_hash is not None else None
+        if entry is not None:
+            entry.holders.discard(session_id)
+        if last_seen is not None:
+            self._sessions[session_id] = (last_seen, None)
+
+    def _evict(self):
+        """
+        Respeta el presupuesto de memoria: primero datasets sin referencias, luego análisis (LRU)
+        """
+        total = sum(entry.nbytes for entry in self._entries.values())
+        for content_hash, entry in list(self._entries.items()):
+            if total <= self.max_bytes:
+                return
+            if not entry.holders:
+                total -= entry.nbytes
+                del self._entries[content_hash]
+                self.evictions += 1
+        for entry in self._entries.values():
+            if total <= self.max_bytes:
+                return
+            analysis_bytes = entry.analysis_bytes
+            if analysis_bytes > 0:
+                entry.analyzer.clear_results()
+                total -= analysis_bytes
+                self.analysis_evictions += 1
+
+    def get_usage(self) -> Dict:
+        """
+        Uso actual del registro para monitoreo
+
+        Returns:
+            Diccionario con presupuesto, memoria usada, sesiones, evicciones y
+            el detalle de cada dataset (del más al menos reciente)
+        """
+        now = time.monotonic()
+        with self._lock:
+            datasets = [{
+                'content_hash': entry.content_hash,
+                'rows': len(entry.df),
+                'dataset_bytes': entry.dataset_bytes,
+                'analysis_bytes': entry.analysis_bytes,
+                'sessions': len(entry.holders),
+                'idle_seconds': now - entry.last_used
+            } for entry in reversed(self._entries.values())]
+            return {
+                'max_bytes': self.max_bytes,
+                'used_bytes': sum(item['dataset_bytes'] + item['analysis_bytes'] for item in datasets),
+                'sessions': sum(1 for _, content_hash in self._sessions.values() if content_hash is not None),
+                'evictions': self.evictions,
+                'analysis_evictions': self.analysis_evictions,
+                'datasets': datasets
+            }
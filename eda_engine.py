@@ -0,0 +1,633 @@
+"""
+Motor de análisis sin interfaz: las secciones del EDA como funciones puras
+Proyecto: Bank Marketing EDA
+
+Cada función recibe un DataAnalyzer y retorna tablas y valores listos para
+mostrar o guardar; la app de Streamlit solo los presenta. El módulo también
+genera reportes completos por línea de comandos:
+
+    python eda_engine.py campaña_01.csv campaña_02.csv --output reportes --workers 4
+"""
+
+import argparse
+import functools
+import io
+import json
+import os
+import re
+import time
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, List, Tuple
+import data_loader
+from data_analyzer import FIGURE_DPI, DataAnalyzer
+from instrumentation import traced
+from partitions import map_partitions
+from lazy_imports import plt
+
+# Variable objetivo de la campaña y valor que indica aceptación
+TARGET = 'y'
+POSITIVE = 'yes'
+
+
+# =======================
+# SECCIONES DEL EDA
+# =======================
+
+def general_info(analyzer: DataAnalyzer, n_preview: int = 20) -> Dict:
+    """
+    Ítem 1: dimensiones, memoria, tipos de datos y vista previa
+
+    Args:
+        analyzer: Analizador del dataset
+        n_preview: Filas de la vista previa
+
+    Returns:
+        Diccionario con filas, columnas, memoria (None en streaming), total de
+        valores, tabla de tipos y nulos, resumen de tipos y vista previa
+    """
+    info = analyzer.get_basic_info()
+    n_rows, n_cols = info['shape']
+    dtypes = pd.DataFrame({
+        'Columna': list(info['dtypes'].keys()),
+        'Tipo': [str(dtype) for dtype in info['dtypes'].values()],
+        'Nulos': list(info['null_counts'].values())
+    })
+    return {
+        'rows': n_rows,
+        'columns': n_cols,
+        'memory_bytes': analyzer.get_memory_usage(),
+        'total_values': n_rows * n_cols,
+        'dtypes': dtypes,
+        'type_summary': dtypes['Tipo'].value_counts(),
+        'preview': analyzer.get_preview(n_preview)
+    }
+
+
+def variable_classification(analyzer: DataAnalyzer) -> Dict:
+    """
+    Ítem 2: variables numéricas (con su tipo) y categóricas (con sus valores únicos)
+
+    Returns:
+        Diccionario con los conteos y una tabla por tipo de variable
+    """
+    classification = analyzer.get_variable_classification()
+    dtypes = analyzer.get_basic_info()['dtypes']
+    return {
+        'n_numeric': classification['n_numeric'],
+        'n_categorical': classification['n_categorical'],
+        'numeric': pd.DataFrame({
+            'Columna': classification['numeric'],
+            'Tipo': [str(dtypes[column]) for column in classification['numeric']]
+        }),
+        'categorical': pd.DataFrame({
+            'Columna': classification['categorical'],
+            'Valores únicos': [analyzer.get_summary_statistics(column)['Valores únicos']
+                               for column in classification['categorical']]
+        })
+    }
+
+
+def descriptive_stats(analyzer: DataAnalyzer) -> Dict:
+    """
+    Ítem 3: estadísticas descriptivas de las variables numéricas
+
+    Returns:
+        Diccionario con la tabla describe(), si los cuartiles son aproximados
+        y su error de rango
+    """
+    return {
+        'table': analyzer.get_descriptive_stats(),
+        'approximate': analyzer.approximate,
+        'quantile_error': analyzer.quantile_error
+    }
+
+
+def variable_summary(analyzer: DataAnalyzer, column: str) -> Dict:
+    """
+    Ítem 3: tendencia central y dispersión de una variable numérica
+
+    Returns:
+        Estadísticas de get_summary_statistics más rango, rango intercuartílico,
+        coeficiente de variación (%) y sentido del sesgo ('derecha',
+        'izquierda' o 'simétrica')
+    """
+    stats = dict(analyzer.get_summary_statistics(column))
+    stats['Rango'] = stats['Máximo'] - stats['Mínimo']
+    stats['IQR'] = stats['Q3'] - stats['Q1']
+    stats['Coeficiente de Variación'] = (stats['Desviación Estándar'] / stats['Media'] * 100
+                                         if stats['Media'] else np.nan)
+    if stats['Media'] > stats['Mediana']:
+        stats['Sesgo'] = 'derecha'
+    elif stats['Media'] < stats['Mediana']:
+        stats['Sesgo'] = 'izquierda'
+    else:
+        stats['Sesgo'] = 'simétrica'
+    return stats
+
+
+def missing_values(analyzer: DataAnalyzer) -> Dict:
+    """
+    Ítem 4: valores faltantes por columna y en total
+
+    Returns:
+        Diccionario con la tabla por columna, solo las columnas con nulos,
+        el total de nulos y su porcentaje sobre todas las celdas
+    """
+    table = analyzer.get_missing_values_analysis()
+    n_rows, n_cols = analyzer.get_basic_info()['shape']
+    total_missing = int(table['Valores_Nulos'].sum())
+    total_cells = n_rows * n_cols
+    return {
+        'table': table,
+        'missing_columns': table[table['Valores_Nulos'] > 0],
+        'total_missing': total_missing,
+        'missing_pct': total_missing / total_cells * 100 if total_cells else 0.0
+    }
+
+
+def categorical_distribution(analyzer: DataAnalyzer, column: str) -> Dict:
+    """
+    Ítem 6: frecuencias absolutas y porcentajes de una variable categórica
+
+    Returns:
+        Diccionario con 'counts' y 'percentages' (Series ordenadas por frecuencia)
+    """
+    return {
+        'counts': analyzer.get_value_counts(column, normalize=False),
+        'percentages': analyzer.get_value_counts(column, normalize=True) * 100
+    }
+
+
+def numeric_by_category(analyzer: DataAnalyzer, numeric_col: str, categorical_col: str) -> Dict:
+    """
+    Ítem 7: estadísticas de una variable numérica por grupo de una categórica
+
+    Returns:
+        Diccionario con la tabla por grupo y los grupos de mayor y menor media
+    """
+    table = analyzer.get_group_stats(numeric_col, categorical_col).table
+    return {
+        'table': table,
+        'max_mean_group': table['mean'].idxmax(),
+        'min_mean_group': table['mean'].idxmin()
+    }
+
+
+def categorical_crosstab(analyzer: DataAnalyzer, col1: str, col2: str) -> Dict:
+    """
+    Ítem 8: tabla cruzada de dos variables categóricas
+
+    Returns:
+        Diccionario con las frecuencias y los porcentajes por fila
+    """
+    return {
+        'counts': analyzer.get_crosstab(col1, col2),
+        'row_percentages': analyzer.get_crosstab(col1, col2, normalize='index') * 100
+    }
+
+
+def range_filter(analyzer: DataAnalyzer, column: str, low: float, high: float,
+                 n_preview: int = 20) -> Dict:
+    """
+    Ítem 9: registros de una variable numérica dentro de un rango
+
+    Returns:
+        Resultado de filter_range más el porcentaje del total y los excluidos
+    """
+    filtered = dict(analyzer.filter_range(column, low, high, n_preview=n_preview))
+    filtered['percentage'] = filtered['count'] / filtered['total'] * 100 if filtered['total'] else 0.0
+    filtered['excluded'] = filtered['total'] - filtered['count']
+    return filtered
+
+
+def correlation(analyzer: DataAnalyzer, variables: List[str] = None) -> pd.DataFrame:
+    """
+    Ítem 9: matriz de correlación de las variables numéricas elegidas
+    """
+    return analyzer.get_correlation_matrix(variables)
+
+
+def key_findings(analyzer: DataAnalyzer, target: str = TARGET, positive: str = POSITIVE) -> Dict:
+    """
+    Ítem 10: métricas de la campaña y conclusiones derivadas
+
+    Returns:
+        Resultado de get_key_findings más el aumento porcentual de la
+        duración de los contactos que aceptaron frente a los que rechazaron
+    """
+    findings = dict(analyzer.get_key_findings(target=target, positive=positive))
+    findings['duration_lift_pct'] = (findings['duration_yes'] / findings['duration_no'] - 1) * 100
+    return findings
+
+
+# =======================
+# FIGURAS
+# =======================
+
+@traced('plot')
+def plot_type_summary(type_summary: pd.Series, ax):
+    """
+    Barras con la cantidad de columnas por tipo de dato (ítem 1)
+    """
+    type_summary.plot(kind='bar', ax=ax, color='steelblue')
+    ax.set_title('Distribución de Tipos de Datos', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Tipo de Dato')
+    ax.set_ylabel('Cantidad')
+    ax.tick_params(axis='x', rotation=45)
+    for i, v in enumerate(type_summary.values):
+        ax.text(i, v + 0.5, str(v), ha='center', fontweight='bold')
+    return ax
+
+
+@traced('plot')
+def plot_variable_classification(classification: Dict, ax):
+    """
+    Barras con la cantidad de variables numéricas y categóricas (ítem 2)
+    """
+    counts = [classification['n_numeric'], classification['n_categorical']]
+    bars = ax.bar(['Numéricas', 'Categóricas'], counts, color=['#3498db', '#e74c3c'],
+                  alpha=0.7, edgecolor='black', linewidth=2)
+    ax.set_title('Clasificación de Variables', fontsize=16, fontweight='bold')
+    ax.set_ylabel('Cantidad', fontsize=12)
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height, f'{int(height)}',
+                ha='center', va='bottom', fontsize=14, fontweight='bold')
+    return ax
+
+
+@traced('plot')
+def plot_missing_values(missing: Dict, ax):
+    """
+    Porcentaje de valores faltantes de las columnas con nulos (ítem 4)
+    """
+    missing_cols = missing['missing_columns']
+    ax.barh(missing_cols['Columna'], missing_cols['Porcentaje'], color='salmon')
+    ax.set_xlabel('Porcentaje de Valores Faltantes')
+    ax.set_title('Distribución de Valores Faltantes', fontweight='bold')
+    return ax
+
+
+@traced('plot')
+def plot_category_pie(counts: pd.Series, column: str, ax):
+    """
+    Gráfico de pastel de las frecuencias de una variable categórica (ítem 6)
+    """
+    ax.pie(counts.values, labels=counts.index, autopct='%1.1f%%', startangle=90)
+    ax.set_title(f'Distribución de {column}', fontweight='bold', fontsize=14)
+    return ax
+
+
+@traced('plot')
+def plot_acceptance_by_education(findings: Dict, ax):
+    """
+    Tasa de aceptación por nivel educativo (ítem 10)
+    """
+    findings['education_acceptance'].sort_values(ascending=False).plot(kind='barh', ax=ax, color='green', alpha=0.7)
+    ax.set_xlabel('Porcentaje de Aceptación (%)')
+    ax.set_title('Aceptación por Nivel Educativo', fontweight='bold')
+    return ax
+
+
+@traced('plot')
+def plot_acceptance_by_channel(findings: Dict, ax):
+    """
+    Tasa de aceptación por canal de contacto (ítem 10)
+    """
+    findings['contact_acceptance'].plot(kind='bar', ax=ax, color='steelblue', alpha=0.7)
+    ax.set_xlabel('Canal de Contacto')
+    ax.set_ylabel('Porcentaje de Aceptación (%)')
+    ax.set_title('Aceptación por Canal de Comunicación', fontweight='bold')
+    ax.tick_params(axis='x', rotation=45)
+    return ax
+
+
+# =======================
+# REPORTES
+# =======================
+
+def build_report(analyzer: DataAnalyzer, target: str = TARGET) -> Tuple[Dict[str, pd.DataFrame], Dict[str, Tuple]]:
+    """
+    Tablas y figuras de todas las secciones con los parámetros por defecto
+
+    Las variables numéricas y categóricas se cruzan contra la variable
+    objetivo (las combinaciones interactivas de la app son demasiadas para
+    un reporte). Las figuras no se dibujan aquí: cada una se describe con
+    datos serializables para poder dibujarla en cualquier proceso.
+
+    Args:
+        analyzer: Analizador del dataset (en memoria)
+        target: Variable objetivo
+
+    Returns:
+        Tupla (tablas por nombre, figuras por nombre como (gráfico,
+        argumentos, tamaño)); el gráfico es una función plot_* de este
+        módulo con sus datos ya calculados o el nombre de un método plot_*
+        de DataAnalyzer
+    """
+    tables = {}
+    figures = {}
+    info = general_info(analyzer)
+    tables['01_tipos_de_datos'] = info['dtypes']
+    figures['01_tipos_de_datos'] = (plot_type_summary, (info['type_summary'],), (8, 6))
+
+    classification = variable_classification(analyzer)
+    tables['02_variables_numericas'] = classification['numeric']
+    tables['02_variables_categoricas'] = classification['categorical']
+    figures['02_clasificacion'] = (plot_variable_classification, (classification,), (10, 6))
+
+    tables['03_estadisticas_descriptivas'] = descriptive_stats(analyzer)['table']
+    tables['03_resumen_por_variable'] = pd.DataFrame(
+        {column: variable_summary(analyzer, column) for column in analyzer.numeric_cols}).T
+
+    missing = missing_values(analyzer)
+    tables['04_valores_faltantes'] = missing['table']
+    if len(missing['missing_columns']) > 0:
+        figures['04_valores_faltantes'] = (plot_missing_values, (missing,), (10, 6))
+
+    for column in analyzer.numeric_cols:
+        figures[f'05_distribucion_{column}'] = ('plot_numeric_distribution', (column,), (10, 6))
+
+    for column in analyzer.categorical_cols:
+        distribution = categorical_distribution(analyzer, column)
+        tables[f'06_frecuencias_{column}'] = pd.DataFrame({
+            'Frecuencia': distribution['counts'],
+            'Porcentaje': distribution['percentages']
+        })
+        figures[f'06_barras_{column}'] = ('plot_categorical_distribution', (column,), (10, 6))
+        figures[f'06_pastel_{column}'] = (plot_category_pie, (distribution['counts'], column), (10, 6))
+
+    if target in analyzer.categorical_cols:
+        for column in analyzer.numeric_cols:
+            tables[f'07_{column}_por_{target}'] = numeric_by_category(analyzer, column, target)['table']
+            figures[f'07_{column}_por_{target}'] = ('plot_bivariate_numeric_categorical', (column, target), (14, 6))
+        for column in analyzer.categorical_cols:
+            if column == target:
+                continue
+            crosstab = categorical_crosstab(analyzer, column, target)
+            tables[f'08_{column}_vs_{target}'] = crosstab['counts']
+            tables[f'08_{column}_vs_{target}_porcentajes'] = crosstab['row_percentages']
+            figures[f'08_{column}_vs_{target}'] = ('plot_categorical_crosstab', (column, target), (12, 8))
+
+    if len(analyzer.numeric_cols) >= 2:
+        tables['09_correlacion'] = correlation(analyzer)
+        figures['09_correlacion'] = ('plot_correlation_heatmap', (), (10, 8))
+
+    if target in analyzer.categorical_cols:
+        findings = key_findings(analyzer, target=target)
+        tables['10_aceptacion_por_educacion'] = findings['education_acceptance'].to_frame()
+        tables['10_aceptacion_por_canal'] = findings['contact_acceptance'].to_frame()
+        figures['10_aceptacion_por_educacion'] = (plot_acceptance_by_education, (findings,), (10, 6))
+        figures['10_aceptacion_por_canal'] = (plot_acceptance_by_channel, (findings,), (10, 6))
+    return tables, figures
+
+
+def render_report_figure(analyzer: DataAnalyzer, plot, args: Tuple, figsize: Tuple[float, float]) -> bytes:
+    """
+    Dibuja una figura de build_report y la retorna como PNG
+
+    Args:
+        analyzer: Analizador del dataset (solo lo usan los métodos plot_* de DataAnalyzer)
+        plot: Función plot_* de este módulo o nombre de un método plot_* de DataAnalyzer
+        args: Argumentos del gráfico
+        figsize: Tamaño de la figura en pulgadas
+    """
+    if isinstance(plot, str):
+        return analyzer.render_figure(plot, *args, figsize=figsize)
+    return _render(plot, *args, figsize=figsize)
+
+
+def write_tables(analyzer: DataAnalyzer, output_dir: str, target: str = TARGET,
+                 source: str = None) -> Tuple[Dict, List[Tuple]]:
+    """
+    Escribe en disco las tablas (CSV) del EDA y prepara las tareas de sus figuras
+
+    Args:
+        analyzer: Analizador del dataset
+        output_dir: Carpeta del reporte (se crea si no existe)
+        target: Variable objetivo
+        source: CSV del que se construyó el analizador (permite dibujar las
+            figuras en otros procesos)
+
+    Returns:
+        Tupla (resumen con los hallazgos clave y los tiempos, tareas de
+        write_figure: una por figura)
+    """
+    start = time.perf_counter()
+    tables, figures = build_report(analyzer, target=target)
+    compute_seconds = time.perf_counter() - start
+    os.makedirs(os.path.join(output_dir, 'tablas'), exist_ok=True)
+    os.makedirs(os.path.join(output_dir, 'figuras'), exist_ok=True)
+    for name, table in tables.items():
+        table.to_csv(os.path.join(output_dir, 'tablas', _file_name(name) + '.csv'))
+    tasks = [(source, plot, args, figsize, os.path.join(output_dir, 'figuras', _file_name(name) + '.png'))
+             for name, (plot, args, figsize) in figures.items()]
+
+    summary = {
+        'rows': analyzer.get_basic_info()['shape'][0],
+        'tables': len(tables),
+        'figures': len(figures),
+        'compute_seconds': compute_seconds,
+        'tables_seconds': time.perf_counter() - start
+    }
+    if target in analyzer.categorical_cols:
+        findings = key_findings(analyzer, target=target)
+        summary['findings'] = {key: _json_value(value) for key, value in findings.items()
+                               if not isinstance(value, pd.Series)}
+    return summary, tasks
+
+
+def write_figure(task: Tuple, analyzer: DataAnalyzer = None) -> str:
+    """
+    Dibuja una figura del reporte y la guarda como PNG
+
+    Es de nivel de módulo para poder ejecutarse en el pool de procesos; ahí
+    el analizador se reconstruye desde el CSV de origen (una vez por
+    proceso, desde la caché columnar).
+
+    Args:
+        task: Tupla (CSV de origen, gráfico, argumentos, tamaño, ruta del PNG)
+        analyzer: Analizador ya construido (None = cargarlo desde el CSV de origen)
+
+    Returns:
+        Ruta del PNG escrito
+    """
+    source, plot, args, figsize, path = task
+    if analyzer is None and isinstance(plot, str):
+        analyzer = _source_analyzer(source)
+    image = render_report_figure(analyzer, plot, args, figsize)
+    with open(path, 'wb') as handle:
+        handle.write(image)
+    return path
+
+
+def write_figures(tasks: List[Tuple], analyzer: DataAnalyzer = None, n_workers: int = 1) -> List[str]:
+    """
+    Dibuja y guarda las figuras de uno o más reportes, cada una como una tarea del pool
+
+    matplotlib no admite dibujar desde varios hilos, así que el paralelismo
+    es de procesos. Las tareas sin CSV de origen se dibujan en este proceso
+    con el analizador recibido.
+
+    Args:
+        tasks: Tareas de write_tables
+        analyzer: Analizador de las tareas sin CSV de origen
+        n_workers: Procesos en paralelo (1 = en este proceso)
+
+    Returns:
+        Rutas de los PNG escritos, en el orden de las tareas
+    """
+    if n_workers > 1 and all(task[0] is not None for task in tasks):
+        return map_partitions(write_figure, tasks, min(n_workers, len(tasks)))
+    if analyzer is not None:
+        # Histogramas de todas las variables numéricas en paralelo (una pasada por columna)
+        analyzer.prepare_histograms()
+    return [write_figure(task, analyzer) for task in tasks]
+
+
+def write_report(analyzer: DataAnalyzer, output_dir: str, target: str = TARGET,
+                 source: str = None, n_workers: int = 1) -> Dict:
+    """
+    Escribe en disco las tablas (CSV), figuras (PNG) y el resumen (JSON) del EDA
+
+    Args:
+        analyzer: Analizador del dataset
+        output_dir: Carpeta del reporte (se crea si no existe)
+        target: Variable objetivo
+        source: CSV del que se construyó el analizador (necesario para
+            dibujar las figuras en paralelo)
+        n_workers: Procesos para dibujar las figuras
+
+    Returns:
+        Resumen con los hallazgos clave, los archivos escritos y los tiempos
+    """
+    start = time.perf_counter()
+    summary, tasks = write_tables(analyzer, output_dir, target=target, source=source)
+    figures_start = time.perf_counter()
+    write_figures(tasks, analyzer, n_workers)
+    summary.update(figures_seconds=time.perf_counter() - figures_start,
+                   total_seconds=time.perf_counter() - start)
+    write_summary(summary, output_dir)
+    return summary
+
+
+def write_summary(summary: Dict, output_dir: str):
+    """
+    Guarda el resumen del reporte como resumen.json
+    """
+    with open(os.path.join(output_dir, 'resumen.json'), 'w', encoding='utf-8') as handle:
+        json.dump(summary, handle, indent=2, ensure_ascii=False)
+
+
+def load_analyzer(path: str) -> Tuple[DataAnalyzer, Dict]:
+    """
+    Carga un CSV (con la caché columnar) en un analizador de un solo proceso
+
+    Returns:
+        Tupla (analizador, información de la carga)
+    """
+    df, load_info = data_loader.load_csv(path)
+    # Las tareas ya corren en el pool: el analizador no abre hilos ni procesos propios
+    return DataAnalyzer(df, fingerprint=load_info['content_hash'], n_jobs=1, n_workers=1), load_info
+
+
+def prepare_file_report(path: str, output_dir: str, target: str = TARGET) -> Tuple[Dict, List[Tuple]]:
+    """
+    Carga un CSV, escribe las tablas de su reporte y retorna las tareas de sus figuras
+
+    Es de nivel de módulo para poder ejecutarse en el pool de procesos.
+
+    Args:
+        path: Ruta del CSV
+        output_dir: Carpeta raíz de los reportes (uno por archivo)
+        target: Variable objetivo
+
+    Returns:
+        Tupla (resumen con la ruta, la carpeta del reporte y el tiempo de
+        carga, tareas de write_figure)
+    """
+    start = time.perf_counter()
+    analyzer, _ = load_analyzer(path)
+    load_seconds = time.perf_counter() - start
+    name = os.path.splitext(os.path.basename(path))[0]
+    report_dir = os.path.join(output_dir, _file_name(name))
+    summary, tasks = write_tables(analyzer, report_dir, target=target, source=path)
+    summary.update(path=path, output_dir=report_dir, load_seconds=load_seconds)
+    return summary, tasks
+
+
+# Analizador del último CSV usado en este proceso: en el pool, las figuras
+# de un mismo archivo llegan seguidas
+_source_analyzers = {}
+
+
+def _source_analyzer(path: str) -> DataAnalyzer:
+    """
+    Analizador de un CSV de origen, construido una vez por proceso
+    """
+    if path not in _source_analyzers:
+        _source_analyzers.clear()
+        _source_analyzers[path] = load_analyzer(path)[0]
+    return _source_analyzers[path]
+
+
+def _render(plot: Callable, *args, figsize: Tuple[float, float] = (10, 6)) -> bytes:
+    """
+    Dibuja una figura del motor y la retorna como PNG
+    """
+    fig, ax = plt.subplots(figsize=figsize)
+    try:
+        plot(*args, ax=ax)
+        fig.tight_layout()
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=FIGURE_DPI, bbox_inches='tight')
+        return buffer.getvalue()
+    finally:
+        plt.close(fig)
+
+
+def _file_name(name: str) -> str:
+    """
+    Nombre de archivo seguro para una tabla, figura o dataset
+    """
+    return re.sub(r'[^\w.-]+', '_', str(name))
+
+
+def _json_value(value):
+    """
+    Convierte escalares de numpy a tipos nativos para guardarlos en JSON
+    """
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera el reporte del EDA de uno o más archivos CSV")
+    parser.add_argument('files', nargs='+', help="Archivos CSV de campañas")
+    parser.add_argument('--output', default='reportes', help="Carpeta de salida (una subcarpeta por archivo)")
+    parser.add_argument('--target', default=TARGET, help="Variable objetivo")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Procesos en paralelo: primero cargan y tabulan un archivo cada uno, "
+                             "luego dibujan y guardan las figuras de todos los reportes, una por tarea")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    n_workers = max(args.workers, 1)
+    prepared = map_partitions(functools.partial(prepare_file_report, output_dir=args.output, target=args.target),
+                              args.files, min(n_workers, len(args.files)))
+    tables_seconds = time.perf_counter() - start
+    tasks = [task for _, file_tasks in prepared for task in file_tasks]
+    write_figures(tasks, n_workers=n_workers)
+    figures_seconds = time.perf_counter() - start - tables_seconds
+
+    for summary, _ in prepared:
+        write_summary(summary, summary['output_dir'])
+        print(f"{summary['path']}: {summary['rows']:,} filas | {summary['tables']} tablas, "
+              f"{summary['figures']} figuras | carga {summary['load_seconds']:.2f}s, "
+              f"tablas {summary['tables_seconds']:.2f}s")
+    print(f"{len(tasks)} figuras en {figures_seconds:.2f}s ({n_workers} proceso(s))")
+    print(f"{len(prepared)} reporte(s) en {time.perf_counter() - start:.2f}s → {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+"""
+Estadísticas agrupadas (numérica por categórica) en una sola pasada
+Proyecto: Bank Marketing EDA
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List
+from profiling import DESCRIBE_INDEX, PROFILE_QUANTILES, sorted_quantiles
+
+# Alcance de los bigotes del boxplot en rangos intercuartílicos (como matplotlib/seaborn)
+WHISKER_RANGE = 1.5
+
+# Máximo de atípicos dibujados por grupo; si hay más se toman equiespaciados
+# (incluidos los extremos), lo que no cambia visualmente el gráfico
+MAX_FLIERS_PER_GROUP = 1000
+
+
+class GroupedStats:
+    """
+    Estadísticas de una variable numérica por cada grupo de una categórica
+    """
+
+    __slots__ = ('numeric_col', 'categorical_col', 'table', 'box_stats')
+
+    def __init__(self, numeric_col: str, categorical_col: str, table: pd.DataFrame,
+                 box_stats: List[Dict]):
+        """
+        Args:
+            numeric_col: Variable numérica
+            categorical_col: Variable categórica (grupos)
+            table: Estadísticas por grupo con el formato de groupby().describe()
+            box_stats: Estadísticas del boxplot por grupo (formato de Axes.bxp)
+        """
+        self.numeric_col = numeric_col
+        self.categorical_col = categorical_col
+        self.table = table
+        self.box_stats = box_stats
+
+    @property
+    def nbytes(self) -> int:
+        fliers = sum(stats['fliers'].nbytes for stats in self.box_stats)
+        return int(self.table.memory_usage(deep=True).sum()) + fliers
+
+
+def factorize_groups(series: pd.Series):
+    """
+    Códigos de grupo y etiquetas ordenadas (sin recorrer los datos dos veces)
+
+    Args:
+        series: Columna categórica
+
+    Returns:
+        Tupla (códigos con -1 para nulos, etiquetas de los grupos)
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Los códigos del arreglo (sin copia; .cat.codes crea una Serie nueva)
+        return np.asarray(series.array.codes), series.cat.categories
+    return pd.factorize(series, sort=True)
+
+
+def labels_index(labels, observed: np.ndarray, dtype, name: str) -> pd.Index:
+    """
+    Índice con las etiquetas de los grupos observados (como lo arma groupby)
+
+    Args:
+        labels: Etiquetas de todos los códigos
+        observed: Códigos observados
+        dtype: Tipo de dato de la columna original
+        name: Nombre del índice
+
+    Returns:
+        CategoricalIndex si la columna es categórica; Index en otro caso
+    """
+    values = np.asarray(labels)[observed]
+    if isinstance(dtype, pd.CategoricalDtype):
+        return pd.CategoricalIndex(values, categories=labels, ordered=dtype.ordered, name=name)
+    return pd.Index(values, name=name)
+
+
+def group_sums(values: np.ndarray, codes: np.ndarray, n_labels: int) -> np.ndarray:
+    """
+    Conteo y suma de los valores no nulos de cada grupo
+
+    Args:
+        values: Valores numéricos (float64, NaN = nulo)
+        codes: Código de grupo de cada valor (-1 = nulo)
+        n_labels: Número de grupos
+
+    Returns:
+        Arreglo 2 x n_labels con conteos (fila 0) y sumas (fila 1)
+    """
+    valid = (codes >= 0) & ~np.isnan(values)
+    return np.vstack([np.bincount(codes[valid], minlength=n_labels),
+                      np.bincount(codes[valid], weights=values[valid], minlength=n_labels)])
+
+
+def compute_group_stats(numeric: pd.Series, categorical: pd.Series) -> GroupedStats:
+    """
+    Calcula conteo, media, desviación, cuartiles y bigotes por grupo
+
+    Se factoriza la categórica una vez y los valores se reordenan por
+    (grupo, valor); cada grupo queda como un tramo contiguo del que se leen
+    cuartiles, mínimo, máximo, bigotes y atípicos sin volver a los datos.
+
+    Args:
+        numeric: Variable numérica
+        categorical: Variable categórica
+
+    Returns:
+        Estadísticas agrupadas (tabla estilo describe() y datos del boxplot)
+    """
+    codes, labels = factorize_groups(categorical)
+    values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = (codes >= 0) & ~np.isnan(values)
+    n_labels = len(labels)
+    # Códigos en el entero más pequeño posible: el ordenamiento estable de
+    # enteros de 8/16 bits es un radix sort O(n)
+    codes = codes[valid].astype(np.min_scalar_type(-max(n_labels, 1)))
+    values = values[valid]
+
+    counts = np.bincount(codes, minlength=n_labels)
+    sums = np.bincount(codes, weights=values, minlength=n_labels)
+    observed = np.flatnonzero(counts)
+    ends = np.cumsum(counts)
+    starts = ends - counts
+
+    # Agrupar por código y ordenar cada tramo por separado (más barato que un
+    # ordenamiento lexicográfico de todo el arreglo)
+    values = values[np.argsort(codes, kind='stable')]
+    for code in observed:
+        values[starts[code]:ends[code]].sort()
+
+    rows = []
+    box_stats = []
+    for code in observed:
+        group = values[starts[code]:ends[code]]
+        count = len(group)
+        mean = sums[code] / count
+        std = np.sqrt(((group - mean) ** 2).sum() / (count - 1)) if count > 1 else np.nan
+        quantiles = sorted_quantiles(group, PROFILE_QUANTILES)
+        rows.append([float(count), mean, std, group[0], quantiles[0.25], quantiles[0.5],
+                     quantiles[0.75], group[-1]])
+        box_stats.append(_box_stats(group, quantiles, mean, str(labels[code])))
+
+    index = labels_index(labels, observed, categorical.dtype, categorical.name)
+    table = pd.DataFrame(rows, index=index, columns=DESCRIBE_INDEX, dtype=np.float64)
+    return GroupedStats(numeric.name, categorical.name, table, box_stats)
+
+
+def _box_stats(group: np.ndarray, quantiles: Dict[float, float], mean: float, label: str) -> Dict:
+    """
+    Estadísticas del boxplot de un grupo ordenado (claves de Axes.bxp)
+    """
+    q1, q3 = quantiles[0.25], quantiles[0.75]
+    iqr = q3 - q1
+    low_limit = q1 - WHISKER_RANGE * iqr
+    high_limit = q3 + WHISKER_RANGE * iqr
+    # El grupo está ordenado: los bigotes y atípicos salen de búsquedas binarias
+    low = int(np.searchsorted(group, low_limit, side='left'))
+    high = int(np.searchsorted(group, high_limit, side='right'))
+    fliers = np.concatenate([group[:low], group[high:]])
+    if len(fliers) > MAX_FLIERS_PER_GROUP:
+        fliers = fliers[np.linspace(0, len(fliers) - 1, MAX_FLIERS_PER_GROUP).astype(np.int64)]
+    return {
+        'label': label,
+        'mean': mean,
+        'med': quantiles[0.5],
+        'q1': q1,
+        'q3': q3,
+        # Sin valores dentro del límite, el bigote se queda en el cuartil
+        'whislo': group[low] if low < len(group) and group[low] <= q1 else q1,
+        'whishi': group[high - 1] if high > 0 and group[high - 1] >= q3 else q3,
+        'fliers': fliers
+    }
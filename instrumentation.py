@@ -0,0 +1,302 @@
+"""
+Instrumentación de tiempos y memoria por rerun (se activa con EDA_PROFILE=1)
+Proyecto: Bank Marketing EDA
+
+Cada rerun de la app abre una traza; los métodos de DataAnalyzer, la carga
+de CSV, los gráficos y las pestañas del EDA registran en ella un tramo con
+su duración y la variación de memoria residente, y las cachés anotan sus
+aciertos y fallos. Las trazas se exportan en el formato de eventos de
+Chrome (chrome://tracing, Perfetto, speedscope); con EDA_PROFILE_LOG se
+agregan además a un archivo de log.
+
+Sin EDA_PROFILE los decoradores retornan la función original y los tramos
+no hacen nada: la instrumentación no tiene costo.
+"""
+
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional
+from lazy_imports import LazyModule
+
+# pandas solo se necesita para resumir las trazas en el panel (las anotaciones van entre comillas)
+pd = LazyModule('pandas')
+
+# Archivo al que se agregan las trazas de cada rerun (formato de eventos de Chrome)
+PROFILE_LOG = os.environ.get('EDA_PROFILE_LOG')
+
+# Instrumentación activa (definir EDA_PROFILE_LOG también la activa)
+PROFILE_ENABLED = os.environ.get('EDA_PROFILE', '').lower() in ('1', 'true', 'yes', 'on') or bool(PROFILE_LOG)
+
+# Reruns que se conservan por sesión para el panel y la exportación
+TRACE_HISTORY = int(os.environ.get('EDA_PROFILE_HISTORY', '20'))
+
+# Traza del rerun en curso (cada hilo de Streamlit ejecuta una sesión)
+_current_trace = contextvars.ContextVar('eda_trace', default=None)
+_log_lock = threading.Lock()
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def _rss_bytes() -> Optional[int]:
+    """
+    Memoria residente actual del proceso (None si /proc no está disponible)
+    """
+    try:
+        with open('/proc/self/statm') as handle:
+            return int(handle.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+class Trace:
+    """
+    Tramos y conteos de caché de un rerun
+    """
+
+    __slots__ = ('name', 'session_id', 'start_ns', 'end_ns', 'events', 'cache_counts')
+
+    def __init__(self, name: str, session_id: str = None):
+        """
+        Args:
+            name: Nombre del rerun (por ejemplo, la página seleccionada)
+            session_id: Sesión que lo ejecutó
+        """
+        self.name = name
+        self.session_id = session_id
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns = None
+        self.events = []
+        self.cache_counts = {}
+
+    @property
+    def seconds(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end_ns - self.start_ns) / 1e9
+
+    def count_cache(self, cache: str, name: str, hit: bool):
+        """
+        Suma un acierto o un fallo de una caché
+        """
+        counts = self.cache_counts.setdefault((cache, name), [0, 0])
+        counts[0 if hit else 1] += 1
+
+    def get_summary(self) -> 'pd.DataFrame':
+        """
+        Tramos agregados por nombre, del más al menos costoso
+
+        Returns:
+            DataFrame con categoría, nombre, llamadas, tiempo total y máximo (ms)
+            y variación de memoria residente (MB)
+        """
+        if not self.events:
+            return pd.DataFrame(columns=['Categoría', 'Nombre', 'Llamadas', 'Total (ms)',
+                                         'Máximo (ms)', 'Memoria (MB)'])
+        events = pd.DataFrame(self.events)
+        summary = events.groupby(['category', 'name'], sort=False).agg(
+            calls=('duration_ns', 'size'), total=('duration_ns', 'sum'),
+            longest=('duration_ns', 'max'), rss=('rss_delta', 'sum')).reset_index()
+        summary = summary.sort_values('total', ascending=False)
+        return pd.DataFrame({
+            'Categoría': summary['category'],
+            'Nombre': summary['name'],
+            'Llamadas': summary['calls'],
+            'Total (ms)': summary['total'] / 1e6,
+            'Máximo (ms)': summary['longest'] / 1e6,
+            'Memoria (MB)': summary['rss'] / 1024**2
+        })
+
+    def get_cache_summary(self) -> 'pd.DataFrame':
+        """
+        Aciertos y fallos de cada caché por método o gráfico
+        """
+        return pd.DataFrame([{'Caché': cache, 'Nombre': name, 'Aciertos': hits, 'Fallos': misses}
+                             for (cache, name), (hits, misses) in self.cache_counts.items()],
+                            columns=['Caché', 'Nombre', 'Aciertos', 'Fallos'])
+
+    def to_chrome_events(self) -> List[Dict]:
+        """
+        Eventos en el formato de trazas de Chrome (tiempos en microsegundos)
+        """
+        pid = os.getpid()
+        events = [{
+            'name': self.name, 'cat': 'rerun', 'ph': 'X', 'pid': pid,
+            'tid': self.events[0]['thread'] if self.events else threading.get_ident(),
+            'ts': self.start_ns / 1000, 'dur': ((self.end_ns or self.start_ns) - self.start_ns) / 1000,
+            'args': {'session_id': self.session_id}
+        }]
+        for event in self.events:
+            events.append({
+                'name': event['name'], 'cat': event['category'], 'ph': 'X', 'pid': pid,
+                'tid': event['thread'], 'ts': event['start_ns'] / 1000, 'dur': event['duration_ns'] / 1000,
+                'args': dict(event['args'], rss_delta_bytes=event['rss_delta'])
+            })
+        for (cache, name), (hits, misses) in self.cache_counts.items():
+            events.append({
+                'name': f'cache {cache}: {name}', 'cat': 'cache', 'ph': 'C', 'pid': pid,
+                'ts': (self.end_ns or self.start_ns) / 1000, 'args': {'hits': hits, 'misses': misses}
+            })
+        return events
+
+
+def start_trace(name: str, session_id: str = None) -> Optional[Trace]:
+    """
+    Abre la traza de un rerun en el hilo actual
+
+    Returns:
+        Traza abierta (None si la instrumentación está desactivada)
+    """
+    if not PROFILE_ENABLED:
+        return None
+    trace = Trace(name, session_id)
+    _current_trace.set(trace)
+    return trace
+
+
+def finish_trace(trace: Optional[Trace]):
+    """
+    Cierra la traza del rerun y la agrega al log (si EDA_PROFILE_LOG está definido)
+    """
+    if trace is None:
+        return
+    trace.end_ns = time.perf_counter_ns()
+    _current_trace.set(None)
+    if PROFILE_LOG:
+        _append_log(trace)
+
+
+@contextmanager
+def span(name: str, category: str, **args):
+    """
+    Registra un tramo en la traza del rerun en curso
+
+    Fuera de un rerun (o con la instrumentación desactivada) no registra nada;
+    los hilos auxiliares no heredan la traza y quedan dentro del tramo que
+    los lanzó.
+
+    Args:
+        name: Nombre del tramo
+        category: Categoría ('analyzer', 'plot', 'load', 'tab', ...)
+        **args: Datos adicionales del tramo
+    """
+    trace = _current_trace.get() if PROFILE_ENABLED else None
+    if trace is None:
+        yield
+        return
+    rss_before = _rss_bytes()
+    start_ns = time.perf_counter_ns()
+    try:
+        yield
+    except BaseException as e:
+        args['error'] = type(e).__name__
+        raise
+    finally:
+        duration_ns = time.perf_counter_ns() - start_ns
+        rss_after = _rss_bytes()
+        trace.events.append({
+            'name': name, 'category': category, 'thread': threading.get_ident(),
+            'start_ns': start_ns, 'duration_ns': duration_ns,
+            'rss_delta': rss_after - rss_before if rss_before is not None and rss_after is not None else 0,
+            'args': args
+        })
+
+
+def record_cache(cache: str, name: str, hit: bool):
+    """
+    Anota un acierto o fallo de caché en la traza del rerun en curso
+
+    Args:
+        cache: Caché consultada ('results', 'figures', ...)
+        name: Método o gráfico que la consultó
+        hit: True si el valor estaba cacheado
+    """
+    trace = _current_trace.get() if PROFILE_ENABLED else None
+    if trace is not None:
+        trace.count_cache(cache, name, hit)
+
+
+def traced(category: str, name: str = None) -> Callable:
+    """
+    Decorador que registra cada llamada de una función como un tramo
+
+    Args:
+        category: Categoría del tramo
+        name: Nombre del tramo (por defecto, el nombre calificado de la función)
+    """
+    def decorator(function):
+        if not PROFILE_ENABLED:
+            return function
+        label = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with span(label, category):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def instrumented(category: str, plot_category: str = 'plot') -> Callable:
+    """
+    Decorador de clase que registra como tramos todos sus métodos públicos
+
+    Los métodos plot_* y render_* usan plot_category. Las propiedades y los
+    métodos privados no se instrumentan.
+
+    Args:
+        category: Categoría de los tramos de los métodos
+        plot_category: Categoría de los tramos de los gráficos
+    """
+    def decorator(cls):
+        if not PROFILE_ENABLED:
+            return cls
+        for attribute, value in list(vars(cls).items()):
+            if attribute.startswith('_'):
+                continue
+            label = f'{cls.__name__}.{attribute}'
+            kind = plot_category if attribute.startswith(('plot_', 'render_')) else category
+            if isinstance(value, (classmethod, staticmethod)):
+                setattr(cls, attribute, type(value)(traced(kind, label)(value.__func__)))
+            elif callable(value):
+                setattr(cls, attribute, traced(kind, label)(value))
+        return cls
+
+    return decorator
+
+
+def export_chrome_trace(traces: Iterable[Trace]) -> bytes:
+    """
+    Exporta trazas en el formato JSON de eventos de Chrome
+
+    Args:
+        traces: Trazas cerradas
+
+    Returns:
+        Contenido del archivo .json para chrome://tracing o Perfetto
+    """
+    events = [event for trace in traces for event in trace.to_chrome_events()]
+    return json.dumps({'traceEvents': events, 'displayTimeUnit': 'ms'}, default=str).encode()
+
+
+def _append_log(trace: Trace):
+    """
+    Agrega los eventos de una traza al log
+
+    Usa el formato de arreglo de Chrome sin cerrar (un evento por línea), que
+    los visores aceptan y permite seguir agregando eventos.
+    """
+    try:
+        with _log_lock:
+            is_new = not os.path.exists(PROFILE_LOG) or os.path.getsize(PROFILE_LOG) == 0
+            with open(PROFILE_LOG, 'a', encoding='utf-8') as handle:
+                if is_new:
+                    handle.write('[\n')
+                for event in trace.to_chrome_events():
+                    handle.write(json.dumps(event, default=str) + ',\n')
+    except OSError:
+        pass
@@ -0,0 +1,117 @@
+"""
+Imports diferidos de los módulos pesados (pandas, PyArrow, matplotlib, seaborn)
+Proyecto: Bank Marketing EDA
+
+Las páginas sin análisis (Home, Carga del Dataset antes de subir un
+archivo) y los procesos del pool no necesitan pandas ni las librerías de
+gráficos, que juntas tardan más en importarse que el resto de la app. Un
+LazyModule se usa igual que el módulo, pero el import real ocurre en el
+primer acceso a un atributo; matplotlib se carga con el backend Agg (sin
+interfaz, el que usa st.pyplot) elegido explícitamente antes de pyplot.
+"""
+
+import importlib
+import sys
+import threading
+from typing import Callable
+
+# Backend sin interfaz: las figuras solo se rasterizan a PNG/SVG
+MATPLOTLIB_BACKEND = 'Agg'
+
+_warm_up_lock = threading.Lock()
+_warm_up_thread = None
+# Módulos pendientes de precarga (los consume el hilo en curso)
+_warm_up_queue = []
+
+
+def _select_backend():
+    """
+    Fija el backend de matplotlib antes de importar pyplot
+    """
+    import matplotlib
+    matplotlib.use(MATPLOTLIB_BACKEND)
+
+
+class LazyModule:
+    """
+    Módulo que se importa en el primer acceso a uno de sus atributos
+    """
+
+    def __init__(self, name: str, setup: Callable = None):
+        """
+        Args:
+            name: Nombre completo del módulo (por ejemplo 'matplotlib.pyplot')
+            setup: Función a ejecutar una vez antes del import
+        """
+        self._name = name
+        self._setup = setup
+        self._module = None
+        # Un candado por módulo: precargar uno no bloquea el uso de los demás
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        # app.py crea sus LazyModule en cada rerun: el módulo puede estar importado de antes
+        return self._module is not None or self._name in sys.modules
+
+    def load(self):
+        """
+        Importa el módulo (una sola vez) y lo retorna
+        """
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    if self._setup is not None:
+                        self._setup()
+                    self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attribute: str):
+        return getattr(self.load(), attribute)
+
+    def __repr__(self) -> str:
+        state = 'cargado' if self.is_loaded else 'diferido'
+        return f"<LazyModule {self._name} ({state})>"
+
+
+plt = LazyModule('matplotlib.pyplot', setup=_select_backend)
+sns = LazyModule('seaborn', setup=_select_backend)
+
+
+def warm_up(*modules: LazyModule):
+    """
+    Importa módulos diferidos en segundo plano (un solo hilo por proceso)
+
+    Se llama después de mostrar una página: los imports ocurren mientras el
+    usuario la lee y la primera página con análisis ya no los espera. Si ya
+    hay una precarga en curso, los módulos se agregan a su cola.
+
+    Args:
+        *modules: Módulos a precargar, en orden
+    """
+    global _warm_up_thread
+    with _warm_up_lock:
+        _warm_up_queue.extend(module for module in modules
+                              if not module.is_loaded and module not in _warm_up_queue)
+        if _warm_up_queue and _warm_up_thread is None:
+            _warm_up_thread = threading.Thread(target=_warm_up_worker, name='lazy-imports-warm-up', daemon=True)
+            _warm_up_thread.start()
+
+
+def _warm_up_worker():
+    """
+    Importa los módulos de la cola hasta vaciarla
+    """
+    global _warm_up_thread
+    while True:
+        with _warm_up_lock:
+            if not _warm_up_queue:
+                # Se marca el fin bajo el lock: un warm_up posterior abre otro hilo
+                _warm_up_thread = None
+                return
+            module = _warm_up_queue.pop(0)
+        try:
+            module.load()
+        except Exception:
+            # Precarga de mejor esfuerzo: el error se repite (y se informa) en el primer uso
+            pass
@@ -0,0 +1,137 @@
+"""
+Caché LRU en memoria con presupuesto de bytes
+Proyecto: Bank Marketing EDA
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Hashable
+
+_MISSING = object()
+
+
+def estimate_size(obj: Any) -> int:
+    """
+    Estima la memoria ocupada por un resultado cacheado
+
+    Args:
+        obj: Objeto a medir (DataFrame, Serie, array, bytes, dict, ...)
+
+    Returns:
+        Tamaño aproximado en bytes
+    """
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(deep=True).sum())
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(deep=True))
+    if isinstance(obj, np.ndarray) or hasattr(obj, 'nbytes'):
+        return int(obj.nbytes)
+    if isinstance(obj, (bytes, bytearray, str)):
+        return sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(estimate_size(k) + estimate_size(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(estimate_size(item) for item in obj)
+    return sys.getsizeof(obj)
+
+
+class LRUCache:
+    """
+    Caché LRU segura entre hilos con límite de memoria y de entradas
+    """
+
+    def __init__(self, max_bytes: int, max_entries: int = None):
+        """
+        Inicializa la caché
+
+        Args:
+            max_bytes: Memoria máxima de los valores cacheados
+            max_entries: Número máximo de entradas (None = sin límite)
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Obtiene un valor y lo marca como usado recientemente
+
+        Args:
+            key: Clave del valor
+            default: Valor a retornar si la clave no existe
+
+        Returns:
+            Valor cacheado o default
+        """
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int = None):
+        """
+        Guarda un valor, desalojando los menos usados si se excede el presupuesto
+
+        Args:
+            key: Clave del valor
+            value: Valor a guardar
+            size: Tamaño en bytes (None = estimado automáticamente)
+        """
+        if size is None:
+            size = estimate_size(value)
+        # Un valor que no cabe en la caché no se guarda
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+            while self._entries and (self.current_bytes > self.max_bytes or
+                                     (self.max_entries is not None and len(self._entries) > self.max_entries)):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Elimina todas las entradas
+        """
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict:
+        """
+        Retorna estadísticas de uso de la caché
+
+        Returns:
+            Diccionario con entradas, bytes, aciertos, fallos y desalojos
+        """
+        return {
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
@@ -0,0 +1,152 @@
+"""
+Agregación por particiones de filas en un pool de procesos
+Proyecto: Bank Marketing EDA
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Iterable, List, Sequence, Tuple
+
+# Procesos para agregar particiones de filas (1 = todo en el proceso principal)
+DEFAULT_N_WORKERS = int(os.environ.get('EDA_N_WORKERS', '1'))
+
+# Filas mínimas por partición: por debajo, el costo de repartir supera al de calcular
+PARTITION_MIN_ROWS = 2_000_000
+
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def get_pool(n_workers: int) -> ProcessPoolExecutor:
+    """
+    Pool de procesos persistente (se reutiliza entre llamadas y reruns)
+
+    Se usa 'spawn' para que los procesos no hereden hilos ni locks del
+    servidor de Streamlit.
+
+    Args:
+        n_workers: Número de procesos
+
+    Returns:
+        Pool con al menos n_workers procesos
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers < n_workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=n_workers,
+                                        mp_context=multiprocessing.get_context('spawn'))
+            _pool_workers = n_workers
+        return _pool
+
+
+def shutdown_pool():
+    """
+    Cierra el pool de procesos si existe
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+        _pool = None
+        _pool_workers = 0
+
+
+atexit.register(shutdown_pool)
+
+
+def partition_ranges(n_rows: int, n_parts: int) -> List[Tuple[int, int]]:
+    """
+    Divide [0, n_rows) en n_parts rangos contiguos de tamaño similar
+
+    Args:
+        n_rows: Número de filas
+        n_parts: Número de particiones
+
+    Returns:
+        Lista de rangos (inicio, fin)
+    """
+    bounds = np.linspace(0, n_rows, max(n_parts, 1) + 1).astype(np.int64)
+    return [(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+
+def map_partitions(function: Callable, items: Iterable, n_workers: int) -> List:
+    """
+    Aplica una función a cada elemento en el pool de procesos
+
+    Args:
+        function: Función de nivel de módulo (o functools.partial de una)
+        items: Argumentos de cada llamada (se envían serializados)
+        n_workers: Número de procesos (1 = en el proceso principal)
+
+    Returns:
+        Resultados en el orden de los elementos
+    """
+    if n_workers <= 1:
+        return [function(item) for item in items]
+    return list(get_pool(n_workers).map(function, items))
+
+
+def map_row_partitions(function: Callable, arrays: Sequence[np.ndarray], n_workers: int,
+                       min_rows: int = PARTITION_MIN_ROWS) -> List:
+    """
+    Aplica una función a rangos de filas de varios arreglos en procesos separados
+
+    Los arreglos se copian una vez a memoria compartida y cada proceso lee
+    su rango sin serializarlo; solo viajan los resultados parciales, que
+    quien llama combina (sumas de conteos, momentos, etc.).
+
+    Args:
+        function: Función de nivel de módulo que recibe los arreglos de un rango
+        arrays: Arreglos numpy de la misma longitud
+        n_workers: Número de procesos
+        min_rows: Filas mínimas por partición
+
+    Returns:
+        Resultado de cada partición, en orden (uno solo si no conviene partir)
+    """
+    n_rows = len(arrays[0])
+    n_parts = min(n_workers, n_rows // max(min_rows, 1))
+    if n_parts <= 1:
+        return [function(*arrays)]
+    blocks = []
+    try:
+        specs = []
+        for array in arrays:
+            array = np.ascontiguousarray(array)
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            blocks.append(block)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+            specs.append((block.name, array.shape, array.dtype.str))
+        pool = get_pool(n_workers)
+        futures = [pool.submit(_run_partition, function, specs, start, stop)
+                   for start, stop in partition_ranges(n_rows, n_parts)]
+        return [future.result() for future in futures]
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def _run_partition(function: Callable, specs: List[Tuple], start: int, stop: int):
+    """
+    Ejecuta la función sobre un rango de los arreglos en memoria compartida (en el proceso hijo)
+    """
+    blocks = [shared_memory.SharedMemory(name=name) for name, _, _ in specs]
+    try:
+        arrays = [np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)[start:stop]
+                  for block, (_, shape, dtype) in zip(blocks, specs)]
+        result = function(*arrays)
+        # Las vistas deben liberarse antes de cerrar la memoria compartida
+        del arrays
+        return result
+    finally:
+        for block in blocks:
+            block.close()
@@ -0,0 +1,510 @@
+"""
+Perfilado de columnas en una sola pasada
+Proyecto: Bank Marketing EDA
+"""
+
+import copy
+import functools
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List
+from partitions import map_row_partitions
+from sketches import HyperLogLog, KLLSketch, DEFAULT_QUANTILE_ERROR, DEFAULT_DISTINCT_ERROR
+
+# Percentiles calculados en el perfil (los mismos que describe())
+PROFILE_QUANTILES = (0.25, 0.5, 0.75)
+
+# Máximo de valores distintos para conservar el conteo de una columna numérica
+MAX_NUMERIC_VALUE_COUNTS = 10_000
+
+DESCRIBE_INDEX = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+
+
+class ColumnProfile:
+    """
+    Perfil compacto de una columna: nulos, momentos, cuantiles, moda y conteos
+    
+    Si approximate es True, los cuantiles (y los valores distintos cuando no
+    hay conteos exactos) provienen de sketches, que se conservan para poder
+    combinar el perfil con el de filas nuevas.
+    """
+
+    __slots__ = ('name', 'dtype', 'kind', 'count', 'null_count', 'mean', 'std',
+                 'minimum', 'maximum', 'quantiles', 'mode', 'mode_frequency',
+                 'n_unique', 'value_counts', 'approximate', 'quantile_sketch', 'distinct_sketch')
+
+    def __init__(self, name: str, dtype, kind: str, count: int, null_count: int):
+        """
+        Inicializa el perfil con los conteos básicos
+
+        Args:
+            name: Nombre de la columna
+            dtype: Tipo de dato de la columna
+            kind: 'numeric' o 'categorical'
+            count: Número de valores no nulos
+            null_count: Número de valores nulos
+        """
+        self.name = name
+        self.dtype = dtype
+        self.kind = kind
+        self.count = count
+        self.null_count = null_count
+        self.mean = np.nan
+        self.std = np.nan
+        self.minimum = np.nan
+        self.maximum = np.nan
+        self.quantiles = {q: np.nan for q in PROFILE_QUANTILES}
+        self.mode = None
+        self.mode_frequency = 0
+        self.n_unique = 0
+        self.value_counts = None
+        self.approximate = False
+        self.quantile_sketch = None
+        self.distinct_sketch = None
+
+    def to_describe(self) -> List[float]:
+        """
+        Valores de la columna en el formato de describe()
+        """
+        return [float(self.count), self.mean, self.std, self.minimum,
+                self.quantiles[0.25], self.quantiles[0.5], self.quantiles[0.75], self.maximum]
+
+
+class DatasetProfile:
+    """
+    Perfil de todas las columnas de un dataset
+    """
+
+    def __init__(self, n_rows: int, columns: Dict[str, ColumnProfile]):
+        """
+        Args:
+            n_rows: Número de filas del dataset
+            columns: Perfiles por nombre de columna (en el orden del dataset)
+        """
+        self.n_rows = n_rows
+        self.columns = columns
+
+    def __getitem__(self, column: str) -> ColumnProfile:
+        return self.columns[column]
+
+    def __contains__(self, column: str) -> bool:
+        return column in self.columns
+
+    @property
+    def null_counts(self) -> Dict[str, int]:
+        """
+        Conteo de nulos por columna
+        """
+        return {name: profile.null_count for name, profile in self.columns.items()}
+
+    def describe(self, variables: List[str]) -> pd.DataFrame:
+        """
+        Estadísticas descriptivas con el mismo formato que DataFrame.describe()
+
+        Args:
+            variables: Columnas numéricas a incluir
+
+        Returns:
+            DataFrame con count, mean, std, min, cuartiles y max por columna
+        """
+        data = {column: self.columns[column].to_describe() for column in variables
+                if self.columns[column].kind == 'numeric'}
+        return pd.DataFrame(data, index=DESCRIBE_INDEX, dtype=np.float64)
+
+    @classmethod
+    def from_aggregates(cls, aggregates) -> 'DatasetProfile':
+        """
+        Construye el perfil a partir de agregados parciales (modo streaming)
+
+        Los cuantiles y los valores distintos de columnas numéricas se estiman
+        con los sketches acumulados; la moda numérica queda como None.
+
+        Args:
+            aggregates: PartialAggregates acumulados
+
+        Returns:
+            Perfil del dataset
+        """
+        columns = {}
+        for name in aggregates.columns:
+            null_count = aggregates.null_counts.get(name, 0)
+            count = aggregates.n_rows - null_count
+            if name in aggregates.numeric_cols:
+                profile = ColumnProfile(name, aggregates.dtypes[name], 'numeric', count, null_count)
+                profile.mean = aggregates.get_mean(name)
+                profile.std = aggregates.get_std(name)
+                profile.minimum = float(aggregates.minimum.get(name, np.nan))
+                profile.maximum = float(aggregates.maximum.get(name, np.nan))
+                if name in aggregates.quantile_sketches:
+                    _set_sketches(profile, aggregates.quantile_sketches[name],
+                                  aggregates.distinct_sketches[name])
+            else:
+                profile = ColumnProfile(name, aggregates.dtypes[name], 'categorical', count, null_count)
+                if name in aggregates.value_counts:
+                    _set_counts(profile, aggregates.get_value_counts(name))
+            columns[name] = profile
+        return cls(aggregates.n_rows, columns)
+
+    def merge(self, other: 'DatasetProfile', df: pd.DataFrame) -> 'DatasetProfile':
+        """
+        Perfil de la unión de dos conjuntos de filas, sin modificar los originales
+
+        Conteos, nulos, momentos, extremos, conteos de valores y sketches se
+        combinan directamente; los cuartiles exactos se leen de los conteos
+        combinados. Solo una columna numérica exacta sin conteos (demasiados
+        valores distintos) se vuelve a perfilar desde df.
+
+        Args:
+            other: Perfil de las filas nuevas (mismas columnas)
+            df: DataFrame con todas las filas, ya concatenado
+
+        Returns:
+            Perfil combinado
+        """
+        columns = {}
+        for name, current in self.columns.items():
+            columns[name] = merge_column_profiles(current, other[name], df[name])
+        return DatasetProfile(self.n_rows + other.n_rows, columns)
+
+
+def profile_frame(df: pd.DataFrame, numeric_cols: List[str], categorical_cols: List[str],
+                  approximate: bool = False, quantile_error: float = DEFAULT_QUANTILE_ERROR,
+                  distinct_error: float = DEFAULT_DISTINCT_ERROR, n_jobs: int = 1,
+                  n_workers: int = 1) -> DatasetProfile:
+    """
+    Perfila todas las columnas de un DataFrame recorriendo cada una una sola vez
+
+    Args:
+        df: DataFrame a perfilar
+        numeric_cols: Columnas numéricas
+        categorical_cols: Columnas categóricas
+        approximate: Si True, usa sketches para cuartiles y valores distintos
+        quantile_error: Error de rango de los cuartiles aproximados
+        distinct_error: Error relativo de los valores distintos aproximados
+        n_jobs: Hilos que perfilan columnas en paralelo (1 = secuencial)
+        n_workers: Procesos que cuentan las categorías por rangos de filas
+
+    Returns:
+        Perfil del dataset
+    """
+    numeric = set(numeric_cols)
+    categorical = set(categorical_cols)
+
+    def profile_column(name: str) -> ColumnProfile:
+        if name in numeric and approximate:
+            return profile_numeric_approximate(df[name], quantile_error, distinct_error)
+        if name in numeric:
+            return profile_numeric(df[name])
+        if name in categorical:
+            return profile_categorical(df[name], n_workers)
+        null_count = int(df[name].isnull().sum())
+        return ColumnProfile(name, df[name].dtype, 'other', len(df) - null_count, null_count)
+
+    profiles = map_columns(profile_column, df.columns, n_jobs)
+    return DatasetProfile(len(df), dict(zip(df.columns, profiles)))
+
+
+def map_columns(function: Callable, columns: Iterable[str], n_jobs: int = 1) -> List:
+    """
+    Aplica una función a cada columna, repartiendo las columnas entre hilos
+
+    Se usan hilos y no procesos: los hilos leen los buffers del DataFrame
+    sin copiarlos, y los ordenamientos, conteos y reducciones de numpy y
+    pandas liberan el GIL, así que las columnas se procesan en paralelo.
+
+    Args:
+        function: Función que recibe el nombre de una columna
+        columns: Columnas a procesar
+        n_jobs: Número de hilos (1 = secuencial)
+
+    Returns:
+        Resultados en el orden de las columnas
+    """
+    columns = list(columns)
+    n_workers = min(max(int(n_jobs), 1), len(columns))
+    if n_workers <= 1:
+        return [function(column) for column in columns]
+    with ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix='profile') as pool:
+        return list(pool.map(function, columns))
+
+
+def profile_numeric(series: pd.Series) -> ColumnProfile:
+    """
+    Perfila una columna numérica a partir de un único ordenamiento
+
+    Del arreglo ordenado se obtienen mínimo, máximo, cuantiles, valores
+    distintos, conteos y moda sin volver a recorrer la columna.
+
+    Args:
+        series: Columna numérica
+
+    Returns:
+        Perfil de la columna
+    """
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = values[~np.isnan(values)]
+    count = len(valid)
+    profile = ColumnProfile(series.name, series.dtype, 'numeric', count, len(values) - count)
+    if count == 0:
+        return profile
+
+    profile.mean = valid.mean()
+    profile.std = np.sqrt(((valid - profile.mean) ** 2).sum() / (count - 1)) if count > 1 else np.nan
+
+    ordered = np.sort(valid)
+    profile.minimum = ordered[0]
+    profile.maximum = ordered[-1]
+    profile.quantiles = sorted_quantiles(ordered, PROFILE_QUANTILES)
+
+    # Valores distintos y sus frecuencias a partir de las corridas del arreglo ordenado
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(ordered)) + 1))
+    frequencies = np.diff(np.append(starts, count))
+    uniques = ordered[starts]
+    profile.n_unique = len(uniques)
+    # argmax devuelve la primera frecuencia máxima: el menor valor, como mode()[0]
+    top = int(np.argmax(frequencies))
+    profile.mode = uniques[top]
+    profile.mode_frequency = int(frequencies[top])
+    if profile.n_unique <= MAX_NUMERIC_VALUE_COUNTS:
+        profile.value_counts = _counts_series(series.name, uniques, frequencies)
+    return profile
+
+
+def profile_numeric_approximate(series: pd.Series, quantile_error: float = DEFAULT_QUANTILE_ERROR,
+                                distinct_error: float = DEFAULT_DISTINCT_ERROR) -> ColumnProfile:
+    """
+    Perfila una columna numérica sin ordenarla
+
+    Momentos, mínimo y máximo son exactos; los cuartiles se estiman con un
+    sketch KLL y los valores distintos con HyperLogLog. Si la columna tiene
+    pocos valores distintos, los conteos (y la moda) se calculan exactos
+    con una tabla hash.
+
+    Args:
+        series: Columna numérica
+        quantile_error: Error de rango de los cuartiles
+        distinct_error: Error relativo de los valores distintos
+
+    Returns:
+        Perfil de la columna
+    """
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = values[~np.isnan(values)]
+    count = len(valid)
+    profile = ColumnProfile(series.name, series.dtype, 'numeric', count, len(values) - count)
+    if count == 0:
+        return profile
+
+    profile.mean = valid.mean()
+    profile.std = np.sqrt(((valid - profile.mean) ** 2).sum() / (count - 1)) if count > 1 else np.nan
+    profile.minimum = valid.min()
+    profile.maximum = valid.max()
+
+    quantile_sketch = KLLSketch(quantile_error, seed=0)
+    quantile_sketch.update(valid)
+    distinct_sketch = HyperLogLog(distinct_error)
+    distinct_sketch.update(valid)
+    _set_sketches(profile, quantile_sketch, distinct_sketch)
+
+    if profile.n_unique <= MAX_NUMERIC_VALUE_COUNTS:
+        counts = pd.Series(valid).value_counts(sort=False)
+        uniques = counts.index.to_numpy()
+        order = np.argsort(uniques)
+        _set_counts(profile, _counts_series(series.name, uniques[order], counts.to_numpy()[order]))
+    return profile
+
+
+def profile_categorical(series: pd.Series, n_workers: int = 1) -> ColumnProfile:
+    """
+    Perfila una columna categórica factorizándola una sola vez
+
+    Args:
+        series: Columna categórica (object, string o category)
+        n_workers: Procesos que cuentan los códigos por rangos de filas
+
+    Returns:
+        Perfil de la columna
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = np.asarray(series.array.codes)
+        uniques = series.cat.categories
+    else:
+        codes, uniques = pd.factorize(series, sort=True)
+    partials = map_row_partitions(functools.partial(code_counts, n_labels=len(uniques)), [codes], n_workers)
+    frequencies = functools.reduce(np.add, partials)
+    count = int(frequencies.sum())
+    profile = ColumnProfile(series.name, series.dtype, 'categorical', count, len(codes) - count)
+    _set_counts(profile, _counts_series(series.name, uniques, frequencies))
+    return profile
+
+
+def code_counts(codes: np.ndarray, n_labels: int) -> np.ndarray:
+    """
+    Frecuencia de cada código de categoría (los nulos, -1, no se cuentan)
+
+    Args:
+        codes: Códigos de la columna
+        n_labels: Número de categorías
+
+    Returns:
+        Conteo por código
+    """
+    return np.bincount(codes[codes >= 0], minlength=n_labels)
+
+
+def merge_column_profiles(current: ColumnProfile, other: ColumnProfile, series: pd.Series) -> ColumnProfile:
+    """
+    Combina el perfil de una columna con el de filas nuevas
+
+    Args:
+        current: Perfil de las filas existentes
+        other: Perfil de las filas nuevas
+        series: Columna completa (filas existentes y nuevas)
+
+    Returns:
+        Perfil combinado (objeto nuevo)
+    """
+    count = current.count + other.count
+    profile = ColumnProfile(current.name, series.dtype, current.kind, count,
+                            current.null_count + other.null_count)
+    if current.kind == 'categorical':
+        labels = series.cat.categories if isinstance(series.dtype, pd.CategoricalDtype) \
+            else current.value_counts.index.union(other.value_counts.index)
+        _set_counts(profile, _counts_series(current.name, labels, _add_counts(current, other, labels)))
+        return profile
+    if current.kind != 'numeric' or count == 0:
+        return profile
+    if other.count == 0 or current.count == 0:
+        source = current if current.count else other
+        merged = copy.copy(source)
+        merged.dtype = series.dtype
+        merged.null_count = profile.null_count
+        return merged
+
+    # Media y desviación combinadas (Chan et al.)
+    m2_a = current.std ** 2 * (current.count - 1) if current.count > 1 else 0.0
+    m2_b = other.std ** 2 * (other.count - 1) if other.count > 1 else 0.0
+    delta = other.mean - current.mean
+    profile.mean = current.mean + delta * other.count / count
+    m2 = m2_a + m2_b + delta ** 2 * current.count * other.count / count
+    profile.std = np.sqrt(m2 / (count - 1))
+    profile.minimum = min(current.minimum, other.minimum)
+    profile.maximum = max(current.maximum, other.maximum)
+
+    if current.approximate or other.approximate:
+        if current.quantile_sketch is None or other.quantile_sketch is None:
+            return profile_numeric_approximate(series)
+        quantile_sketch = copy.deepcopy(current.quantile_sketch)
+        quantile_sketch.merge(other.quantile_sketch)
+        distinct_sketch = copy.deepcopy(current.distinct_sketch)
+        distinct_sketch.merge(other.distinct_sketch)
+        _set_sketches(profile, quantile_sketch, distinct_sketch)
+        if current.value_counts is not None and other.value_counts is not None:
+            labels = current.value_counts.index.union(other.value_counts.index)
+            if len(labels) <= MAX_NUMERIC_VALUE_COUNTS:
+                _set_counts(profile, _counts_series(current.name, labels, _add_counts(current, other, labels)))
+        return profile
+
+    if current.value_counts is None or other.value_counts is None:
+        return profile_numeric(series)
+    labels = current.value_counts.index.union(other.value_counts.index)
+    if len(labels) > MAX_NUMERIC_VALUE_COUNTS:
+        return profile_numeric(series)
+    frequencies = _add_counts(current, other, labels)
+    profile.quantiles = counted_quantiles(labels.to_numpy(dtype=np.float64), frequencies, PROFILE_QUANTILES)
+    _set_counts(profile, _counts_series(current.name, labels, frequencies))
+    return profile
+
+
+def counted_quantiles(values: np.ndarray, frequencies: np.ndarray, quantiles) -> Dict[float, float]:
+    """
+    Cuantiles exactos (interpolación lineal) a partir de valores ordenados y sus frecuencias
+
+    Equivale a sorted_quantiles sobre el arreglo expandido, en O(valores distintos).
+
+    Args:
+        values: Valores distintos ordenados
+        frequencies: Frecuencia de cada valor
+        quantiles: Cuantiles a calcular (entre 0 y 1)
+
+    Returns:
+        Diccionario cuantil -> valor
+    """
+    cumulative = np.cumsum(frequencies)
+    n = int(cumulative[-1])
+    result = {}
+    for q in quantiles:
+        position = q * (n - 1)
+        lower = int(np.floor(position))
+        upper = min(lower + 1, n - 1)
+        # Valor en la posición k del arreglo expandido: primer acumulado mayor que k
+        low_value = values[np.searchsorted(cumulative, lower, side='right')]
+        high_value = values[np.searchsorted(cumulative, upper, side='right')]
+        result[q] = low_value + (high_value - low_value) * (position - lower)
+    return result
+
+
+def sorted_quantiles(ordered: np.ndarray, quantiles) -> Dict[float, float]:
+    """
+    Cuantiles con interpolación lineal sobre un arreglo ya ordenado
+
+    Args:
+        ordered: Valores ordenados sin nulos
+        quantiles: Cuantiles a calcular (entre 0 y 1)
+
+    Returns:
+        Diccionario cuantil -> valor
+    """
+    n = len(ordered)
+    result = {}
+    for q in quantiles:
+        position = q * (n - 1)
+        lower = int(np.floor(position))
+        upper = min(lower + 1, n - 1)
+        fraction = position - lower
+        result[q] = ordered[lower] + (ordered[upper] - ordered[lower]) * fraction
+    return result
+
+
+def _counts_series(name: str, uniques, frequencies: np.ndarray) -> pd.Series:
+    """
+    Serie de conteos ordenada de mayor a menor (como value_counts())
+    """
+    order = np.argsort(-frequencies, kind='stable')
+    counts = pd.Series(frequencies[order], index=pd.Index(np.asarray(uniques)[order], name=name),
+                       name='count', dtype=np.int64)
+    return counts
+
+
+def _set_counts(profile: ColumnProfile, counts: pd.Series):
+    """
+    Completa moda, frecuencia de la moda y valores distintos desde los conteos
+    """
+    profile.value_counts = counts
+    observed = counts[counts > 0]
+    profile.n_unique = len(observed)
+    if len(observed) > 0:
+        # Entre empates, el menor valor (mismo criterio que mode()[0])
+        top = observed[observed == observed.iloc[0]]
+        profile.mode = top.index.min()
+        profile.mode_frequency = int(observed.iloc[0])
+
+
+def _set_sketches(profile: ColumnProfile, quantile_sketch: KLLSketch, distinct_sketch: HyperLogLog):
+    """
+    Completa cuartiles y valores distintos aproximados desde los sketches
+    """
+    profile.quantile_sketch = quantile_sketch
+    profile.distinct_sketch = distinct_sketch
+    profile.quantiles = quantile_sketch.quantiles(PROFILE_QUANTILES)
+    profile.n_unique = distinct_sketch.estimate()
+    profile.approximate = True
+
+
+def _add_counts(current: ColumnProfile, other: ColumnProfile, labels: pd.Index) -> np.ndarray:
+    """
+    Suma los conteos de valores de dos perfiles alineados a las etiquetas dadas
+    """
+    return (current.value_counts.reindex(labels, fill_value=0).to_numpy(dtype=np.int64) +
+            other.value_counts.reindex(labels, fill_value=0).to_numpy(dtype=np.int64))
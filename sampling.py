@@ -0,0 +1,97 @@
+"""
+Muestreo estratificado de filas para graficar datasets grandes
+Proyecto: Bank Marketing EDA
+"""
+
+import numpy as np
+import pandas as pd
+from typing import List
+from grouping import factorize_groups
+
+# Filas mínimas por estrato: los grupos pequeños siguen apareciendo en los gráficos
+MIN_ROWS_PER_STRATUM = 50
+
+
+class RowSample:
+    """
+    Muestra de filas con el peso (inverso de la fracción muestreada) de cada una
+    """
+
+    __slots__ = ('positions', 'weights', 'population', 'strata', 'seed')
+
+    def __init__(self, positions: np.ndarray, weights: np.ndarray, population: int,
+                 strata: List[str], seed: int):
+        """
+        Args:
+            positions: Posiciones de las filas muestreadas (ordenadas)
+            weights: Filas de la población que representa cada fila muestreada
+            population: Filas del dataset completo
+            strata: Columnas que definen los estratos
+            seed: Semilla con la que se tomó la muestra
+        """
+        self.positions = positions
+        self.weights = weights
+        self.population = population
+        self.strata = strata
+        self.seed = seed
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.positions.nbytes + self.weights.nbytes)
+
+
+def stratified_sample(df: pd.DataFrame, strata: List[str], max_rows: int, seed: int,
+                      min_rows: int = MIN_ROWS_PER_STRATUM) -> RowSample:
+    """
+    Toma una muestra estratificada reproducible de las filas de un DataFrame
+
+    Cada combinación de valores de las columnas de strata (los nulos forman
+    su propio estrato) recibe una cuota proporcional a su tamaño, con al
+    menos min_rows filas (o todas, si tiene menos). Como los estratos
+    pequeños quedan sobrerrepresentados, cada fila lleva como peso el
+    tamaño de su estrato dividido por su cuota; las frecuencias ponderadas
+    estiman las del dataset completo.
+
+    Args:
+        df: DataFrame completo
+        strata: Columnas categóricas que definen los estratos
+        max_rows: Tamaño objetivo de la muestra
+        seed: Semilla del generador aleatorio
+        min_rows: Filas mínimas por estrato
+
+    Returns:
+        Muestra con posiciones y pesos
+    """
+    n_rows = len(df)
+    combined = np.zeros(n_rows, dtype=np.int64)
+    n_strata = 1
+    for column in strata:
+        codes, labels = factorize_groups(df[column])
+        combined *= len(labels) + 1
+        combined += codes + 1
+        n_strata *= len(labels) + 1
+    # Estratos en el entero más pequeño posible: el argsort estable es un radix sort
+    combined = combined.astype(np.min_scalar_type(n_strata))
+    counts = np.bincount(combined, minlength=n_strata)
+
+    quotas = np.floor(counts * (max_rows / max(n_rows, 1))).astype(np.int64)
+    quotas = np.minimum(np.maximum(quotas, min_rows), counts)
+
+    rng = np.random.default_rng(seed)
+    order = np.argsort(combined, kind='stable')
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    positions = []
+    weights = []
+    for stratum in np.flatnonzero(quotas):
+        chosen = rng.choice(counts[stratum], size=quotas[stratum], replace=False)
+        positions.append(order[starts[stratum] + chosen])
+        weights.append(np.full(quotas[stratum], counts[stratum] / quotas[stratum]))
+    positions = np.concatenate(positions) if positions else np.zeros(0, dtype=np.int64)
+    weights = np.concatenate(weights) if weights else np.zeros(0)
+    # Posiciones en el orden del DataFrame: la lectura de las columnas es secuencial
+    ordering = np.argsort(positions, kind='stable')
+    return RowSample(positions[ordering], weights[ordering], n_rows, list(strata), seed)
@@ -0,0 +1,229 @@
+"""
+Sketches combinables para cuantiles y valores distintos aproximados
+Proyecto: Bank Marketing EDA
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable
+
+# Relación empírica entre k y el error de rango del sketch KLL (error ≈ 2.5 / k,
+# con margen para las combinaciones de muchos bloques)
+KLL_ERROR_CONSTANT = 2.5
+
+# Factor de reducción de capacidad entre niveles del KLL
+KLL_CAPACITY_DECAY = 2 / 3
+
+# Errores por defecto: rango de los cuantiles y error relativo de valores distintos
+DEFAULT_QUANTILE_ERROR = 0.01
+DEFAULT_DISTINCT_ERROR = 0.02
+
+
+class KLLSketch:
+    """
+    Sketch de cuantiles estilo KLL con muestreo en el nivel inferior
+
+    Los elementos se guardan en niveles con peso 2^nivel. Cuando un nivel
+    excede su capacidad se ordena y se promueve la mitad de sus elementos
+    (posiciones pares o impares al azar) al nivel siguiente. Los lotes
+    grandes se muestrean tomando un elemento al azar por bloque de 2^j
+    elementos, por lo que actualizar cuesta O(n) y no O(n log n).
+    """
+
+    def __init__(self, error: float = DEFAULT_QUANTILE_ERROR, seed: int = None):
+        """
+        Args:
+            error: Error de rango objetivo (0.01 = ±1% de las posiciones)
+            seed: Semilla para la selección aleatoria (reproducibilidad)
+        """
+        self.error = error
+        self.k = max(8, int(np.ceil(KLL_ERROR_CONSTANT / error)))
+        # Tamaño mínimo de la muestra inferior para que el muestreo no domine el error
+        self.sample_size = int(np.ceil(1.0 / error ** 2))
+        self.levels = [np.empty(0)]
+        self.n = 0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: Iterable[float]):
+        """
+        Agrega un lote de valores (los nulos se ignoran)
+
+        Args:
+            values: Valores numéricos
+        """
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        n = len(values)
+        if n == 0:
+            return
+        self.n += n
+        self.minimum = min(self.minimum, values.min())
+        self.maximum = max(self.maximum, values.max())
+
+        level = 0
+        while (n >> (level + 1)) >= self.sample_size:
+            level += 1
+        if level > 0:
+            # Muestreo estratificado: un elemento al azar por bloque de 2^level
+            width = 1 << level
+            n_blocks = n // width
+            picks = np.arange(n_blocks) * width + self._rng.integers(0, width, n_blocks)
+            self._add(level, values[picks])
+            values = values[n_blocks * width:]
+        self._add(0, values)
+        self._compress()
+
+    def merge(self, other: 'KLLSketch'):
+        """
+        Combina otro sketch (por ejemplo, de otro bloque) con el actual
+
+        Args:
+            other: Sketch a combinar
+        """
+        for level, items in enumerate(other.levels):
+            self._add(level, items)
+        self.n += other.n
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self._compress()
+
+    def quantiles(self, quantiles: Iterable[float]) -> Dict[float, float]:
+        """
+        Estima cuantiles
+
+        Args:
+            quantiles: Cuantiles a estimar (entre 0 y 1)
+
+        Returns:
+            Diccionario cuantil -> valor estimado (NaN si el sketch está vacío)
+        """
+        quantiles = list(quantiles)
+        if self.n == 0:
+            return {q: np.nan for q in quantiles}
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level_items), 1 << level, dtype=np.int64)
+                                  for level, level_items in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        items = items[order]
+        cumulative = np.cumsum(weights[order])
+        total = cumulative[-1]
+        result = {}
+        for q in quantiles:
+            if q <= 0:
+                result[q] = self.minimum
+            elif q >= 1:
+                result[q] = self.maximum
+            else:
+                index = int(np.searchsorted(cumulative, q * total, side='left'))
+                result[q] = items[min(index, len(items) - 1)]
+        return result
+
+    def _add(self, level: int, items: np.ndarray):
+        """
+        Agrega elementos a un nivel, creándolo si no existe
+        """
+        while len(self.levels) <= level:
+            self.levels.append(np.empty(0))
+        if len(items):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+
+    def _capacity(self, level: int) -> int:
+        """
+        Capacidad de un nivel: decrece geométricamente hacia los niveles bajos
+        """
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * KLL_CAPACITY_DECAY ** depth)))
+
+    def _compress(self):
+        """
+        Compacta los niveles que exceden su capacidad
+        """
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                items = np.sort(items)
+                n_pairs = len(items) // 2 * 2
+                offset = int(self._rng.integers(0, 2))
+                self._add(level + 1, items[offset:n_pairs:2])
+                # Con un número impar de elementos, el último se queda en el nivel
+                self.levels[level] = items[n_pairs:]
+            level += 1
+
+
+class HyperLogLog:
+    """
+    Estimador HyperLogLog de valores distintos (combinable)
+    """
+
+    def __init__(self, error: float = DEFAULT_DISTINCT_ERROR):
+        """
+        Args:
+            error: Error relativo estándar objetivo (1.04 / sqrt(registros))
+        """
+        self.error = error
+        self.p = int(np.clip(np.ceil(np.log2((1.04 / error) ** 2)), 4, 18))
+        self.m = 1 << self.p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def update(self, values):
+        """
+        Agrega un lote de valores (los nulos se ignoran)
+
+        Args:
+            values: Serie o arreglo de valores (numéricos o texto)
+        """
+        series = values if isinstance(values, pd.Series) else pd.Series(values)
+        series = series.dropna()
+        if len(series) == 0:
+            return
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Se hashean las categorías una vez y se indexan con los códigos
+            category_hashes = pd.util.hash_array(np.asarray(series.cat.categories, dtype=object))
+            hashes = category_hashes[series.cat.codes.to_numpy()]
+        elif pd.api.types.is_numeric_dtype(series):
+            # float64 para que 3 y 3.0 cuenten como el mismo valor en todos los bloques
+            hashes = pd.util.hash_array(series.to_numpy(dtype=np.float64))
+        else:
+            hashes = pd.util.hash_array(series.to_numpy(dtype=object))
+        self._add_hashes(hashes)
+
+    def _add_hashes(self, hashes: np.ndarray):
+        """
+        Actualiza los registros con hashes de 64 bits
+        """
+        shift = np.uint64(64 - self.p)
+        index = (hashes >> shift).astype(np.int64)
+        remainder = hashes & np.uint64((1 << (64 - self.p)) - 1)
+        # Posición del primer bit en 1 (ceros iniciales + 1) dentro de los bits restantes
+        _, exponent = np.frexp(remainder.astype(np.float64))
+        rank = np.where(remainder == 0, 64 - self.p + 1, (64 - self.p) - exponent + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: 'HyperLogLog'):
+        """
+        Combina otro estimador con la misma precisión
+
+        Args:
+            other: Estimador a combinar
+        """
+        if other.p != self.p:
+            raise ValueError("Solo se pueden combinar HyperLogLog con la misma precisión")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> int:
+        """
+        Estima el número de valores distintos
+
+        Returns:
+            Cardinalidad estimada
+        """
+        alpha = 0.7213 / (1 + 1.079 / self.m)
+        estimate = alpha * self.m ** 2 / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * self.m and zeros > 0:
+            # Corrección para cardinalidades pequeñas (conteo lineal)
+            estimate = self.m * np.log(self.m / zeros)
+        return int(round(estimate))